@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark: cold-start cost of the reverb package.
+
+Runs each scenario in a fresh interpreter with ``python -X importtime`` and
+reports the median cumulative import time of the package, the wall time of
+the whole snippet, and the heaviest modules it pulled in. Scenarios cover
+the bare package import, a client with LiteConfig, and a client with the
+pydantic-based ReverbConfig.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 7] [--top 8] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any
+
+# Settings for the config scenarios; nothing connects
+_ENV = {
+    "REVERB_APP_KEY": "bench-key",
+    "REVERB_APP_SECRET": "bench-secret",
+    "REVERB_HOST": "localhost",
+}
+
+SCENARIOS: dict[str, str] = {
+    "import reverb": "import reverb",
+    "client + LiteConfig": (
+        "from reverb import LiteConfig, ReverbClient\n"
+        "ReverbClient(config=LiteConfig.from_env(env_file=None))"
+    ),
+    "client + ReverbConfig": (
+        "from reverb import ReverbClient, ReverbConfig\n"
+        "ReverbClient(config=ReverbConfig())"
+    ),
+}
+
+_TIMER = (
+    "import time as _t\n_start = _t.perf_counter()\n{code}\n"
+    "print('WALL', _t.perf_counter() - _start)\n"
+)
+
+
+def run_once(code: str) -> tuple[float, dict[str, int]]:
+    """
+    Run a snippet in a new interpreter.
+
+    Returns:
+        Wall time of the snippet in seconds, and cumulative import time in
+        microseconds per module imported while it ran
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _TIMER.format(code=code)],
+        capture_output=True,
+        text=True,
+        env={**os.environ, **_ENV},
+        check=True,
+    )
+    modules: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    wall = next(
+        float(line.split()[1]) for line in result.stdout.splitlines() if line.startswith("WALL")
+    )
+    return wall, modules
+
+
+def measure(code: str, repeat: int, top: int) -> dict[str, Any]:
+    """Median timings of a scenario over ``repeat`` runs."""
+    walls: list[float] = []
+    runs: list[dict[str, int]] = []
+    for _ in range(repeat):
+        wall, modules = run_once(code)
+        walls.append(wall)
+        runs.append(modules)
+
+    names = set().union(*runs)
+    median = {
+        name: statistics.median(run.get(name, 0) for run in runs) for name in names
+    }
+    # Top-level packages only: their cumulative time includes their submodules
+    packages = {name: us for name, us in median.items() if "." not in name}
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "wall_ms": statistics.median(walls) * 1000,
+        "reverb_ms": median.get("reverb", 0) / 1000,
+        "modules": len(names),
+        "pydantic": "pydantic" in names,
+        "heaviest": [(name, us / 1000) for name, us in heaviest],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=7, help="runs per scenario")
+    parser.add_argument("--top", type=int, default=8, help="heaviest packages to list")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = {name: measure(code, args.repeat, args.top) for name, code in SCENARIOS.items()}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(f"{name}")
+        print(f"  wall time:          {result['wall_ms']:8.1f} ms")
+        print(f"  reverb (cumulative):{result['reverb_ms']:8.1f} ms")
+        print(f"  modules imported:   {result['modules']:8d}")
+        print(f"  pydantic loaded:    {'yes' if result['pydantic'] else 'no':>8}")
+        for package, ms in result["heaviest"]:
+            print(f"    {package:<24}{ms:8.1f} ms")
+        print()
+
+
+if __name__ == "__main__":
+    main()
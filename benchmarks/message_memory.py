@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: bytes retained per parsed Message.
+
+Compares the original eager ``@dataclass`` Message (reproduced below) with the
+current slotted, lazily-decoded Message that interns registered names. Each
+variant parses the same batch of frames and keeps every message alive, which
+is what happens when a burst queues up behind slow handlers.
+
+Usage:
+    python benchmarks/message_memory.py [--count 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from reverb.messages import Message, names
+
+
+@dataclass
+class LegacyMessage:
+    """Message as it was before slots, lazy decoding and interning."""
+
+    event: str
+    data: Any = field(default_factory=dict)
+    channel: str | None = None
+
+    @classmethod
+    def from_json(cls, raw: str) -> LegacyMessage:
+        parsed = json.loads(raw)
+        data = parsed.get("data", {})
+        if isinstance(data, str):
+            try:
+                data = json.loads(data)
+            except json.JSONDecodeError:
+                pass
+        return cls(event=parsed.get("event", ""), data=data, channel=parsed.get("channel"))
+
+
+def build_frames(count: int) -> list[str]:
+    """Build a realistic stream of device telemetry frames."""
+    return [
+        json.dumps({
+            "event": "vitals.update",
+            "channel": f"device.rpi-{i % 64:03d}",
+            "data": json.dumps({"cpu": 12.5, "memory": 48.1, "temp": 51.2, "seq": i}),
+        })
+        for i in range(count)
+    ]
+
+
+def measure(parse: Callable[[str], object], frames: list[str]) -> float:
+    """Return bytes retained per message after parsing all frames."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    retained = [parse(frame) for frame in frames]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    per_message = (after - before) / len(retained)
+    del retained
+    return per_message
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=50_000, help="frames to parse")
+    args = parser.parse_args()
+
+    frames = build_frames(args.count)
+
+    # Live registries: the subscribed channels and the bound event
+    names.intern("vitals.update")
+    for i in range(64):
+        names.intern(f"device.rpi-{i:03d}")
+
+    def parse_and_decode(frame: str) -> Message:
+        message = Message.from_json(frame)
+        message.data  # noqa: B018 - force the lazy decode
+        return message
+
+    legacy = measure(LegacyMessage.from_json, frames)
+    current = measure(Message.from_json, frames)
+    decoded = measure(parse_and_decode, frames)
+
+    print(f"frames parsed:           {args.count}")
+    print(f"legacy dataclass:        {legacy:8.1f} bytes/message")
+    print(f"slotted + lazy + intern: {current:8.1f} bytes/message")
+    print(f"  ... with data decoded: {decoded:8.1f} bytes/message")
+    print(f"reduction (undecoded):   {100 * (1 - current / legacy):8.1f} %")
+    print(f"reduction (decoded):     {100 * (1 - decoded / legacy):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -40,7 +40,7 @@ except ImportError:
 
 from dotenv import load_dotenv
 
-from reverb import ReverbClient
+from reverb import LiteConfig, ReverbClient
 
 # Load .env file
 load_dotenv()
@@ -114,7 +114,8 @@ class DeviceListener:
 
     async def _run(self) -> None:
         """Main connection loop."""
-        async with ReverbClient() as client:
+        # LiteConfig skips loading pydantic, which shortens restarts on a Pi Zero
+        async with ReverbClient(config=LiteConfig.from_env()) as client:
             self.client = client
             logger.info("connected socket_id=%s", client.socket_id)
 
@@ -180,7 +181,8 @@ class DeviceListener:
         request_id = data.get("request_id", "unknown")
         logger.info("vitals.request received request_id=%s", request_id)
 
-        vitals = self._collect_vitals()
+        # Reads /proc and calls statvfs; keep that off the event loop
+        vitals = await asyncio.to_thread(self._collect_vitals)
 
         await self._api_post("/api/device/vitals", {
             "device_id": DEVICE_ID,
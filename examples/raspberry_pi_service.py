@@ -181,7 +181,7 @@ class Service:
             await ch.trigger("status", {
                 "device_id": DEVICE_ID,
                 "load": load,
-            })
+            }, coalesce=True)
 
     async def _reboot(self) -> None:
         logger.warning("reboot requested")
@@ -11,19 +11,80 @@ Example:
             await client.listen()
 """
 
-from reverb.channels import Channel, PresenceChannel, PrivateChannel, PublicChannel
-from reverb.client import ReverbClient
-from reverb.config import ReverbConfig
-from reverb.exceptions import (
-    AuthenticationError,
-    ConnectionError,
-    ProtocolError,
-    ReverbError,
-    SubscriptionError,
-    TimeoutError,
-)
-from reverb.messages import Events, Message
-from reverb.types import EventHandler, SimpleEventHandler
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from reverb.auth import AuthProvider
+    from reverb.channels import Channel, PresenceChannel, PrivateChannel, PublicChannel
+    from reverb.client import ReverbClient
+    from reverb.config import ReverbConfig
+    from reverb.connection import ConnectionState
+    from reverb.exceptions import (
+        AuthenticationError,
+        ConnectionError,
+        ProtocolError,
+        ReverbError,
+        SubscriptionError,
+        TimeoutError,
+    )
+    from reverb.http_auth import HttpAuthProvider
+    from reverb.lite_config import LiteConfig
+    from reverb.messages import Events, Message
+    from reverb.pool import PooledChannel, ReverbPool
+    from reverb.presence import MemberJoined, MemberLeft, MembersResynced, MemberStore
+    from reverb.supervisor import Supervisor
+    from reverb.tracing import TraceHooks
+    from reverb.types import EventHandler, SimpleEventHandler
+
+# Public names and the submodule each lives in. They are imported on first
+# access (PEP 562), so `import reverb` stays cheap and pydantic is only loaded
+# when ReverbConfig is actually used.
+_EXPORTS = {
+    "Channel": "reverb.channels",
+    "PublicChannel": "reverb.channels",
+    "PrivateChannel": "reverb.channels",
+    "PresenceChannel": "reverb.channels",
+    "ReverbClient": "reverb.client",
+    "ReverbConfig": "reverb.config",
+    "LiteConfig": "reverb.lite_config",
+    "ConnectionState": "reverb.connection",
+    "AuthProvider": "reverb.auth",
+    "HttpAuthProvider": "reverb.http_auth",
+    "ReverbError": "reverb.exceptions",
+    "ConnectionError": "reverb.exceptions",
+    "AuthenticationError": "reverb.exceptions",
+    "SubscriptionError": "reverb.exceptions",
+    "ProtocolError": "reverb.exceptions",
+    "TimeoutError": "reverb.exceptions",
+    "Events": "reverb.messages",
+    "Message": "reverb.messages",
+    "ReverbPool": "reverb.pool",
+    "PooledChannel": "reverb.pool",
+    "MemberStore": "reverb.presence",
+    "MemberJoined": "reverb.presence",
+    "MemberLeft": "reverb.presence",
+    "MembersResynced": "reverb.presence",
+    "Supervisor": "reverb.supervisor",
+    "TraceHooks": "reverb.tracing",
+    "EventHandler": "reverb.types",
+    "SimpleEventHandler": "reverb.types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'reverb' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache it, so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __version__ = "0.1.0"
 
@@ -31,11 +92,25 @@ __all__ = [
     # Main client
     "ReverbClient",
     "ReverbConfig",
+    "LiteConfig",
+    "ConnectionState",
+    "ReverbPool",
+    "PooledChannel",
+    "Supervisor",
+    "TraceHooks",
+    # Authorization
+    "AuthProvider",
+    "HttpAuthProvider",
     # Channels
     "Channel",
     "PublicChannel",
     "PrivateChannel",
     "PresenceChannel",
+    # Presence
+    "MemberStore",
+    "MemberJoined",
+    "MemberLeft",
+    "MembersResynced",
     # Messages
     "Message",
     "Events",
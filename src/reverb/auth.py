@@ -5,8 +5,16 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 
+from .exceptions import AuthenticationError
+
+# Signatures remembered per Authenticator by default
+DEFAULT_CACHE_SIZE = 4096
+
 
 class Authenticator:
     """
@@ -17,17 +25,50 @@ class Authenticator:
 
     For presence channels, user data is included:
         HMAC-SHA256(app_secret, f"{socket_id}:{channel_name}:{user_data_json}")
+
+    The secret is keyed into an HMAC object once; each signature clones it
+    instead of re-encoding the secret and re-deriving the key pads. Signatures
+    are kept in an LRU cache keyed on (socket_id, channel, channel_data), so
+    signing the same subscription twice on one socket is a dict lookup.
     """
 
-    def __init__(self, app_key: str, app_secret: str) -> None:
+    def __init__(self, app_key: str, app_secret: str, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """
+        Initialize the authenticator.
+
+        Args:
+            app_key: Application key, prefixed to every signature
+            app_secret: Application secret used as the HMAC key
+            cache_size: Signatures to remember (0 disables the cache)
+        """
         self.app_key = app_key
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str, str | None], str] = OrderedDict()
         self.app_secret = app_secret
 
+    @property
+    def app_secret(self) -> str:
+        """Application secret; setting it re-keys the HMAC and clears the cache."""
+        return self._app_secret
+
+    @app_secret.setter
+    def app_secret(self, value: str) -> None:
+        self._app_secret = value
+        self._mac = hmac.new(value.encode("utf-8"), digestmod=hashlib.sha256)
+        self._cache.clear()
+
+    @staticmethod
+    def encode_user_data(user_data: dict[str, Any]) -> str:
+        """Presence user data as the compact JSON sent in ``channel_data``."""
+        return json.dumps(user_data, separators=(",", ":"))
+
     def authenticate(
         self,
         socket_id: str,
         channel_name: str,
         user_data: dict[str, Any] | None = None,
+        *,
+        channel_data: str | None = None,
     ) -> dict[str, str]:
         """
         Generate authentication payload for channel subscription.
@@ -36,22 +77,65 @@ class Authenticator:
             socket_id: The socket ID from connection established event
             channel_name: The channel to authenticate for
             user_data: User data for presence channels (must include 'user_id')
+            channel_data: ``user_data`` already serialized with
+                encode_user_data(), to skip encoding it again
 
         Returns:
             Dict with 'auth' key, and 'channel_data' for presence channels
         """
-        if user_data is not None:
+        if channel_data is None and user_data is not None:
+            channel_data = self.encode_user_data(user_data)
+        auth = self._cached_sign(socket_id, channel_name, channel_data)
+        if channel_data is not None:
             # Presence channel
-            channel_data = json.dumps(user_data, separators=(",", ":"))
-            string_to_sign = f"{socket_id}:{channel_name}:{channel_data}"
-            return {
-                "auth": self._sign(string_to_sign),
-                "channel_data": channel_data,
-            }
+            return {"auth": auth, "channel_data": channel_data}
+        # Private channel
+        return {"auth": auth}
+
+    def authenticate_many(
+        self,
+        socket_id: str,
+        channel_names: Iterable[str],
+        user_data: dict[str, Any] | None = None,
+        *,
+        channel_data: str | None = None,
+    ) -> dict[str, dict[str, str]]:
+        """
+        Authentication payloads for several channels on one socket.
+
+        ``user_data`` is serialized once for all of them; use it (or
+        ``channel_data``) only when every channel is a presence channel.
+
+        Returns:
+            Payloads as returned by authenticate(), keyed by channel name
+        """
+        if channel_data is None and user_data is not None:
+            channel_data = self.encode_user_data(user_data)
+        sign = self._cached_sign
+        if channel_data is None:
+            return {name: {"auth": sign(socket_id, name, None)} for name in channel_names}
+        return {
+            name: {"auth": sign(socket_id, name, channel_data), "channel_data": channel_data}
+            for name in channel_names
+        }
+
+    def _cached_sign(self, socket_id: str, channel_name: str, channel_data: str | None) -> str:
+        key = (socket_id, channel_name, channel_data)
+        cache = self._cache
+        auth = cache.get(key)
+        if auth is not None:
+            cache.move_to_end(key)
+            return auth
+
+        if channel_data is None:
+            auth = self._sign(f"{socket_id}:{channel_name}")
         else:
-            # Private channel
-            string_to_sign = f"{socket_id}:{channel_name}"
-            return {"auth": self._sign(string_to_sign)}
+            auth = self._sign(f"{socket_id}:{channel_name}:{channel_data}")
+        if self.cache_size > 0:
+            cache[key] = auth
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return auth
 
     def _sign(self, message: str) -> str:
         """
@@ -60,9 +144,99 @@ class Authenticator:
         Returns:
             String in format "app_key:hex_digest"
         """
-        signature = hmac.new(
-            self.app_secret.encode("utf-8"),
-            message.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        return f"{self.app_key}:{signature}"
+        mac = self._mac.copy()
+        mac.update(message.encode("utf-8"))
+        return f"{self.app_key}:{mac.hexdigest()}"
+
+
+class AuthProvider(ABC):
+    """
+    Authorizes private and presence channel subscriptions.
+
+    The client asks its provider for the ``auth`` (and, for presence
+    channels, ``channel_data``) of each subscribe frame. The default signs
+    locally with the app secret (LocalAuthProvider); HttpAuthProvider asks
+    the application's ``/broadcasting/auth`` endpoint instead, so devices
+    never hold the secret.
+    """
+
+    @abstractmethod
+    async def authorize(
+        self, socket_id: str, channel_name: str, channel_data: str | None = None
+    ) -> dict[str, str]:
+        """
+        Authorize one subscription.
+
+        Args:
+            socket_id: The socket ID from connection established event
+            channel_name: The channel to authorize
+            channel_data: Presence user data encoded with
+                Authenticator.encode_user_data() (providers that get it from
+                the server ignore it)
+
+        Returns:
+            Dict with 'auth' key, and 'channel_data' for presence channels
+
+        Raises:
+            AuthenticationError: If the subscription is not authorized
+        """
+
+    async def authorize_many(
+        self, socket_id: str, channel_names: Iterable[str], channel_data: str | None = None
+    ) -> dict[str, dict[str, str]]:
+        """
+        Authorize several subscriptions on one socket.
+
+        Best effort: channels that could not be authorized are left out of
+        the result, and the caller authorizes them one at a time (which
+        raises the error). The default calls authorize() for each channel.
+
+        Returns:
+            Payloads as returned by authorize(), keyed by channel name
+        """
+        auths: dict[str, dict[str, str]] = {}
+        for name in channel_names:
+            try:
+                auths[name] = await self.authorize(socket_id, name, channel_data)
+            except AuthenticationError:
+                continue
+        return auths
+
+    async def close(self) -> None:
+        """
+        Release connections or other resources (the client calls this on disconnect).
+
+        Optional hook, so it is not abstract: it does nothing by default, for
+        providers such as LocalAuthProvider that hold no resources.
+        """
+
+
+class LocalAuthProvider(AuthProvider):
+    """Signs subscriptions in-process with the app secret (the default)."""
+
+    def __init__(self, authenticator: Authenticator) -> None:
+        self.authenticator = authenticator
+
+    async def authorize(
+        self, socket_id: str, channel_name: str, channel_data: str | None = None
+    ) -> dict[str, str]:
+        """Sign one subscription (see AuthProvider.authorize)."""
+        self._check_secret()
+        return self.authenticator.authenticate(socket_id, channel_name, channel_data=channel_data)
+
+    async def authorize_many(
+        self, socket_id: str, channel_names: Iterable[str], channel_data: str | None = None
+    ) -> dict[str, dict[str, str]]:
+        """Sign several subscriptions in one pass (see Authenticator.authenticate_many)."""
+        if not self.authenticator.app_secret:
+            # authorize() raises the error for each channel
+            return {}
+        return self.authenticator.authenticate_many(
+            socket_id, channel_names, channel_data=channel_data
+        )
+
+    def _check_secret(self) -> None:
+        if not self.authenticator.app_secret:
+            raise AuthenticationError(
+                "Cannot sign private channels without app_secret; set it or auth_endpoint"
+            )
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import json
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING, Any
 
-from .auth import Authenticator
-from .messages import Events, Message, Messages
-from .types import EventHandler
+from .auth import Authenticator, LocalAuthProvider
+from .executors import ExecutorOption, needs_wrapping, run_handlers, wrap_handler
+from .messages import Events, Message, Messages, names
+from .presence import MemberChange, MemberStore, UserInfo
+from .routing import EventRouter
+from .types import EventHandler, SyncEventHandler
 
 if TYPE_CHECKING:
     from .client import ReverbClient
@@ -20,10 +25,10 @@ class Channel(ABC):
     """Base class for all channel types."""
 
     def __init__(self, name: str, client: ReverbClient) -> None:
-        self._name = name
+        self._name = names.intern(name)
         self._client = client
         self._subscribed = False
-        self._handlers: dict[str, list[EventHandler]] = {}
+        self._router = EventRouter()
 
     @property
     def name(self) -> str:
@@ -35,18 +40,45 @@ class Channel(ABC):
         """Whether currently subscribed."""
         return self._subscribed
 
-    def bind(self, event: str, handler: EventHandler) -> Channel:
+    @property
+    def _handlers(self) -> dict[str, list[EventHandler]]:
+        """Bound handlers by event name or pattern."""
+        return self._router.bindings
+
+    def bind(
+        self,
+        event: str,
+        handler: EventHandler | SyncEventHandler,
+        *,
+        executor: ExecutorOption | None = None,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        concurrent: bool = False,
+    ) -> Channel:
         """
         Bind an event handler. Returns self for chaining.
 
         Args:
-            event: Event name to listen for
-            handler: Async function(event, data, channel) to call
+            event: Event name, or a pattern such as ``vitals.*`` (``*`` matches
+                one segment, a trailing ``**`` one or more; ``*`` alone
+                matches every event)
+            handler: Function(event, data, channel) to call. Sync functions run
+                in ``executor`` so they do not block the event loop.
+            executor: "thread" (default for sync handlers), "process" or an
+                Executor instance
+            concurrency: Maximum concurrent calls of this handler
+            timeout: Seconds a call may take before it is abandoned (logged
+                and counted in ``handler_timeouts_total``)
+            concurrent: Run alongside the event's other handlers instead of
+                after them, so a slow handler does not delay the rest
         """
-        if event not in self._handlers:
-            self._handlers[event] = []
-        self._handlers[event].append(handler)
-        logger.debug(f"Bound handler for '{event}' on channel '{self._name}'")
+        event = names.intern(event)
+        if needs_wrapping(handler, executor, concurrency, timeout, concurrent):
+            handler = wrap_handler(
+                handler, self._client._executors, executor, concurrency, timeout, concurrent
+            )
+        self._router.bind(event, handler)
+        logger.debug("Bound handler for '%s' on channel '%s'", event, self._name)
         return self
 
     def unbind(self, event: str, handler: EventHandler | None = None) -> Channel:
@@ -54,27 +86,54 @@ class Channel(ABC):
         Remove event handler(s). Returns self for chaining.
 
         Args:
-            event: Event name
+            event: Event name or pattern, as bound
             handler: Specific handler to remove, or None to remove all
         """
-        if event in self._handlers:
-            if handler is None:
-                del self._handlers[event]
-            else:
-                self._handlers[event] = [h for h in self._handlers[event] if h != handler]
+        names.release(event, self._router.unbind(event, handler))
         return self
 
+    def _release_names(self) -> None:
+        """Release the interned names of this channel and its bound events."""
+        for event, handlers in self._router.bindings.items():
+            names.release(event, len(handlers))
+        names.release(self._name)
+
+    def latest_only(self, events: bool | str | Iterable[str] = True) -> Channel:
+        """
+        Deliver only the latest value of events while their handlers are busy.
+
+        While a message of an event is queued or being handled, newer ones
+        on this channel do not queue up behind it: each replaces the one
+        before, and the handlers then get the newest. Handlers therefore run
+        only as often as they keep up, and never on a stale backlog. For
+        events that carry the full state (telemetry, positions, status), not
+        for events where every message matters. Returns self for chaining.
+
+        Args:
+            events: Event names to coalesce (exact names, not patterns), True
+                for every event of the channel, or False to deliver every
+                message again
+        """
+        latest = self._client._connection.latest
+        if events is False:
+            latest.disable(self._name)
+        elif events is True:
+            latest.enable(self._name)
+        else:
+            latest.enable(self._name, (events,) if isinstance(events, str) else events)
+        return self
+
+    def _has_handlers(self, event: str) -> bool:
+        """Whether an event needs dispatching to this channel (decides on the name alone)."""
+        return bool(self._router.match(event))
+
     async def _handle_event(self, event: str, data: Any) -> None:
         """Dispatch event to registered handlers."""
-        handlers = self._handlers.get(event, []) + self._handlers.get("*", [])
-
-        for handler in handlers:
-            try:
-                await handler(event, data, self._name)
-            except Exception as e:
-                logger.error(f"Handler error for '{event}' on '{self._name}': {e}")
+        await run_handlers(
+            self._router.match(event), event, data, self._name, self._client._handler_stats
+        )
 
-    async def trigger(self, event: str, data: Any) -> None:
+    async def trigger(self, event: str, data: Any, *, coalesce: bool = False) -> None:
         """
         Trigger a client event on this channel.
 
@@ -84,8 +143,13 @@ class Channel(ABC):
         Args:
             event: Event name (will be prefixed with 'client-' if needed)
             data: Event data to send
+            coalesce: If True, replace a still-unsent value of this event
+                instead of queueing another one (for state snapshots where
+                only the latest value matters)
         """
-        if not self._subscribed:
+        # While reconnecting the channel is still registered but not re-subscribed
+        # yet; the connection buffers the event until the subscription is restored.
+        if not self._subscribed and self._client._channels.get(self._name) is not self:
             raise RuntimeError(f"Cannot trigger event on unsubscribed channel '{self._name}'")
 
         # Ensure client- prefix
@@ -93,12 +157,21 @@ class Channel(ABC):
             event = f"client-{event}"
 
         message = Message(event=event, data=data, channel=self._name)
-        await self._client._connection.send(message)
-        logger.debug(f"Triggered '{event}' on channel '{self._name}'")
+        await self._client._connection.send(
+            message, coalesce=(self._name, event) if coalesce else None
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Triggered '%s' on channel '%s'", event, self._name)
 
     @abstractmethod
-    async def _subscribe(self) -> None:
-        """Internal subscription logic."""
+    async def _subscribe(self, auth: dict[str, str] | None = None) -> None:
+        """
+        Internal subscription logic.
+
+        Args:
+            auth: Authentication payload signed in advance (bulk subscribes);
+                computed here when omitted
+        """
         pass
 
     async def _unsubscribe(self) -> None:
@@ -118,7 +191,7 @@ class PublicChannel(Channel):
     Channel names do not have a prefix.
     """
 
-    async def _subscribe(self) -> None:
+    async def _subscribe(self, auth: dict[str, str] | None = None) -> None:
         """Subscribe without authentication."""
         message = Messages.subscribe(self._name)
         await self._client._connection.send(message)
@@ -136,14 +209,14 @@ class PrivateChannel(Channel):
         super().__init__(name, client)
         self._authenticator: Authenticator | None = None
 
-    async def _subscribe(self) -> None:
+    async def _subscribe(self, auth: dict[str, str] | None = None) -> None:
         """Subscribe with HMAC signature authentication."""
         socket_id = self._client._connection.socket_id
         if not socket_id:
             raise RuntimeError("Cannot subscribe: not connected")
 
         # Get authenticator from client
-        auth_data = self._client._authenticator.authenticate(socket_id, self._name)
+        auth_data = auth or await self._client.auth.authorize(socket_id, self._name)
 
         message = Messages.subscribe(self._name, auth=auth_data["auth"])
         await self._client._connection.send(message)
@@ -151,6 +224,11 @@ class PrivateChannel(Channel):
         logger.info(f"Subscribed to private channel: {self._name}")
 
 
+_PRESENCE_EVENTS = frozenset(
+    {Events.SUBSCRIPTION_SUCCEEDED, Events.MEMBER_ADDED, Events.MEMBER_REMOVED}
+)
+
+
 class PresenceChannel(PrivateChannel):
     """
     Presence channel - authenticated with member tracking.
@@ -160,69 +238,109 @@ class PresenceChannel(PrivateChannel):
     - Track channel members
     - Receive member join/leave events
     - Access member list
+    - Receive typed member changes (``Events.MEMBERS_CHANGED``), including
+      the difference after a re-subscription
+
+    Without ``user_data`` (auth endpoint mode) the endpoint's reply supplies
+    the ``channel_data``, and ``me`` is read from it once subscribed.
     """
 
-    def __init__(self, name: str, client: ReverbClient, user_data: dict[str, Any]) -> None:
+    def __init__(
+        self, name: str, client: ReverbClient, user_data: dict[str, Any] | None = None
+    ) -> None:
         super().__init__(name, client)
         self._user_data = user_data
-        self._members: dict[str, dict[str, Any]] = {}
+        # Serialized once; re-subscribing after a reconnect reuses it
+        self._channel_data = (
+            Authenticator.encode_user_data(user_data) if user_data is not None else None
+        )
+        self._members = MemberStore()
+
+    @property
+    def members(self) -> Mapping[str, UserInfo]:
+        """Current channel members keyed by user_id (a live read-only view, not a copy)."""
+        return self._members.view
 
     @property
-    def members(self) -> dict[str, dict[str, Any]]:
-        """Current channel members keyed by user_id."""
-        return self._members.copy()
+    def member_store(self) -> MemberStore:
+        """The member store, with its generation counter."""
+        return self._members
 
     @property
     def me(self) -> dict[str, Any]:
-        """Current user's presence data."""
-        return self._user_data
+        """Current user's presence data (empty until subscribed when the endpoint supplies it)."""
+        return self._user_data if self._user_data is not None else {}
 
-    async def _subscribe(self) -> None:
+    async def _subscribe(self, auth: dict[str, str] | None = None) -> None:
         """Subscribe with user data for presence."""
         socket_id = self._client._connection.socket_id
         if not socket_id:
             raise RuntimeError("Cannot subscribe: not connected")
 
         # Authenticate with user data
-        auth_data = self._client._authenticator.authenticate(
-            socket_id, self._name, user_data=self._user_data
+        auth_data = auth or await self._client.auth.authorize(
+            socket_id, self._name, self._channel_data
         )
 
-        message = Messages.subscribe(
-            self._name,
-            auth=auth_data["auth"],
-            channel_data=auth_data.get("channel_data"),
-        )
+        channel_data = auth_data.get("channel_data")
+        message = Messages.subscribe(self._name, auth=auth_data["auth"], channel_data=channel_data)
         await self._client._connection.send(message)
         self._subscribed = True
+        if self._channel_data is None and channel_data:
+            # The endpoint chose the user data; keep it for me
+            self._user_data = json.loads(channel_data)
         logger.info(f"Subscribed to presence channel: {self._name}")
 
+    def _has_handlers(self, event: str) -> bool:
+        """Presence events are always consumed for member tracking."""
+        return event in _PRESENCE_EVENTS or super()._has_handlers(event)
+
     async def _handle_event(self, event: str, data: Any) -> None:
         """Handle presence-specific events and dispatch to handlers."""
         # Handle member tracking
+        change: MemberChange | None = None
         if event == Events.SUBSCRIPTION_SUCCEEDED:
-            # Initialize member list from subscription response
+            # Initialize member list from subscription response, or diff it
+            # against the list from before a reconnect
             if isinstance(data, dict) and "presence" in data:
                 presence = data["presence"]
-                members = presence.get("hash", {})
-                self._members = members
-                logger.debug(f"Presence channel initialized with {len(members)} members")
+                resynced = self._members.resync(presence.get("hash") or {})
+                if resynced or resynced.initial:
+                    change = resynced
+                logger.debug(
+                    "Presence channel synced: %d members (+%d -%d ~%d)",
+                    len(self._members),
+                    len(resynced.joined),
+                    len(resynced.left),
+                    len(resynced.updated),
+                )
 
         elif event == Events.MEMBER_ADDED:
             user_id = data.get("user_id")
-            user_info = data.get("user_info", {})
             if user_id:
-                self._members[user_id] = user_info
-                logger.debug(f"Member added: {user_id}")
+                change = self._members.add(user_id, data.get("user_info"))
+                logger.debug("Member added: %s", user_id)
 
         elif event == Events.MEMBER_REMOVED:
             user_id = data.get("user_id")
-            if user_id and user_id in self._members:
-                del self._members[user_id]
-                logger.debug(f"Member removed: {user_id}")
+            if user_id:
+                change = self._members.remove(user_id)
+                logger.debug("Member removed: %s", user_id)
 
         # Call parent handler
         await super()._handle_event(event, data)
+        if change is not None:
+            # Only handlers bound to exactly this event: pattern and "*"
+            # handlers expect decoded JSON, not a MemberChange
+            handlers = self._router.bindings.get(Events.MEMBERS_CHANGED)
+            if handlers:
+                await run_handlers(
+                    tuple(handlers),
+                    Events.MEMBERS_CHANGED,
+                    change,
+                    self._name,
+                    self._client._handler_stats,
+                )
 
 
 def create_channel(name: str, client: ReverbClient, user_data: dict[str, Any] | None = None) -> Channel:
@@ -232,14 +350,18 @@ def create_channel(name: str, client: ReverbClient, user_data: dict[str, Any] |
     Args:
         name: Channel name
         client: ReverbClient instance
-        user_data: User data for presence channels
+        user_data: User data for presence channels (optional when the
+            client's auth provider is not local: the endpoint supplies it)
 
     Returns:
         Appropriate Channel subclass instance
+
+    Raises:
+        ValueError: For a presence channel without user_data under local signing
     """
     if name.startswith("presence-"):
-        if user_data is None:
-            raise ValueError("Presence channels require user_data")
+        if user_data is None and isinstance(client.auth, LocalAuthProvider):
+            raise ValueError("Presence channels require user_data when signed locally")
         return PresenceChannel(name, client, user_data)
     elif name.startswith("private-"):
         return PrivateChannel(name, client)
@@ -4,14 +4,29 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Iterable
 from typing import Any
 
-from .auth import Authenticator
+from .auth import Authenticator, AuthProvider, LocalAuthProvider
 from .channels import Channel, create_channel
-from .config import ReverbConfig
-from .connection import Connection
-from .messages import Events, Message
-from .types import EventHandler
+from .connection import Connection, ConnectionState
+from .exceptions import ConnectionError, SubscriptionError, TimeoutError
+from .executors import (
+    ExecutorOption,
+    HandlerExecutors,
+    HandlerStats,
+    needs_wrapping,
+    run_handlers,
+    wrap_handler,
+)
+from .exporter import MetricsExporter
+from .lite_config import ClientConfig
+from .messages import Events, Message, names
+from .metrics import Histogram, MetricsRegistry
+from .routing import ChannelRouter, EventRouter
+from .tracing import TraceHooks
+from .types import EventHandler, SyncEventHandler
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +49,10 @@ class ReverbClient:
         host: str | None = None,
         port: int | None = None,
         *,
-        config: ReverbConfig | None = None,
+        config: ClientConfig | None = None,
         scheme: str | None = None,
+        auth: AuthProvider | None = None,
+        trace: TraceHooks | None = None,
     ) -> None:
         """
         Initialize the Reverb client.
@@ -45,8 +62,12 @@ class ReverbClient:
             app_secret: Reverb application secret (or use REVERB_APP_SECRET env var)
             host: Server hostname (or use REVERB_HOST env var)
             port: WebSocket port (default: 443)
-            config: Optional ReverbConfig instance (overrides individual params)
+            config: ReverbConfig or LiteConfig (overrides individual params)
             scheme: WebSocket scheme ('ws' or 'wss', default: 'wss')
+            auth: Authorizes private/presence subscriptions (default: an
+                HttpAuthProvider for ``auth_endpoint`` if set, otherwise local
+                signing with ``app_secret``)
+            trace: Optional tracing callbacks for frames and dispatch
         """
         # Build config from params or use provided config
         if config is not None:
@@ -65,16 +86,24 @@ class ReverbClient:
             if scheme is not None:
                 config_kwargs["scheme"] = scheme
 
+            # Imported here so clients given a LiteConfig never load pydantic
+            from .config import ReverbConfig
+
             self._config = ReverbConfig(**config_kwargs)
 
-        # Set up logging
-        logging.basicConfig(level=getattr(logging, self._config.log_level.upper()))
+        # Only the library's own logger: handlers and the root logger are the
+        # application's business
+        logging.getLogger("reverb").setLevel(self._config.log_level.upper())
 
         # Initialize authenticator
         self._authenticator = Authenticator(
             self._config.app_key,
             self._config.app_secret.get_secret_value(),
         )
+        self._auth = auth if auth is not None else self._default_auth()
+
+        # Runtime metrics shared with the connection
+        self._metrics = MetricsRegistry()
 
         # Initialize connection
         self._connection = Connection(
@@ -83,14 +112,37 @@ class ReverbClient:
             on_connect=self._handle_connect,
             on_disconnect=self._handle_disconnect,
             on_error=self._handle_error,
+            metrics=self._metrics,
+            on_subscription=self._handle_subscription,
+            trace=trace,
+        )
+        self._resubscribe_seconds = self._metrics.histogram(
+            "resubscribe_seconds", "Time to restore all channel subscriptions after a reconnect"
         )
 
         # Channel management
         self._channels: dict[str, Channel] = {}
-        self._pending_subscriptions: dict[str, asyncio.Event] = {}
+        # Futures resolved by subscription_succeeded / subscription_error
+        self._pending_subscriptions: dict[str, asyncio.Future[None]] = {}
+
+        # Pools for sync handlers, created on first use
+        self._executors = HandlerExecutors(
+            self._config.handler_threads, self._config.handler_processes
+        )
+
+        # Handler latency, errors and timeouts
+        self._handler_stats = HandlerStats(self._metrics)
+        # Prometheus endpoint, if metrics_port is set
+        self._exporter: MetricsExporter | None = None
+        if self._config.metrics_port is not None:
+            self._exporter = MetricsExporter(
+                self._metrics, self._config.metrics_host, self._config.metrics_port
+            )
 
         # Global event handlers
-        self._global_handlers: dict[str, list[EventHandler]] = {}
+        self._global_router = EventRouter()
+        # Handlers bound to channel-name patterns (bind(..., channel="device.*"))
+        self._channel_router = ChannelRouter()
 
         # State
         self._connected = False
@@ -106,6 +158,57 @@ class ReverbClient:
         """Whether currently connected to the server."""
         return self._connection.is_connected
 
+    @property
+    def state(self) -> ConnectionState:
+        """Current connection lifecycle state."""
+        return self._connection.state
+
+    @property
+    def _global_handlers(self) -> dict[str, list[EventHandler]]:
+        """Global handlers by event name or pattern."""
+        return self._global_router.bindings
+
+    def _default_auth(self) -> AuthProvider:
+        endpoint = self._config.auth_endpoint
+        if not endpoint:
+            return LocalAuthProvider(self._authenticator)
+        # Imported here: http.client is only needed in endpoint mode
+        from .http_auth import HttpAuthProvider
+
+        token = self._config.auth_token
+        headers = {"Authorization": f"Bearer {token.get_secret_value()}"} if token else None
+        return HttpAuthProvider(
+            endpoint, headers=headers, batch_endpoint=self._config.auth_batch_endpoint
+        )
+
+    @property
+    def auth(self) -> AuthProvider:
+        """Authorizes private and presence subscriptions."""
+        return self._auth
+
+    @property
+    def trace(self) -> TraceHooks | None:
+        """Tracing callbacks (on_frame_in, on_frame_out, on_dispatch), if any."""
+        return self._connection.trace
+
+    @trace.setter
+    def trace(self, hooks: TraceHooks | None) -> None:
+        self._connection.trace = hooks
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Runtime metrics (e.g. ``client.metrics.snapshot()``)."""
+        return self._metrics
+
+    def handler_latency(self) -> dict[str, dict[str, float]]:
+        """Call duration statistics per handler, slowest (by p99) first."""
+        return self._handler_stats.by_handler()
+
+    @property
+    def rtt(self) -> Histogram:
+        """Ping round-trip times in seconds over the most recent pings."""
+        return self._connection.rtt
+
     @property
     def channels(self) -> dict[str, Channel]:
         """Dict of subscribed channels by name."""
@@ -114,6 +217,8 @@ class ReverbClient:
     async def connect(self) -> None:
         """Establish WebSocket connection to the Reverb server."""
         logger.info("Connecting to Reverb server...")
+        if self._exporter is not None:
+            await self._exporter.start()
         await self._connection.connect()
 
     async def disconnect(self) -> None:
@@ -128,24 +233,48 @@ class ReverbClient:
                 pass
 
         await self._connection.disconnect()
+        self._executors.shutdown()
+        if self._exporter is not None:
+            await self._exporter.stop()
+        await self._auth.close()
+        for channel in self._channels.values():
+            channel._release_names()
         self._channels.clear()
+        for future in self._pending_subscriptions.values():
+            future.cancel()
+        self._pending_subscriptions.clear()
         self._connected = False
 
     async def subscribe(
         self,
         channel_name: str,
         user_data: dict[str, Any] | None = None,
+        *,
+        wait: bool = False,
+        timeout: float | None = None,
+        latest_only: bool | Iterable[str] = False,
     ) -> Channel:
         """
         Subscribe to a channel. Automatically detects channel type from name.
 
         Args:
             channel_name: Name of the channel to subscribe to
-            user_data: User data for presence channels (required for presence-*)
+            user_data: User data for presence channels (required for presence-*
+                when signing locally; an auth endpoint supplies it otherwise)
+            wait: Wait until the server confirms the subscription
+            timeout: Seconds to wait for the confirmation (defaults to
+                ``subscribe_timeout``); only used with ``wait=True``
+            latest_only: Deliver only the latest value of these events (True:
+                every event) while their handlers are busy; see
+                Channel.latest_only()
 
         Returns:
             The subscribed Channel instance
 
+        Raises:
+            SubscriptionError: If the server rejected the subscription (wait=True)
+            TimeoutError: If no confirmation arrived in time (wait=True)
+
         Channel types:
             - "channel-name" -> PublicChannel
             - "private-channel-name" -> PrivateChannel
@@ -153,23 +282,198 @@ class ReverbClient:
         """
         if channel_name in self._channels:
             logger.warning(f"Already subscribed to channel: {channel_name}")
-            return self._channels[channel_name]
+            channel = self._channels[channel_name]
+            if wait and not channel.is_subscribed:
+                self._expect_confirmation(channel_name)
+        else:
+            channel = await self._send_subscribe(
+                channel_name, user_data, latest_only=latest_only, wait=wait
+            )
+            logger.info(f"Subscribed to channel: {channel_name}")
 
+        if wait:
+            await self._await_subscriptions([channel_name], timeout)
+        return channel
+
+    async def subscribe_many(
+        self,
+        channel_names: Iterable[str],
+        user_data: dict[str, Any] | None = None,
+        *,
+        wait: bool = True,
+        timeout: float | None = None,
+        latest_only: bool | Iterable[str] = False,
+    ) -> list[Channel]:
+        """
+        Subscribe to several channels at once.
+
+        All subscribe frames are queued together (the connection flushes
+        them in batched socket writes) and the confirmations are awaited together, so the total
+        time is about one round trip rather than one per channel.
+
+        Args:
+            channel_names: Channels to subscribe to
+            user_data: User data for any presence channels among them
+            wait: Wait until the server confirms every subscription
+            timeout: Seconds to wait for all confirmations (defaults to
+                ``subscribe_timeout``)
+            latest_only: Latest-value delivery for the new channels, as in
+                subscribe()
+
+        Returns:
+            The Channel instances, in the order given
+
+        Raises:
+            SubscriptionError: If the server rejected any subscription (wait=True)
+            TimeoutError: If not all confirmations arrived in time (wait=True)
+        """
+        names_ = list(dict.fromkeys(channel_names))
+        new = [name for name in names_ if name not in self._channels]
+        auths = await self._authorize_many(new, user_data)
+        results = await asyncio.gather(
+            *(
+                self._send_subscribe(
+                    name, user_data, auths.get(name), latest_only=latest_only, wait=wait
+                )
+                for name in new
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        logger.info(f"Subscribed to {len(new)} channel(s)")
+
+        if wait:
+            await self._await_subscriptions(names_, timeout)
+        return [self._channels[name] for name in names_]
+
+    async def _authorize_many(
+        self, channel_names: list[str], user_data: dict[str, Any] | None
+    ) -> dict[str, dict[str, str]]:
+        """
+        Authorize the private and presence channels among several in two batches.
+
+        With an auth endpoint, which supplies the presence user data itself,
+        presence channels need no ``user_data`` and go in the same batch as
+        the private ones. Channels missing from the result (not connected, or refused) are
+        authorized one at a time by their own subscribe, which raises the error.
+        """
+        socket_id = self._connection.socket_id
+        if not socket_id:
+            return {}
+        private = [name for name in channel_names if name.startswith("private-")]
+        presence = [name for name in channel_names if name.startswith("presence-")]
+        if presence and not isinstance(self._auth, LocalAuthProvider):
+            # The endpoint supplies the presence user data: one batch for all
+            private += presence
+            presence = []
+        auths = await self._auth.authorize_many(socket_id, private) if private else {}
+        if presence and user_data is not None:
+            channel_data = Authenticator.encode_user_data(user_data)
+            auths.update(await self._auth.authorize_many(socket_id, presence, channel_data))
+        return auths
+
+    async def _send_subscribe(
+        self,
+        channel_name: str,
+        user_data: dict[str, Any] | None,
+        auth: dict[str, str] | None = None,
+        *,
+        latest_only: bool | Iterable[str] = False,
+        wait: bool = False,
+    ) -> Channel:
+        """Create a channel and send the subscribe frame (registering a waiter if ``wait``)."""
         # Create appropriate channel type
         channel = create_channel(channel_name, self, user_data)
+        if latest_only is not False:
+            # Before subscribing, so the first burst is coalesced too
+            channel.latest_only(latest_only)
 
-        # Set up subscription wait event
-        self._pending_subscriptions[channel_name] = asyncio.Event()
+        if wait:
+            self._expect_confirmation(channel_name)
 
         # Send subscription request
-        await channel._subscribe()
+        try:
+            await channel._subscribe(auth)
+        except BaseException:
+            self._pending_subscriptions.pop(channel_name, None)
+            self._connection.latest.disable(channel_name)
+            channel._release_names()
+            raise
 
         # Store channel
         self._channels[channel_name] = channel
-
-        logger.info(f"Subscribed to channel: {channel_name}")
         return channel
 
+    def _expect_confirmation(self, channel_name: str) -> None:
+        """
+        Register a future for the server's answer to a subscription.
+
+        Only callers that wait register one; _await_subscriptions() removes it
+        again, so nothing is left behind per subscription.
+        """
+        if channel_name not in self._pending_subscriptions:
+            self._pending_subscriptions[channel_name] = asyncio.get_running_loop().create_future()
+
+    async def _await_subscriptions(self, channel_names: list[str], timeout: float | None) -> None:
+        """
+        Wait for the confirmations of the given channels.
+
+        Rejected and unconfirmed channels are dropped from the client, so a
+        failed subscribe() leaves nothing behind.
+        """
+        if timeout is None:
+            timeout = self._config.subscribe_timeout
+        pending = {
+            name: future
+            for name in channel_names
+            if (future := self._pending_subscriptions.get(name)) is not None
+        }
+        if not pending:
+            return
+
+        # asyncio.wait leaves the futures alone on timeout, so a late
+        # confirmation is still recorded
+        try:
+            await asyncio.wait(pending.values(), timeout=timeout)
+        except asyncio.CancelledError:
+            for name in pending:
+                self._pending_subscriptions.pop(name, None)
+            raise
+
+        error: BaseException | None = None
+        for name, future in pending.items():
+            if future.cancelled():
+                error = error or ConnectionError("Disconnected while subscribing")
+            elif not future.done():
+                await self._abandon_subscription(name)
+                error = error or TimeoutError(
+                    f"No confirmation for channel '{name}' within {timeout}s"
+                )
+            elif future.exception() is not None:
+                await self._abandon_subscription(name)
+                error = error or future.exception()
+            else:
+                self._pending_subscriptions.pop(name, None)
+        if error is not None:
+            raise error
+
+    async def _abandon_subscription(self, channel_name: str) -> None:
+        """Forget a subscription that failed or was never confirmed."""
+        future = self._pending_subscriptions.pop(channel_name, None)
+        unanswered = False
+        if future is not None and not future.done():
+            future.cancel()
+            unanswered = True
+        channel = self._forget_channel(channel_name)
+        if channel is not None and unanswered:
+            # The server may still accept it later; tell it we are not interested
+            try:
+                await channel._unsubscribe()
+            except Exception as e:
+                logger.debug("Unsubscribe after failed subscription failed: %s", e)
+
     async def unsubscribe(self, channel_name: str) -> None:
         """
         Unsubscribe from a channel.
@@ -183,47 +487,99 @@ class ReverbClient:
 
         channel = self._channels[channel_name]
         await channel._unsubscribe()
-        del self._channels[channel_name]
+        self._forget_channel(channel_name)
+        self._pending_subscriptions.pop(channel_name, None)
+
+    def _forget_channel(self, channel_name: str) -> Channel | None:
+        """Drop a channel from the client and release its interned names."""
+        channel = self._channels.pop(channel_name, None)
+        self._connection.latest.disable(channel_name)
+        if channel is not None:
+            channel._release_names()
+        return channel
 
-    def bind(self, event: str, handler: EventHandler) -> None:
+    def bind(
+        self,
+        event: str,
+        handler: EventHandler | SyncEventHandler,
+        *,
+        channel: str | None = None,
+        executor: ExecutorOption | None = None,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        concurrent: bool = False,
+    ) -> None:
         """
         Bind a global event handler (receives events from all channels).
 
+        With ``channel``, the handler only receives events from channels whose
+        name matches it, e.g. ``channel="device.*"`` for every ``device.<id>``.
+        One binding covers any number of channels: they need no handlers of
+        their own, and nothing is stored per channel.
+
         Args:
-            event: Event name to listen for (or '*' for all events)
-            handler: Async function(event, data, channel) to call
+            event: Event name, or a pattern such as ``device.*.status`` (see
+                Channel.bind); ``*`` matches every event
+            handler: Function(event, data, channel) to call. Sync functions run
+                in ``executor`` so they do not block the event loop.
+            channel: Channel name or pattern to restrict the handler to
+            executor: "thread" (default for sync handlers), "process" or an
+                Executor instance
+            concurrency: Maximum concurrent calls of this handler
+            timeout: Seconds a call may take before it is abandoned (logged
+                and counted in ``handler_timeouts_total``)
+            concurrent: Run alongside the event's other handlers instead of
+                after them, so a slow handler does not delay the rest
+
+        Raises:
+            ValueError: If the event or channel pattern is malformed
         """
-        if event not in self._global_handlers:
-            self._global_handlers[event] = []
-        self._global_handlers[event].append(handler)
-        logger.debug(f"Bound global handler for '{event}'")
+        event = names.intern(event)
+        if needs_wrapping(handler, executor, concurrency, timeout, concurrent):
+            handler = wrap_handler(
+                handler, self._executors, executor, concurrency, timeout, concurrent
+            )
+        if channel is None:
+            self._global_router.bind(event, handler)
+            logger.debug("Bound global handler for '%s'", event)
+        else:
+            self._channel_router.bind(channel, event, handler)
+            logger.debug("Bound handler for '%s' on channels '%s'", event, channel)
 
-    def unbind(self, event: str, handler: EventHandler | None = None) -> None:
+    def unbind(
+        self,
+        event: str,
+        handler: EventHandler | None = None,
+        *,
+        channel: str | None = None,
+    ) -> None:
         """
         Remove global event handler(s).
 
         Args:
             event: Event name
             handler: Specific handler to remove, or None to remove all
+            channel: The channel pattern the handler was bound with, if any
         """
-        if event in self._global_handlers:
-            if handler is None:
-                del self._global_handlers[event]
-            else:
-                self._global_handlers[event] = [
-                    h for h in self._global_handlers[event] if h != handler
-                ]
+        if channel is None:
+            removed = self._global_router.unbind(event, handler)
+        else:
+            removed = self._channel_router.unbind(channel, event, handler)
+        names.release(event, removed)
 
     async def listen(self) -> None:
         """
         Start listening for messages. Blocks until disconnected.
 
-        This is the main loop for long-running services.
+        This is the main loop for long-running services. It returns as soon as
+        the connection leaves the CONNECTED state (connection lost or closed).
         """
         logger.info("Starting message listener...")
         try:
-            while self._connection.is_connected:
-                await asyncio.sleep(0.5)
+            if self._connection.is_connected:
+                await self._connection.wait_for_state(
+                    ConnectionState.RECONNECTING, ConnectionState.CLOSED
+                )
             # Connection lost - log it
             logger.warning("Listen loop exiting - connection lost")
         except asyncio.CancelledError:
@@ -231,38 +587,66 @@ class ReverbClient:
             raise
 
     async def _handle_message(self, message: Message) -> None:
-        """Handle incoming message from connection."""
+        """
+        Handle incoming message from connection.
+
+        Routing uses only the outer envelope (event and channel); ``message.data``
+        is decoded only when some handler will actually receive it.
+        """
         event = message.event
-        data = message.data
         channel_name = message.channel
 
-        logger.debug(f"Handling message: {event} on {channel_name}")
-
-        # Handle subscription confirmation
-        if event == Events.SUBSCRIPTION_SUCCEEDED:
-            if channel_name and channel_name in self._pending_subscriptions:
-                self._pending_subscriptions[channel_name].set()
-                del self._pending_subscriptions[channel_name]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Handling message: %s on %s", event, channel_name)
 
         # Route to channel handlers
-        if channel_name and channel_name in self._channels:
-            channel = self._channels[channel_name]
-            await channel._handle_event(event, data)
+        channel = self._channels.get(channel_name) if channel_name else None
+        if channel is not None and channel._has_handlers(event):
+            await channel._handle_event(event, message.data)
+
+        # Route to handlers bound by channel pattern
+        if channel_name is not None and self._channel_router:
+            handlers = self._channel_router.match(channel_name, event)
+            if handlers:
+                await self._dispatch(handlers, event, message.data, channel_name)
 
         # Route to global handlers
-        await self._dispatch_global(event, data, channel_name)
+        if self._global_router.match(event):
+            await self._dispatch_global(event, message.data, channel_name)
+
+    def _handle_subscription(self, message: Message) -> None:
+        """Resolve the subscribe() waiter for a subscription confirmation or error."""
+        channel_name = message.channel
+        if channel_name is None:
+            return
+        future = self._pending_subscriptions.get(channel_name)
+        if message.event == Events.SUBSCRIPTION_SUCCEEDED:
+            if future is not None and not future.done():
+                future.set_result(None)
+            return
+        data = message.data
+        detail = data.get("error") or data.get("message") if isinstance(data, dict) else data
+        logger.error(f"Subscription to '{channel_name}' rejected: {detail}")
+        if future is not None and not future.done():
+            future.set_exception(
+                SubscriptionError(f"Subscription to '{channel_name}' rejected: {detail}")
+            )
 
     async def _dispatch_global(
         self, event: str, data: Any, channel_name: str | None
     ) -> None:
         """Dispatch event to global handlers."""
-        handlers = self._global_handlers.get(event, []) + self._global_handlers.get("*", [])
+        await self._dispatch(self._global_router.match(event), event, data, channel_name)
 
-        for handler in handlers:
-            try:
-                await handler(event, data, channel_name)
-            except Exception as e:
-                logger.error(f"Global handler error for '{event}': {e}")
+    async def _dispatch(
+        self,
+        handlers: tuple[EventHandler, ...],
+        event: str,
+        data: Any,
+        channel_name: str | None,
+    ) -> None:
+        """Call handlers (see run_handlers); an error in one does not stop the others."""
+        await run_handlers(handlers, event, data, channel_name, self._handler_stats)
 
     async def _handle_connect(self, socket_id: str) -> None:
         """Handle connection established."""
@@ -270,10 +654,43 @@ class ReverbClient:
         logger.info(f"Connected with socket_id: {socket_id}")
 
         # Re-subscribe to channels after reconnection
-        for channel in self._channels.values():
-            if not channel.is_subscribed:
-                logger.info(f"Re-subscribing to channel: {channel.name}")
-                await channel._subscribe()
+        await self._resubscribe()
+
+    async def _resubscribe(self) -> None:
+        """
+        Restore channel subscriptions, ``resubscribe_concurrency`` at a time.
+
+        Subscribe frames from concurrent channels are picked up by the
+        connection's writer in batches, so thousands of channels cost a handful
+        of socket writes rather than one write each. Client events
+        buffered during the outage wait until this has finished.
+        """
+        channels = [channel for channel in self._channels.values() if not channel.is_subscribed]
+        if not channels:
+            return
+
+        started = time.perf_counter()
+        limit = asyncio.Semaphore(max(1, self._config.resubscribe_concurrency))
+        # Presence channels carry their own user data and are signed one by one
+        # (in endpoint mode they are batched with the rest)
+        auths = await self._authorize_many([channel.name for channel in channels], None)
+
+        async def resubscribe(channel: Channel) -> None:
+            async with limit:
+                logger.debug("Re-subscribing to channel: %s", channel.name)
+                await channel._subscribe(auths.get(channel.name))
+
+        results = await asyncio.gather(
+            *(resubscribe(channel) for channel in channels), return_exceptions=True
+        )
+        elapsed = time.perf_counter() - started
+        self._resubscribe_seconds.observe(elapsed)
+        logger.info(f"Re-subscribed {len(channels)} channel(s) in {elapsed:.3f}s")
+
+        # Fail the connection attempt as before, after the others had their chance
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def _handle_disconnect(self) -> None:
         """Handle disconnection."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+# pydantic evaluates the field annotations at runtime, so they keep
+# Optional[...] for Python 3.9
 from typing import Literal, Optional
 
 from pydantic import Field, SecretStr
@@ -28,9 +30,22 @@ class ReverbConfig(BaseSettings):
 
     # Required settings
     app_key: str = Field(..., description="Reverb application key")
-    app_secret: SecretStr = Field(..., description="Reverb application secret")
     host: str = Field(..., description="Reverb server hostname")
 
+    # Authorization of private/presence channels: local signing or an endpoint
+    app_secret: SecretStr = Field(
+        default=SecretStr(""), description="Reverb application secret (for local signing)"
+    )
+    auth_endpoint: Optional[str] = Field(  # noqa: UP045
+        default=None, description="Application auth URL, e.g. https://app/broadcasting/auth"
+    )
+    auth_batch_endpoint: Optional[str] = Field(  # noqa: UP045
+        default=None, description="Auth URL accepting several channels per request"
+    )
+    auth_token: Optional[SecretStr] = Field(  # noqa: UP045
+        default=None, description="Bearer token sent to the auth endpoint"
+    )
+
     # Optional settings with defaults
     port: int = Field(default=443, description="WebSocket port")
     scheme: Literal["ws", "wss"] = Field(default="wss", description="WebSocket scheme")
@@ -45,14 +60,64 @@ class ReverbConfig(BaseSettings):
     reconnect_delay_min: float = Field(default=1.0, description="Min reconnect delay (seconds)")
     reconnect_delay_max: float = Field(default=30.0, description="Max reconnect delay (seconds)")
     reconnect_delay_multiplier: float = Field(default=2.0, description="Backoff multiplier")
-    max_reconnect_attempts: Optional[int] = Field(
+    max_reconnect_attempts: Optional[int] = Field(  # noqa: UP045
         default=None, description="Max attempts (None=infinite)"
     )
 
+    subscribe_timeout: float = Field(
+        default=10.0, description="Seconds subscribe(wait=True) waits for confirmation"
+    )
+    resubscribe_concurrency: int = Field(
+        default=64, description="Channels re-subscribed concurrently after a reconnect"
+    )
+
     # Keepalive settings
     ping_interval: float = Field(default=30.0, description="Ping interval (seconds)")
     ping_timeout: float = Field(default=10.0, description="Ping timeout (seconds)")
 
+    # Inbound dispatch settings
+    dispatch_workers: int = Field(default=8, description="Concurrent message handler workers")
+    dispatch_queue_size: int = Field(
+        default=1000, description="Max inbound messages waiting for a worker"
+    )
+    dispatch_overflow: Literal["block", "drop_oldest", "drop_newest", "coalesce"] = Field(
+        default="block", description="What to do with inbound messages when the queue is full"
+    )
+    handler_threads: int = Field(
+        default=4, description="Thread pool size for sync handlers bound with executor='thread'"
+    )
+    handler_processes: Optional[int] = Field(  # noqa: UP045
+        default=None, description="Process pool size for executor='process' (None=CPU count)"
+    )
+    dispatch_mode: Literal["concurrent", "ordered"] = Field(
+        default="concurrent",
+        description="'ordered' handles each channel's messages serially, in arrival order",
+    )
+    channel_queue_size: int = Field(
+        default=100, description="Max pending messages per channel in 'ordered' mode"
+    )
+
+    # Outbound buffering while reconnecting
+    send_buffer_size: int = Field(
+        default=1000, description="Max client events buffered while reconnecting (0=off)"
+    )
+    send_buffer_ttl: float = Field(
+        default=30.0, description="Seconds a buffered client event stays deliverable"
+    )
+
+    # Serialization
+    json_codec: Literal["auto", "json", "orjson", "msgspec", "ujson"] = Field(
+        default="auto", description="JSON backend ('auto' picks the fastest installed)"
+    )
+
+    # Metrics
+    metrics_port: Optional[int] = Field(  # noqa: UP045
+        default=None, description="Serve Prometheus metrics on this port (None=off)"
+    )
+    metrics_host: str = Field(
+        default="127.0.0.1", description="Address the metrics endpoint listens on"
+    )
+
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
 
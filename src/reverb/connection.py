@@ -5,18 +5,63 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
-from typing import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from enum import Enum
 
 import websockets
 from websockets.asyncio.client import ClientConnection
 
-from .config import ReverbConfig
+from .dispatch import ChannelLanes, DispatchQueue, LatestValues
 from .exceptions import ConnectionError, ProtocolError
-from .messages import Events, Message, Messages
+from .lite_config import ClientConfig
+from .messages import Events, Message, Messages, get_codec
+from .metrics import MetricsRegistry
+from .outbox import Outbound, Outbox
+from .tracing import TraceHooks
 
 logger = logging.getLogger(__name__)
 
 
+class ConnectionState(str, Enum):
+    """
+    Lifecycle states of a Connection.
+
+    Transitions:
+        CLOSED       -> CONNECTING    connect() called
+        CONNECTING   -> CONNECTED     handshake done and on_connect callback returned
+        CONNECTED    -> RECONNECTING  connection lost while auto-reconnect is enabled
+        RECONNECTING -> CONNECTED     reconnected and on_connect callback returned
+        any          -> CLOSED        disconnect(), connection lost without reconnect,
+                                      or reconnection gave up
+    """
+
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    RECONNECTING = "reconnecting"
+    CLOSED = "closed"
+
+
+# Most frames written to the socket in one go
+_MAX_BATCH = 256
+
+# Ping round trips kept in the rolling RTT histogram
+_RTT_WINDOW = 100
+
+_SUBSCRIPTION_EVENTS = frozenset({Events.SUBSCRIPTION_SUCCEEDED, Events.SUBSCRIPTION_ERROR})
+
+
+def _call_hook(hook: Callable[..., None], *args: object) -> None:
+    """Call a tracing hook; a failing hook must not break the connection."""
+    try:
+        hook(*args)
+    except Exception:
+        logger.exception("Tracing hook failed")
+
+
+_StateWaiter = tuple[frozenset[ConnectionState], "asyncio.Future[ConnectionState]"]
+
+
 class Connection:
     """
     Low-level WebSocket connection manager.
@@ -24,40 +69,148 @@ class Connection:
     Handles:
     - Connection establishment with proper URL formatting
     - Automatic reconnection with exponential backoff
-    - Ping/pong keepalive mechanism
+    - Ping/pong keepalive with round-trip measurement and dead-peer detection
     - Message queuing during reconnection
+    - State transitions that callers can await (see ConnectionState)
+    - Bounded inbound dispatch queue drained by a fixed pool of workers
+
+    Outbound messages are encoded by the sender, so encoding errors reach the
+    caller, and go through an Outbox drained by a writer task, which takes
+    everything pending as one batch and writes it with one socket write and
+    one drain. Protocol frames (``pusher:*``) need a live
+    socket and raise ConnectionError otherwise. Client events are written only
+    while CONNECTED; sent while the connection is down or still
+    re-subscribing, they stay in the outbox (bounded, with a per-message TTL)
+    and go out in order once the on_connect callback has restored the channel
+    subscriptions.
     """
 
     def __init__(
         self,
-        config: ReverbConfig,
+        config: ClientConfig,
         on_message: Callable[[Message], Awaitable[None]],
         on_connect: Callable[[str], Awaitable[None]],  # receives socket_id
         on_disconnect: Callable[[], Awaitable[None]],
         on_error: Callable[[Exception], Awaitable[None]],
+        metrics: MetricsRegistry | None = None,
+        on_subscription: Callable[[Message], None] | None = None,
+        trace: TraceHooks | None = None,
     ) -> None:
         self.config = config
+        self.metrics = metrics if metrics is not None else MetricsRegistry()
+        self._codec = get_codec(config.json_codec)
         self._on_message = on_message
         self._on_connect = on_connect
         self._on_disconnect = on_disconnect
         self._on_error = on_error
+        self._on_subscription = on_subscription
+        # Tracing callbacks; may be replaced at any time
+        self.trace = trace
 
         self._ws: ClientConnection | None = None
         self._socket_id: str | None = None
         self._connected = False
         self._running = False
         self._reconnect_attempts = 0
+        self._state = ConnectionState.CLOSED
+        self._state_waiters: list[_StateWaiter] = []
 
         self._receive_task: asyncio.Task[None] | None = None
         self._keepalive_task: asyncio.Task[None] | None = None
-        self._pending_pong: asyncio.Event | None = None
-        self._message_tasks: set[asyncio.Task[None]] = set()  # Track background message handlers
+        self._pending_pong: asyncio.Future[None] | None = None
+        # Monotonic time of the last frame received; the link is idle after that
+        self._last_received = 0.0
+        self.rtt = self.metrics.histogram(
+            "ping_rtt_seconds", "Round trip of pusher:ping to pusher:pong", window=_RTT_WINDOW
+        )
+        self._ping_timeouts = self.metrics.counter(
+            "ping_timeouts_total", "Pings without a pong within ping_timeout"
+        )
+
+        # Hot-path instrumentation: a counter increment or a histogram bucket
+        # increment per frame, no formatting
+        self._frames_received = self.metrics.counter(
+            "frames_received_total", "WebSocket frames received"
+        )
+        self._bytes_received = self.metrics.counter(
+            "bytes_received_total", "Payload bytes received"
+        )
+        self._frames_sent = self.metrics.counter("frames_sent_total", "WebSocket frames sent")
+        self._bytes_sent = self.metrics.counter("bytes_sent_total", "Payload bytes sent")
+        self._decode_seconds = self.metrics.histogram(
+            "decode_seconds", "Time to parse a frame's envelope"
+        )
+        self._queue_wait = self.metrics.histogram(
+            "dispatch_wait_seconds", "Time from receiving a message to a worker picking it up"
+        )
+        self._event_seconds = self.metrics.histogram_family(
+            "event_handler_seconds", "Time to run all handlers of a message", label="event"
+        )
+        self._reconnects = self.metrics.counter(
+            "reconnects_total", "Connections re-established after being lost"
+        )
+        self._reconnect_seconds = self.metrics.histogram(
+            "reconnect_seconds", "Time from losing the connection to being connected again"
+        )
+        # Monotonic time the connection was lost, while reconnecting
+        self._lost_at: float | None = None
+
+        # Inbound messages wait here for one of the dispatch workers: in a single
+        # shared queue ("concurrent" mode) or in per-channel lanes ("ordered" mode)
+        dropped = self.metrics.counter(
+            "dispatch_dropped_total", "Inbound messages dropped by the overflow policy"
+        )
+        coalesced = self.metrics.counter(
+            "dispatch_coalesced_total", "Inbound messages replaced by a newer one"
+        )
+        # Latest-value channels: one message per (channel, event) in flight,
+        # the newest of the rest waiting in its place
+        self.latest = LatestValues(coalesced=coalesced)
+        self._inbox = DispatchQueue(
+            config.dispatch_queue_size,
+            config.dispatch_overflow,
+            dropped=dropped,
+            coalesced=coalesced,
+            on_drop=self.latest.discard,
+        )
+        self._lanes: ChannelLanes | None = None
+        if config.dispatch_mode == "ordered":
+            self._lanes = ChannelLanes(
+                config.channel_queue_size,
+                config.dispatch_overflow,
+                dropped=dropped,
+                coalesced=coalesced,
+                on_drop=self.latest.discard,
+            )
+            self.metrics.gauge(
+                "dispatch_queue_depth", "Inbound messages waiting for a worker", self._lanes.qsize
+            )
+            self.metrics.gauge(
+                "dispatch_active_channels", "Channels with pending messages", self._lanes.__len__
+            )
+        else:
+            self.metrics.gauge(
+                "dispatch_queue_depth", "Inbound messages waiting for a worker", self._inbox.qsize
+            )
+        self._workers: list[asyncio.Task[None]] = []
+
+        # Outbound messages waiting for the writer task
+        self._outbox = Outbox(config.send_buffer_size, config.send_buffer_ttl, self.metrics)
+        self._writer_task: asyncio.Task[None] | None = None
+        self._send_batches = self.metrics.counter(
+            "send_batches_total", "Socket writes carrying one or more outbound frames"
+        )
 
     @property
     def socket_id(self) -> str | None:
         """The socket ID assigned by the server after connection."""
         return self._socket_id
 
+    @property
+    def state(self) -> ConnectionState:
+        """Current lifecycle state."""
+        return self._state
+
     @property
     def is_connected(self) -> bool:
         """Whether currently connected."""
@@ -70,10 +223,61 @@ class Connection:
         except Exception:
             return False
 
+    async def wait_for_state(self, *states: ConnectionState) -> ConnectionState:
+        """
+        Wait until the connection enters one of the given states.
+
+        Returns immediately if the connection is already in one of them.
+        No polling is involved: waiters are woken by the state transition itself.
+
+        Args:
+            states: States to wait for
+
+        Returns:
+            The state that was entered
+        """
+        if self._state in states:
+            return self._state
+
+        future: asyncio.Future[ConnectionState] = asyncio.get_running_loop().create_future()
+        entry = (frozenset(states), future)
+        self._state_waiters.append(entry)
+        try:
+            return await future
+        finally:
+            if entry in self._state_waiters:
+                self._state_waiters.remove(entry)
+
+    def _set_state(self, state: ConnectionState) -> None:
+        """Transition to a new state and wake matching waiters."""
+        if state is self._state:
+            return
+
+        logger.debug("Connection state: %s -> %s", self._state.value, state.value)
+        self._state = state
+
+        remaining = []
+        for states, future in self._state_waiters:
+            if future.done():
+                continue
+            if state in states:
+                future.set_result(state)
+            else:
+                remaining.append((states, future))
+        self._state_waiters = remaining
+
     async def connect(self) -> None:
         """Establish connection, handling reconnection automatically."""
         self._running = True
-        await self._connect_with_retry()
+        # A fresh connect() is not a reconnect
+        self._lost_at = None
+        self._set_state(ConnectionState.CONNECTING)
+        self._start_workers()
+        try:
+            await self._connect_with_retry()
+        except BaseException:
+            self._set_state(ConnectionState.CLOSED)
+            raise
 
     async def disconnect(self) -> None:
         """Gracefully close the connection."""
@@ -93,10 +297,9 @@ class Connection:
             except asyncio.CancelledError:
                 pass
 
-        # Cancel any pending message handler tasks
-        for task in list(self._message_tasks):
-            task.cancel()
-        self._message_tasks.clear()
+        # Stop dispatch workers and drop undelivered messages
+        await self._stop_workers()
+        await self._stop_writer(ConnectionError("Connection closed"))
 
         if self._ws:
             await self._ws.close()
@@ -104,19 +307,135 @@ class Connection:
 
         self._connected = False
         self._socket_id = None
-
-    async def send(self, message: Message) -> None:
-        """Send a message to the server."""
-        if not self._ws or not self._connected:
+        self._outbox.clear()
+        self._set_state(ConnectionState.CLOSED)
+
+    async def send(self, message: Message, *, coalesce: Hashable | None = None) -> None:
+        """
+        Send a message to the server.
+
+        Protocol frames are awaited until written. Client events return once
+        queued: they are buffered while reconnecting and delivered after the
+        connection is restored (see class docstring).
+
+        Args:
+            message: Message to send
+            coalesce: Optional key; a still-queued message with the same key is
+                replaced by this one instead of both being sent
+
+        Raises:
+            ConnectionError: If the message cannot be encoded, sent or buffered
+        """
+        must_send_now = message.event.startswith("pusher:") or not self._can_buffer()
+        if must_send_now and (not self._ws or not self._connected):
             raise ConnectionError("Not connected")
 
         try:
-            await self._ws.send(message.to_json())
-            logger.debug(f"Sent: {message.event}")
+            frame = message.encode(self._codec)
         except Exception as e:
             logger.error(f"Send error: {e}")
             raise ConnectionError(f"Failed to send message: {e}") from e
 
+        if message.event.startswith("pusher:"):
+            await self._outbox.push_control(message, frame)
+            return
+
+        await self._outbox.push(
+            message,
+            frame,
+            key=coalesce,
+            buffering=self._state is not ConnectionState.CONNECTED,
+        )
+
+    def _can_buffer(self) -> bool:
+        """Whether outbound messages may be held for a later reconnect."""
+        return (
+            self._running
+            and self.config.send_buffer_size > 0
+            and self._state is not ConnectionState.CLOSED
+        )
+
+    async def _writer_loop(self) -> None:
+        """Write queued frames to the current socket in batches."""
+        ws = self._ws
+        outbox = self._outbox
+        while ws is not None:
+            ready = self._state is ConnectionState.CONNECTED
+            if not outbox.has_work(ready):
+                outbox.wakeup.clear()
+                await outbox.wakeup.wait()
+                continue
+
+            batch = outbox.take(_MAX_BATCH, ready)
+            if not batch:
+                continue
+            self._send_batches.inc()
+            written = 0
+            try:
+                # websockets has no multi-message send: frame each message with
+                # the sans-I/O protocol, flush them with one write and drain once
+                async with ws.send_context():
+                    protocol = ws.protocol
+                    for entry in batch:
+                        frame = entry.frame
+                        protocol.send_text(frame if isinstance(frame, bytes) else frame.encode())
+                    ws.transport.writelines(protocol.data_to_send())
+                    # Handed to the socket: never requeued, even if the drain fails
+                    written = len(batch)
+            except asyncio.CancelledError:
+                # Stopped mid-write: keep the unwritten client events for the next socket
+                self._settle_batch(batch, written, ConnectionError("Connection lost"))
+                raise
+            # Any failure must reach the senders, or their futures never resolve
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"Send error: {e}")
+                error = ConnectionError(f"Failed to send message: {e}")
+                error.__cause__ = e
+                self._settle_batch(batch, written, error)
+                return
+            for entry in batch:
+                self._sent(entry)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent %d frame(s): %s", len(batch), batch[-1].message.event)
+
+    def _sent(self, entry: Outbound) -> None:
+        """Account for a written frame and release its sender."""
+        frame = entry.frame
+        self._frames_sent.inc()
+        self._bytes_sent.inc(len(frame))
+        trace = self.trace
+        if trace is not None and trace.on_frame_out is not None:
+            _call_hook(trace.on_frame_out, entry.message, frame)
+        if entry.future is not None and not entry.future.done():
+            entry.future.set_result(None)
+
+    def _settle_batch(self, batch: list[Outbound], written: int, error: ConnectionError) -> None:
+        """Release the frames already written and fail or requeue the rest."""
+        for entry in batch[:written]:
+            self._sent(entry)
+        unwritten = batch[written:]
+        for entry in unwritten:
+            if entry.future is not None and not entry.future.done():
+                entry.future.set_exception(error)
+        self._outbox.restore(unwritten)
+        self._outbox.fail_control(error)
+
+    def _start_writer(self) -> None:
+        """Start the writer task for the current socket."""
+        self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _stop_writer(self, error: ConnectionError) -> None:
+        """Stop the writer task and fail protocol frames still waiting for it."""
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        self._outbox.fail_control(error)
+
     async def _connect_with_retry(self) -> None:
         """Connect with exponential backoff retry."""
         while self._running:
@@ -158,11 +477,21 @@ class Connection:
         logger.info(f"Connecting to {url}")
 
         self._ws = await websockets.connect(url)
+        try:
+            await self._open_session()
+        except BaseException:
+            # Do not leave the writer or the socket behind for the next attempt
+            await self._abandon_socket()
+            raise
+
+    async def _open_session(self) -> None:
+        """Complete the handshake on a new socket, restore subscriptions and go live."""
+        assert self._ws is not None
         logger.debug("WebSocket connected, waiting for connection_established")
 
         # Wait for connection_established event
-        raw = await asyncio.wait_for(self._ws.recv(), timeout=10.0)
-        message = Message.from_json(str(raw))
+        raw = await asyncio.wait_for(self._ws.recv(decode=False), timeout=10.0)
+        message = Message.from_json(raw, self._codec)
 
         if message.event != Events.CONNECTION_ESTABLISHED:
             raise ProtocolError(f"Expected connection_established, got {message.event}")
@@ -174,28 +503,69 @@ class Connection:
         self._connected = True
         logger.info(f"Connected with socket_id: {self._socket_id}")
 
-        # Notify callback
+        # The writer only sends protocol frames until we are CONNECTED
+        self._start_writer()
+
+        # Notify callback (restores channel subscriptions)
         await self._on_connect(self._socket_id)
 
         # Start background tasks
+        self._last_received = time.monotonic()
         self._receive_task = asyncio.create_task(self._receive_loop())
         self._keepalive_task = asyncio.create_task(self._keepalive_loop())
 
+        # Releases client events buffered while we were away, in order
+        self._set_state(ConnectionState.CONNECTED)
+        if self._lost_at is not None:
+            self._reconnects.inc()
+            self._reconnect_seconds.observe(time.monotonic() - self._lost_at)
+            self._lost_at = None
+        self._outbox.wakeup.set()
+
+    async def _abandon_socket(self) -> None:
+        """Stop the writer and close the socket of a connection attempt that failed."""
+        await self._stop_writer(ConnectionError("Connection failed"))
+        ws, self._ws = self._ws, None
+        self._connected = False
+        self._socket_id = None
+        if ws is not None:
+            try:
+                await ws.close()
+            # The attempt already failed; its socket is discarded either way
+            except Exception as e:  # noqa: BLE001
+                logger.debug("Closing failed socket: %s", e)
+
     async def _receive_loop(self) -> None:
         """Receive and dispatch incoming messages."""
         if not self._ws:
             return
 
+        ws = self._ws
+        codec = self._codec
         try:
-            async for raw in self._ws:
+            while True:
+                # Frames are read as raw UTF-8 bytes and handed straight to the codec
+                raw = await ws.recv(decode=False)
+                received = self._last_received = time.monotonic()
+                self._frames_received.inc()
+                self._bytes_received.inc(len(raw))
                 try:
-                    message = Message.from_json(str(raw))
+                    message = Message.from_json(raw, codec)
+                    message.received_at = received
+                    self._decode_seconds.observe(time.monotonic() - received)
+                    trace = self.trace
+                    if trace is not None and trace.on_frame_in is not None:
+                        _call_hook(trace.on_frame_in, message, raw)
                     # Handle protocol messages (ping/pong) synchronously
                     # Dispatch user messages as background tasks to avoid blocking
                     await self._handle_message(message)
                 except Exception as e:
                     logger.error(f"Error handling message: {e}")
                     await self._on_error(e)
+        except websockets.ConnectionClosedOK:
+            # Normal closure (close code 1000/1001)
+            logger.warning("Receive loop ended - connection closed normally")
+            await self._handle_connection_lost()
         except websockets.ConnectionClosed as e:
             logger.warning(f"Connection closed: {e}")
             await self._handle_connection_lost()
@@ -204,14 +574,16 @@ class Connection:
             await self._on_error(e)
             # Treat unexpected errors as connection loss and attempt reconnect
             await self._handle_connection_lost()
-        else:
-            # Loop exited normally without exception (can happen with close code 1000/1001)
-            logger.warning("Receive loop ended - connection closed normally")
-            await self._handle_connection_lost()
 
     async def _handle_connection_lost(self) -> None:
         """Handle connection loss and attempt reconnection."""
         self._connected = False
+        await self._stop_writer(ConnectionError("Connection lost"))
+
+        will_reconnect = self._running and self.config.reconnect_enabled
+        if will_reconnect and self._lost_at is None:
+            self._lost_at = time.monotonic()
+        self._set_state(ConnectionState.RECONNECTING if will_reconnect else ConnectionState.CLOSED)
 
         # Clean up the websocket
         if self._ws:
@@ -224,56 +596,181 @@ class Connection:
         await self._on_disconnect()
 
         # Attempt reconnection
-        if self._running and self.config.reconnect_enabled:
+        if will_reconnect:
             await self._reconnect()
 
     async def _handle_message(self, message: Message) -> None:
         """Handle an incoming message."""
-        logger.debug(f"Received: {message.event}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received: %s on %s", message.event, message.channel)
 
         if message.event == Events.PING:
             # Respond to server ping
             await self.send(Messages.pong())
         elif message.event == Events.PONG:
             # Handle pong response
-            if self._pending_pong:
-                self._pending_pong.set()
+            if self._pending_pong and not self._pending_pong.done():
+                self._pending_pong.set_result(None)
         elif message.event == Events.ERROR:
             logger.error(f"Server error: {message.data}")
             await self._on_error(ProtocolError(str(message.data)))
         else:
-            # Dispatch to client handler as background task to avoid blocking receive loop
-            # This allows the receive loop to continue processing messages even if
-            # a handler is slow (e.g., running a capture script)
-            task = asyncio.create_task(self._dispatch_message(message))
-            self._message_tasks.add(task)
-            task.add_done_callback(self._message_tasks.discard)
+            if message.event in _SUBSCRIPTION_EVENTS and self._on_subscription is not None:
+                # Resolved here rather than by a worker, so a handler awaiting a
+                # subscription cannot deadlock the pool; handlers still get the event
+                self._on_subscription(message)
+
+            # Hand off to the dispatch workers so the receive loop keeps reading
+            # even if a handler is slow (e.g., running a capture script). When the
+            # queue is full the overflow policy decides whether this blocks.
+            if self.latest and not self.latest.offer(message):
+                # Held as the newest value for a message already in flight
+                return
+            if self._lanes is not None:
+                await self._lanes.put(message)
+            else:
+                await self._inbox.put(message)
+
+    def _start_workers(self) -> None:
+        """Start the dispatch workers if they are not running."""
+        if self._workers:
+            return
+        worker = self._lane_worker if self._lanes is not None else self._dispatch_worker
+        self._workers = [
+            asyncio.create_task(worker()) for _ in range(max(1, self.config.dispatch_workers))
+        ]
+
+    async def _stop_workers(self) -> None:
+        """Cancel the dispatch workers and discard queued messages."""
+        # A handler may be calling disconnect() from inside a worker. That worker is
+        # left running and exits by itself once it is no longer registered.
+        current = asyncio.current_task()
+        workers = [task for task in self._workers if task is not current]
+        self._workers = []
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        while not self._inbox.empty():
+            self._inbox.get_nowait()
+            self._inbox.task_done()
+        if self._lanes is not None:
+            self._lanes.clear()
+        self.latest.clear()
+
+    async def _dispatch_worker(self) -> None:
+        """Deliver queued messages to the client, one at a time."""
+        inbox = self._inbox
+        me = asyncio.current_task()
+        while me in self._workers:
+            message = await inbox.get()
+            try:
+                await self._deliver(message)
+            finally:
+                inbox.task_done()
+
+    async def _lane_worker(self) -> None:
+        """Deliver messages from per-channel lanes, one channel at a time."""
+        lanes = self._lanes
+        assert lanes is not None
+        me = asyncio.current_task()
+        while me in self._workers:
+            key, message = await lanes.get()
+            try:
+                await self._deliver(message)
+            finally:
+                lanes.release(key)
+
+    async def _deliver(self, message: Message) -> None:
+        """Dispatch a dequeued message, or the newest value of a latest-value key."""
+        latest = self.latest
+        if not latest.holds(message):
+            await self._dispatch_message(message)
+            return
+        current: Message | None = latest.take(message)
+        while current is not None:
+            await self._dispatch_message(current)
+            # Values that arrived while the handlers ran
+            current = latest.done(current)
 
     async def _dispatch_message(self, message: Message) -> None:
         """Dispatch a message to the client handler with error handling."""
+        started = time.monotonic()
+        if message.received_at:
+            self._queue_wait.observe(started - message.received_at)
         try:
             await self._on_message(message)
         except Exception as e:
             logger.error(f"Error in message handler: {e}")
             await self._on_error(e)
+        finally:
+            elapsed = time.monotonic() - started
+            self._event_seconds.labels(message.event).observe(elapsed)
+            trace = self.trace
+            if trace is not None and trace.on_dispatch is not None:
+                _call_hook(trace.on_dispatch, message, elapsed)
 
     async def _keepalive_loop(self) -> None:
-        """Send periodic pings to maintain connection."""
+        """
+        Ping the server whenever the link has been idle for ``ping_interval``.
+
+        Any received frame counts as activity, so a busy connection is never
+        pinged. A ping that gets no pong within ``ping_timeout`` means the peer
+        is gone (e.g. a half-open TCP connection after a network change): the
+        socket is aborted, which ends the receive loop and starts a reconnect
+        right away instead of waiting minutes for the OS to notice.
+        """
+        interval = self.config.ping_interval
         while self._connected and self._running:
             try:
-                await asyncio.sleep(self.config.ping_interval)
+                idle = time.monotonic() - self._last_received
+                if idle < interval:
+                    await asyncio.sleep(interval - idle)
+                    continue
 
-                if not self._connected:
-                    break
-
-                # Server will send pusher:ping, we respond with pusher:pong
-                # But we can also initiate a ping cycle by waiting for activity
-                logger.debug("Keepalive check - connection active")
+                if not await self._ping():
+                    return
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Keepalive error: {e}")
+                await asyncio.sleep(interval)
+
+    async def _ping(self) -> bool:
+        """
+        Send a ping and wait for the pong, recording the round trip.
+
+        Returns:
+            False if the pong did not arrive in time and the socket was aborted
+        """
+        pong = self._pending_pong = asyncio.get_running_loop().create_future()
+        started = time.monotonic()
+        try:
+            await self.send(Messages.ping())
+            # asyncio.wait, unlike wait_for, never swallows a cancellation that
+            # races with the pong arriving
+            await asyncio.wait((pong,), timeout=self.config.ping_timeout)
+        finally:
+            if self._pending_pong is pong:
+                self._pending_pong = None
+
+        if not pong.done():
+            pong.cancel()
+            self._ping_timeouts.inc()
+            logger.warning(f"No pong within {self.config.ping_timeout}s, dropping the connection")
+            self._abort()
+            return False
+
+        rtt = time.monotonic() - started
+        self.rtt.observe(rtt)
+        logger.debug("Ping round trip: %.1f ms", rtt * 1000)
+        return True
+
+    def _abort(self) -> None:
+        """Drop the socket without a closing handshake; the receive loop then reconnects."""
+        if self._ws is not None:
+            self._ws.transport.abort()
 
     async def _reconnect(self) -> None:
         """Handle reconnection after disconnect."""
@@ -296,4 +793,5 @@ class Connection:
             await self._connect_with_retry()
         except Exception as e:
             logger.error(f"Reconnection failed: {e}")
+            self._set_state(ConnectionState.CLOSED)
             await self._on_error(e)
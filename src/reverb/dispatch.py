@@ -0,0 +1,263 @@
+"""Bounded inbound message queues with overflow policies."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Literal
+
+from .metrics import Counter
+
+if TYPE_CHECKING:
+    from .messages import Message
+
+# What to do when a message arrives and the queue is full:
+#   block       - wait for room, which pauses the receive loop (TCP backpressure)
+#   drop_oldest - discard the oldest queued message
+#   drop_newest - discard the incoming message
+#   coalesce    - replace the queued message with the same (channel, event);
+#                 block if there is none
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest", "coalesce"]
+
+
+class DispatchQueue(asyncio.Queue["Message"]):
+    """
+    FIFO of inbound messages waiting for a dispatch worker.
+
+    Only ``put()`` applies the overflow policy; ``put_nowait()`` keeps the
+    standard asyncio semantics.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow: OverflowPolicy = "block",
+        *,
+        dropped: Counter | None = None,
+        coalesced: Counter | None = None,
+        on_drop: Callable[[Message], None] | None = None,
+    ) -> None:
+        super().__init__(maxsize)
+        self.overflow = overflow
+        self.dropped = dropped if dropped is not None else Counter()
+        self.coalesced = coalesced if coalesced is not None else Counter()
+        # Told about each message the overflow policy discards
+        self.on_drop = on_drop
+
+    async def put(self, item: Message) -> None:
+        """Queue a message, applying the overflow policy when full."""
+        if not self.full() or self.overflow == "block":
+            await super().put(item)
+        elif self.overflow == "drop_newest":
+            self.dropped.inc()
+            if self.on_drop is not None:
+                self.on_drop(item)
+        elif self.overflow == "drop_oldest":
+            oldest = self.get_nowait()
+            self.task_done()
+            self.dropped.inc()
+            self.put_nowait(item)
+            if self.on_drop is not None:
+                self.on_drop(oldest)
+        elif not self._replace(item):
+            await super().put(item)
+
+    def _replace(self, item: Message) -> bool:
+        """Replace the newest queued message with the same (channel, event)."""
+        queue = self._queue  # type: ignore[attr-defined]
+        for i in range(len(queue) - 1, -1, -1):
+            queued = queue[i]
+            if queued.event == item.event and queued.channel == item.channel:
+                queue[i] = item
+                self.coalesced.inc()
+                return True
+        return False
+
+
+class ChannelLanes:
+    """
+    Per-channel FIFO lanes for ordered dispatch.
+
+    Each channel (``None`` for channel-less events) gets its own bounded
+    DispatchQueue. A lane with pending messages is scheduled onto a shared
+    ready queue and claimed by at most one worker at a time, so messages on one
+    channel are handled strictly in order while different channels run
+    concurrently on the worker pool. Empty lanes are discarded.
+    """
+
+    def __init__(
+        self,
+        lane_size: int = 0,
+        overflow: OverflowPolicy = "block",
+        *,
+        dropped: Counter | None = None,
+        coalesced: Counter | None = None,
+        on_drop: Callable[[Message], None] | None = None,
+    ) -> None:
+        self.lane_size = lane_size
+        self.overflow = overflow
+        self.dropped = dropped if dropped is not None else Counter()
+        self.coalesced = coalesced if coalesced is not None else Counter()
+        self.on_drop = on_drop
+        self._lanes: dict[str | None, DispatchQueue] = {}
+        # Lanes that are queued in _ready or claimed by a worker
+        self._scheduled: set[str | None] = set()
+        self._ready: asyncio.Queue[str | None] = asyncio.Queue()
+
+    def __len__(self) -> int:
+        """Number of channels with pending or in-flight messages."""
+        return len(self._lanes)
+
+    def qsize(self) -> int:
+        """Total messages waiting across all lanes."""
+        return sum(lane.qsize() for lane in self._lanes.values())
+
+    async def put(self, message: Message) -> None:
+        """Queue a message on its channel's lane."""
+        key = message.channel
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = DispatchQueue(
+                self.lane_size,
+                self.overflow,
+                dropped=self.dropped,
+                coalesced=self.coalesced,
+                on_drop=self.on_drop,
+            )
+            self._lanes[key] = lane
+
+        await lane.put(message)
+
+        # The lane may have been drained and retired while put() was blocked
+        if key not in self._scheduled and not lane.empty():
+            self._lanes[key] = lane
+            self._scheduled.add(key)
+            self._ready.put_nowait(key)
+
+    async def get(self) -> tuple[str | None, Message]:
+        """Claim the next ready lane and take its oldest message."""
+        key = await self._ready.get()
+        return key, self._lanes[key].get_nowait()
+
+    def release(self, key: str | None) -> None:
+        """Hand a claimed lane back once its message has been handled."""
+        lane = self._lanes.get(key)
+        if lane is None:
+            # Cleared while the message was being handled
+            self._scheduled.discard(key)
+            return
+        lane.task_done()
+        if lane.empty():
+            del self._lanes[key]
+            self._scheduled.discard(key)
+        else:
+            # Back of the line, so busy channels cannot starve quiet ones
+            self._ready.put_nowait(key)
+
+    def clear(self) -> None:
+        """Discard all pending messages."""
+        self._lanes.clear()
+        self._scheduled.clear()
+        self._ready = asyncio.Queue()
+
+
+class LatestValues:
+    """
+    Latest-value delivery for selected channels.
+
+    On a latest-value channel each (channel, event) key has at most one
+    message queued or being handled at a time. Messages arriving meanwhile
+    wait in a single pending slot, each replacing the one before. A worker
+    taking the queued message swaps in the pending one if there is one, and
+    after handling it goes on with whatever arrived during the handlers, so
+    they always see the newest value and run only as often as they can keep
+    up. Protocol events (``pusher:*``, ``pusher_internal:*``) are never held.
+    """
+
+    def __init__(self, *, coalesced: Counter | None = None) -> None:
+        self.coalesced = coalesced if coalesced is not None else Counter()
+        # channel -> events kept latest-only (None: every event)
+        self._channels: dict[str, frozenset[str] | None] = {}
+        # Keys with a message queued or being handled
+        self._busy: set[tuple[str, str]] = set()
+        self._pending: dict[tuple[str, str], Message] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._channels)
+
+    def __len__(self) -> int:
+        """Number of messages waiting in pending slots."""
+        return len(self._pending)
+
+    def enable(self, channel: str, events: Iterable[str] | None = None) -> None:
+        """Keep only the latest value of ``events`` (None: every event) on a channel."""
+        self._channels[channel] = frozenset(events) if events is not None else None
+
+    def disable(self, channel: str) -> None:
+        """Deliver every message on a channel again, dropping its pending values."""
+        if channel in self._channels:
+            del self._channels[channel]
+            for key in [key for key in self._pending if key[0] == channel]:
+                del self._pending[key]
+
+    def offer(self, message: Message) -> bool:
+        """
+        Admit an inbound message.
+
+        Returns:
+            True if it should be queued for a worker; False if it was kept as
+            the pending value of a key that is already queued or being handled
+        """
+        channel = message.channel
+        if channel is None or channel not in self._channels:
+            return True
+        events = self._channels[channel]
+        event = message.event
+        if (events is not None and event not in events) or event.startswith("pusher"):
+            return True
+        key = (channel, event)
+        if key not in self._busy:
+            self._busy.add(key)
+            return True
+        if key in self._pending:
+            self.coalesced.inc()
+        self._pending[key] = message
+        return False
+
+    def holds(self, message: Message) -> bool:
+        """Whether a dequeued message belongs to a latest-value key."""
+        return bool(self._busy) and (message.channel, message.event) in self._busy
+
+    def take(self, message: Message) -> Message:
+        """The message to handle in place of a dequeued one: the newest pending, if any."""
+        newer = self._pending.pop((message.channel, message.event), None)  # type: ignore[arg-type]
+        if newer is None:
+            return message
+        self.coalesced.inc()
+        return newer
+
+    def done(self, message: Message) -> Message | None:
+        """Release a handled message's key, or return the value that arrived meanwhile."""
+        key = (message.channel, message.event)
+        newer = self._pending.pop(key, None)  # type: ignore[arg-type]
+        if newer is None:
+            self._busy.discard(key)
+        return newer
+
+    def discard(self, message: Message) -> None:
+        """
+        Release the key of a queued message the overflow policy dropped.
+
+        Its pending value goes too: the queue is overflowing, and the next
+        message on the key is queued afresh.
+        """
+        if self._busy:
+            key = (message.channel, message.event)
+            if key in self._busy:
+                self._busy.discard(key)
+                self._pending.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget queued and pending values (the channel settings are kept)."""
+        self._busy.clear()
+        self._pending.clear()
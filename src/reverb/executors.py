@@ -0,0 +1,319 @@
+"""Running event handlers off the event loop, with per-handler concurrency limits."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal, Union
+
+from .exceptions import TimeoutError
+from .metrics import Histogram, MetricsRegistry
+from .types import EventHandler, SyncEventHandler
+
+logger = logging.getLogger(__name__)
+
+# Where a handler runs: a shared bounded thread or process pool, or any Executor
+# (evaluated at import time, so Union for Python 3.9)
+ExecutorOption = Union[Literal["thread", "process"], Executor]  # noqa: UP007
+
+
+def is_async_handler(handler: object) -> bool:
+    """Whether calling the handler returns an awaitable."""
+    if inspect.iscoroutinefunction(handler):
+        return True
+    # Instances of classes with an async __call__
+    return callable(handler) and inspect.iscoroutinefunction(type(handler).__call__)
+
+
+class HandlerExecutors:
+    """
+    The shared thread and process pools for a client's sync handlers.
+
+    Pools are created on first use, so clients with async handlers only never
+    start a thread or process.
+    """
+
+    def __init__(self, threads: int = 4, processes: int | None = None) -> None:
+        self.threads = max(1, threads)
+        self.processes = processes if processes else (os.cpu_count() or 1)
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+
+    def resolve(self, executor: ExecutorOption) -> Executor:
+        """The Executor for an ``executor=`` option."""
+        if isinstance(executor, Executor):
+            return executor
+        if executor == "thread":
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    self.threads, thread_name_prefix="reverb-handler"
+                )
+            return self._thread_pool
+        if executor == "process":
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(self.processes)
+            return self._process_pool
+        raise ValueError(f"Unknown executor: {executor!r}")
+
+    def shutdown(self) -> None:
+        """Shut the pools down without waiting; they are recreated if needed again."""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+
+
+class OffloadedHandler:
+    """
+    Async wrapper around a handler bound with options.
+
+    Sync handlers run in the executor; async ones on the loop. At most
+    ``concurrency`` calls run at once, further calls wait their turn. A call
+    running longer than ``timeout`` is abandoned with TimeoutError (a sync
+    handler's thread cannot be interrupted and finishes in the background).
+    ``concurrent`` handlers are started alongside the event's other handlers
+    instead of in turn (see run_handlers). The wrapper compares equal to the
+    wrapped handler, so ``unbind(event, handler)`` works with the original
+    function.
+    """
+
+    __slots__ = ("__weakref__", "_limit", "concurrent", "executor", "handler", "timeout")
+
+    def __init__(
+        self,
+        handler: EventHandler | SyncEventHandler,
+        executor: Executor | None,
+        concurrency: int | None,
+        timeout: float | None = None,
+        concurrent: bool = False,
+    ) -> None:
+        self.handler = handler
+        self.executor = executor
+        self.timeout = timeout
+        self.concurrent = concurrent
+        self._limit = asyncio.Semaphore(concurrency) if concurrency else None
+
+    async def __call__(self, event: str, data: Any, channel: str | None) -> None:
+        if self._limit is None:
+            await self._run_limited(event, data, channel)
+        else:
+            async with self._limit:
+                await self._run_limited(event, data, channel)
+
+    async def _run_limited(self, event: str, data: Any, channel: str | None) -> None:
+        if self.timeout is None:
+            await self._run(event, data, channel)
+            return
+        # asyncio.wait rather than wait_for: wait_for can swallow a cancellation
+        # that arrives just as the handler finishes
+        task = asyncio.ensure_future(self._run(event, data, channel))
+        try:
+            done, _ = await asyncio.wait((task,), timeout=self.timeout)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if not done:
+            task.cancel()
+            await asyncio.wait((task,))
+            raise TimeoutError(
+                f"Handler {handler_name(self.handler)} timed out after {self.timeout}s"
+            )
+        task.result()
+
+    async def _run(self, event: str, data: Any, channel: str | None) -> None:
+        if self.executor is None:
+            await self.handler(event, data, channel)
+        else:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, self.handler, event, data, channel)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OffloadedHandler):
+            return self.handler == other.handler
+        return self.handler == other
+
+    def __hash__(self) -> int:
+        return hash(self.handler)
+
+    def __repr__(self) -> str:
+        return f"OffloadedHandler({self.handler!r}, executor={self.executor!r})"
+
+
+def wrap_handler(
+    handler: EventHandler | SyncEventHandler,
+    executors: HandlerExecutors,
+    executor: ExecutorOption | None = None,
+    concurrency: int | None = None,
+    timeout: float | None = None,
+    concurrent: bool = False,
+) -> EventHandler:
+    """
+    Prepare a handler for binding.
+
+    Async handlers without options are returned unchanged. Sync handlers run
+    in ``executor`` (the shared thread pool by default) so they cannot block
+    the event loop.
+
+    Args:
+        handler: Async or sync function(event, data, channel)
+        executors: The client's shared pools
+        executor: "thread", "process" or an Executor (sync handlers only)
+        concurrency: Maximum concurrent calls of this handler
+        timeout: Seconds a call may take before it is abandoned
+        concurrent: Run alongside the event's other handlers, not in turn
+
+    Raises:
+        ValueError: If an executor is given for an async handler
+    """
+    if concurrency is not None and concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if timeout is not None and timeout <= 0:
+        raise ValueError("timeout must be positive")
+
+    if is_async_handler(handler):
+        if executor is not None:
+            raise ValueError("executor= is for sync handlers; async handlers run on the loop")
+        if concurrency is None and timeout is None and not concurrent:
+            return handler
+        return OffloadedHandler(handler, None, concurrency, timeout, concurrent)
+
+    return OffloadedHandler(
+        handler, executors.resolve(executor or "thread"), concurrency, timeout, concurrent
+    )
+
+
+def needs_wrapping(
+    handler: object,
+    executor: ExecutorOption | None,
+    concurrency: int | None,
+    timeout: float | None,
+    concurrent: bool,
+) -> bool:
+    """Whether bind() has to pass a handler through wrap_handler()."""
+    return (
+        executor is not None
+        or concurrency is not None
+        or timeout is not None
+        or concurrent
+        or not is_async_handler(handler)
+    )
+
+
+def handler_name(handler: object) -> str:
+    """Readable name of a handler for logs and metrics (``module.qualname``)."""
+    if isinstance(handler, OffloadedHandler):
+        handler = handler.handler
+    qualname = getattr(handler, "__qualname__", None)
+    if qualname is None:
+        return repr(handler)
+    return f"{getattr(handler, '__module__', None) or '?'}.{qualname}"
+
+
+class HandlerStats:
+    """
+    Handler latency and failures.
+
+    Every handler call is timed into the ``handler_seconds`` histogram and into
+    the handler's own series of ``handler_call_seconds`` (labelled with
+    ``handler_name()``), so slow handlers can be singled out with
+    ``by_handler()``. Failures and timeouts are counted.
+    """
+
+    def __init__(self, metrics: MetricsRegistry) -> None:
+        self.seconds = metrics.histogram("handler_seconds", "Handler call duration")
+        self._per_handler = metrics.histogram_family(
+            "handler_call_seconds", "Handler call duration per handler", label="handler"
+        )
+        self._errors = metrics.counter("handler_errors_total", "Handler calls that raised")
+        self._timeouts = metrics.counter(
+            "handler_timeouts_total", "Handler calls abandoned after their timeout"
+        )
+        # Saves working out the name on every call; weak, so unbound handlers
+        # (and whatever their closures hold) can still be freed
+        self._handlers: weakref.WeakKeyDictionary[Any, Histogram] = weakref.WeakKeyDictionary()
+
+    def histogram(self, handler: EventHandler) -> Histogram:
+        """The latency histogram of one handler."""
+        try:
+            histogram = self._handlers.get(handler)
+        except TypeError:
+            # Unhashable, or cannot be weakly referenced
+            return self._per_handler.labels(handler_name(handler))
+        if histogram is None:
+            histogram = self._handlers[handler] = self._per_handler.labels(handler_name(handler))
+        return histogram
+
+    def by_handler(self) -> dict[str, dict[str, float]]:
+        """Latency snapshot per handler, slowest (by p99) first."""
+        return dict(
+            sorted(
+                ((name, h.snapshot()) for name, h in self._per_handler.items()),
+                key=lambda item: item[1]["p99"],
+                reverse=True,
+            )
+        )
+
+    async def call(self, handler: EventHandler, event: str, data: Any, channel: str | None) -> None:
+        """Call one handler, timing it and logging (not raising) its errors."""
+        started = time.perf_counter()
+        try:
+            await handler(event, data, channel)
+        except TimeoutError as e:
+            self._timeouts.inc()
+            logger.error(f"Handler error for '{event}' on '{channel}': {e}")
+        # Whatever a handler raises is its own bug; it must not stop dispatch
+        except Exception as e:  # noqa: BLE001
+            self._errors.inc()
+            logger.error(f"Handler error for '{event}' on '{channel}': {e}")
+        finally:
+            elapsed = time.perf_counter() - started
+            self.seconds.observe(elapsed)
+            self.histogram(handler).observe(elapsed)
+
+
+async def run_handlers(
+    handlers: tuple[EventHandler, ...],
+    event: str,
+    data: Any,
+    channel: str | None,
+    stats: HandlerStats,
+) -> None:
+    """
+    Call an event's handlers.
+
+    Handlers run one after another, in order, except those bound with
+    ``concurrent=True``: they are started first as tasks and run alongside the
+    others, so a slow one does not hold up the rest. Returns once every
+    handler has finished; an error in one handler does not affect the others.
+    """
+    for handler in handlers:
+        if getattr(handler, "concurrent", False):
+            break
+    else:
+        for handler in handlers:
+            await stats.call(handler, event, data, channel)
+        return
+
+    concurrent = [h for h in handlers if getattr(h, "concurrent", False)]
+    sequential = [h for h in handlers if not getattr(h, "concurrent", False)]
+    if not sequential and len(concurrent) == 1:
+        await stats.call(concurrent[0], event, data, channel)
+        return
+
+    tasks = [
+        asyncio.ensure_future(stats.call(handler, event, data, channel)) for handler in concurrent
+    ]
+    try:
+        for handler in sequential:
+            await stats.call(handler, event, data, channel)
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,152 @@
+"""Prometheus text exposition of a MetricsRegistry, served over plain HTTP."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+
+from .metrics import Histogram, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+# Quantiles exported for each histogram (as a Prometheus summary)
+_QUANTILES = (0.5, 0.9, 0.99)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _summary(lines: list[str], name: str, histogram: Histogram, labels: str = "") -> None:
+    sep = "," if labels else ""
+    for q in _QUANTILES:
+        lines.append(
+            f'{name}{{{labels}{sep}quantile="{q}"}} {_number(histogram.percentile(q * 100))}'
+        )
+    braces = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{braces} {_number(histogram.sum)}")
+    lines.append(f"{name}_count{braces} {_number(histogram.count)}")
+
+
+def render(registry: MetricsRegistry, prefix: str = "reverb_") -> str:
+    """
+    Render every metric in the Prometheus text format (version 0.0.4).
+
+    Counters and gauges map directly. Histograms are exported as summaries
+    with p50/p90/p99 quantiles plus ``_sum`` and ``_count``, since their
+    log-linear buckets are created on demand and vary between scrapes.
+
+    Args:
+        registry: Metrics to render
+        prefix: Prepended to every metric name
+
+    Returns:
+        The exposition text, ending with a newline
+    """
+    lines: list[str] = []
+    for counter in registry.counters:
+        name = prefix + counter.name
+        lines.append(f"# HELP {name} {counter.description}")
+        lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name} {_number(counter.value)}")
+    for gauge in registry.gauges:
+        name = prefix + gauge.name
+        lines.append(f"# HELP {name} {gauge.description}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {_number(gauge.value)}")
+    for histogram in registry.histograms:
+        name = prefix + histogram.name
+        lines.append(f"# HELP {name} {histogram.description}")
+        lines.append(f"# TYPE {name} summary")
+        _summary(lines, name, histogram)
+    for family in registry.families:
+        name = prefix + family.name
+        lines.append(f"# HELP {name} {family.description}")
+        lines.append(f"# TYPE {name} summary")
+        for value, histogram in family.items():
+            _summary(lines, name, histogram, f'{family.label}="{_escape(value)}"')
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    """
+    Minimal HTTP endpoint serving ``GET /metrics`` for Prometheus.
+
+    Runs on the client's event loop with ``asyncio.start_server``; rendering
+    happens per scrape, so it costs nothing between scrapes. Binds to
+    localhost by default.
+
+    Example:
+        exporter = MetricsExporter(client.metrics, port=9464)
+        await exporter.start()
+    """
+
+    def __init__(
+        self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464
+    ) -> None:
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: asyncio.Server | None = None
+
+    @property
+    def is_serving(self) -> bool:
+        """Whether the endpoint is listening."""
+        return self._server is not None
+
+    async def start(self) -> None:
+        """Start listening. With ``port=0`` the chosen port is stored in ``port``."""
+        if self._server is not None:
+            return
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            # Skip the headers; the request has no body
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+            parts = request.decode("latin-1").split()
+            method, path = (parts[0], parts[1].split("?")[0]) if len(parts) >= 2 else ("", "")
+            if method in ("GET", "HEAD") and path == "/metrics":
+                body = render(self.registry).encode()
+                status = "200 OK"
+                content_type = CONTENT_TYPE
+            else:
+                body = b"Not Found\n"
+                status = "404 Not Found"
+                content_type = "text/plain; charset=utf-8"
+            head = (
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            writer.write(head if method == "HEAD" else head + body)
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            logger.debug("Metrics request failed: %s", e)
+        finally:
+            writer.close()
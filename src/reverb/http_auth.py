@@ -0,0 +1,286 @@
+"""Channel authorization through the application's HTTP auth endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+from .auth import AuthProvider
+from .exceptions import AuthenticationError
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning a kept-alive connection was closed by the server meanwhile
+_STALE = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class HttpAuthProvider(AuthProvider):
+    """
+    Authorizes subscriptions by POSTing to a Laravel ``/broadcasting/auth`` endpoint.
+
+    Requests are form-encoded ``socket_id`` and ``channel_name``, as the
+    Pusher JS client sends them, and the JSON reply (``auth`` plus
+    ``channel_data`` for presence channels) goes into the subscribe frame.
+    Presence user data therefore comes from the server, not the client.
+
+    Up to ``pool_size`` keep-alive connections are reused across requests;
+    each request runs in a worker thread so the event loop never blocks.
+    With ``batch_endpoint`` set, authorize_many() sends up to ``max_batch``
+    channels per request in the pusher-js-auth format (``channel_name[0]``,
+    ``channel_name[1]``, ... answered by ``{channel: {"status": 200, "data":
+    {"auth": ...}}}``); without it, channels are authorized by concurrent
+    requests over the pool. Results are cached per socket id, since a
+    signature is valid for the life of the socket.
+
+    Example:
+        auth = HttpAuthProvider(
+            "https://app.example.com/broadcasting/auth",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        client = ReverbClient(auth=auth)
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        batch_endpoint: str | None = None,
+        max_batch: int = 100,
+        pool_size: int = 8,
+        timeout: float = 10.0,
+        max_sockets: int = 16,
+    ) -> None:
+        """
+        Initialize the provider.
+
+        Args:
+            endpoint: URL of the auth endpoint (http or https)
+            headers: Extra request headers, e.g. Authorization
+            batch_endpoint: URL accepting several channels per request, on the
+                same host as ``endpoint`` (None disables batching)
+            max_batch: Channels per batch request
+            pool_size: Persistent connections, and so concurrent requests
+            timeout: Socket timeout per request in seconds
+            max_sockets: Socket ids whose results stay cached (one per
+                connection; older ones are dropped first)
+
+        Raises:
+            ValueError: If a URL is not http(s) or the batch URL is on another host
+        """
+        url = urlsplit(endpoint)
+        if url.scheme not in ("http", "https") or not url.hostname:
+            raise ValueError(f"Invalid auth endpoint: {endpoint!r}")
+        self.endpoint = endpoint
+        self._https = url.scheme == "https"
+        self._host = url.hostname
+        self._port = url.port
+        self._path = self._target(url.path, url.query)
+
+        self._batch_path: str | None = None
+        if batch_endpoint is not None:
+            batch = urlsplit(batch_endpoint)
+            if (batch.scheme, batch.hostname, batch.port) != (url.scheme, url.hostname, url.port):
+                raise ValueError("batch_endpoint must be on the same host as endpoint")
+            self._batch_path = self._target(batch.path, batch.query)
+
+        self.max_batch = max(1, max_batch)
+        self.timeout = timeout
+        self.max_sockets = max_sockets
+        self._headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/x-www-form-urlencoded",
+            **(headers or {}),
+        }
+        self.pool_size = max(1, pool_size)
+        # Created on first use, inside the event loop
+        self._limit: asyncio.Semaphore | None = None
+        # Idle keep-alive connections; taken and returned from worker threads
+        self._idle: list[http.client.HTTPConnection] = []
+        self._cache: OrderedDict[str, dict[str, dict[str, str]]] = OrderedDict()
+
+    @staticmethod
+    def _target(path: str, query: str) -> str:
+        return (path or "/") + (f"?{query}" if query else "")
+
+    async def authorize(
+        self, socket_id: str, channel_name: str, channel_data: str | None = None
+    ) -> dict[str, str]:
+        """
+        Authorize one subscription with the endpoint (see AuthProvider.authorize).
+
+        ``channel_data`` is ignored; the endpoint supplies it for presence channels.
+        """
+        cached = self._cached(socket_id).get(channel_name)
+        if cached is not None:
+            return cached
+        status, body = await self._post(
+            self._path, [("socket_id", socket_id), ("channel_name", channel_name)]
+        )
+        payload = _payload(body) if status == 200 else None
+        if payload is None:
+            raise AuthenticationError(f"Auth endpoint refused '{channel_name}' (HTTP {status})")
+        self._cached(socket_id)[channel_name] = payload
+        return payload
+
+    async def authorize_many(
+        self, socket_id: str, channel_names: Iterable[str], channel_data: str | None = None
+    ) -> dict[str, dict[str, str]]:
+        """
+        Authorize several subscriptions, batched or over concurrent requests.
+
+        Cached channels are not requested again. Channels the endpoint
+        refused are left out (see AuthProvider.authorize_many).
+        """
+        cache = self._cached(socket_id)
+        auths: dict[str, dict[str, str]] = {}
+        missing: list[str] = []
+        for name in dict.fromkeys(channel_names):
+            cached = cache.get(name)
+            if cached is not None:
+                auths[name] = cached
+            else:
+                missing.append(name)
+        if not missing:
+            return auths
+
+        if self._batch_path is None:
+            results = await asyncio.gather(
+                *(self.authorize(socket_id, name) for name in missing), return_exceptions=True
+            )
+            # One result per channel, in order (zip(strict=) needs Python 3.10)
+            for name, result in zip(missing, results):
+                if isinstance(result, AuthenticationError):
+                    logger.debug("Batch authorization skipped '%s': %s", name, result)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    auths[name] = result
+            return auths
+
+        size = self.max_batch
+        batches = [missing[i : i + size] for i in range(0, len(missing), size)]
+        for batch_auths in await asyncio.gather(
+            *(self._authorize_batch(socket_id, batch) for batch in batches)
+        ):
+            auths.update(batch_auths)
+        cache.update(auths)
+        return auths
+
+    async def _authorize_batch(
+        self, socket_id: str, channel_names: list[str]
+    ) -> dict[str, dict[str, str]]:
+        assert self._batch_path is not None
+        fields = [("socket_id", socket_id)]
+        fields.extend((f"channel_name[{i}]", name) for i, name in enumerate(channel_names))
+        try:
+            status, body = await self._post(self._batch_path, fields)
+        except AuthenticationError as e:
+            logger.warning(f"Batch authorization of {len(channel_names)} channel(s) failed: {e}")
+            return {}
+        if status != 200:
+            logger.warning(
+                f"Batch authorization of {len(channel_names)} channel(s) failed: HTTP {status}"
+            )
+            return {}
+        try:
+            results = json.loads(body)
+        except ValueError:
+            results = None
+        if not isinstance(results, dict):
+            logger.warning("Batch auth endpoint returned an invalid response")
+            return {}
+
+        auths: dict[str, dict[str, str]] = {}
+        for name in channel_names:
+            result = results.get(name)
+            if isinstance(result, dict) and "data" in result:
+                payload = _payload(result["data"]) if result.get("status", 200) == 200 else None
+            else:
+                payload = _payload(result)
+            if payload is not None:
+                auths[name] = payload
+        return auths
+
+    def _cached(self, socket_id: str) -> dict[str, dict[str, str]]:
+        """Results for a socket id, dropping the oldest socket ids beyond max_sockets."""
+        cache = self._cache.get(socket_id)
+        if cache is None:
+            cache = self._cache[socket_id] = {}
+            while len(self._cache) > max(1, self.max_sockets):
+                self._cache.popitem(last=False)
+        return cache
+
+    async def _post(self, path: str, fields: list[tuple[str, str]]) -> tuple[int, bytes]:
+        body = urlencode(fields).encode()
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(self.pool_size)
+        async with self._limit:
+            try:
+                return await asyncio.to_thread(self._request, path, body)
+            except (OSError, http.client.HTTPException) as e:
+                raise AuthenticationError(f"Auth endpoint request failed: {e}") from e
+
+    def _request(self, path: str, body: bytes) -> tuple[int, bytes]:
+        """Blocking POST on a pooled connection (runs in a worker thread)."""
+        while True:
+            try:
+                conn = self._idle.pop()
+                reused = True
+            except IndexError:
+                conn = self._connect()
+                reused = False
+            try:
+                conn.request("POST", path, body, self._headers)
+                response = conn.getresponse()
+                data = response.read()
+            except _STALE:
+                conn.close()
+                if reused:
+                    # The server closed the idle connection; retry on another
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._idle.append(conn)
+            return response.status, data
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._https:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self.timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    async def close(self) -> None:
+        """Close the pooled connections and forget cached results."""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+        self._cache.clear()
+
+
+def _payload(value: Any) -> dict[str, str] | None:
+    """The subscribe payload in an endpoint reply, or None if it has none."""
+    if isinstance(value, (bytes, str)):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return None
+    if not isinstance(value, dict) or not isinstance(value.get("auth"), str):
+        return None
+    payload = {"auth": value["auth"]}
+    channel_data = value.get("channel_data")
+    if channel_data is not None:
+        payload["channel_data"] = (
+            channel_data if isinstance(channel_data, str) else json.dumps(channel_data)
+        )
+    return payload
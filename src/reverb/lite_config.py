@@ -0,0 +1,273 @@
+"""Dependency-free configuration for fast startup on small devices."""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Literal, Union
+
+if TYPE_CHECKING:
+    from .config import ReverbConfig
+
+# Either configuration class; the client only reads attributes both provide
+ClientConfig = Union["ReverbConfig", "LiteConfig"]
+
+ENV_PREFIX = "REVERB_"
+
+# dataclass(slots=True) needs Python 3.10
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Allowed values of the Literal fields, checked in __post_init__
+_CHOICES: dict[str, tuple[str, ...]] = {
+    "scheme": ("ws", "wss"),
+    "dispatch_overflow": ("block", "drop_oldest", "drop_newest", "coalesce"),
+    "dispatch_mode": ("concurrent", "ordered"),
+    "json_codec": ("auto", "json", "orjson", "msgspec", "ujson"),
+}
+
+_TRUE = frozenset({"1", "true", "yes", "on", "y", "t"})
+_FALSE = frozenset({"0", "false", "no", "off", "n", "f"})
+
+
+class Secret:
+    """A string kept out of reprs and logs (the subset of SecretStr the client uses)."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: str) -> None:
+        self._value = value
+
+    def get_secret_value(self) -> str:
+        """The secret itself."""
+        return self._value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Secret) and other._value == self._value
+
+    def __hash__(self) -> int:
+        return hash(self._value)
+
+    def __repr__(self) -> str:
+        return "Secret('**********')" if self._value else "Secret('')"
+
+    def __str__(self) -> str:
+        return "**********" if self._value else ""
+
+
+# Default app_secret; Secret is immutable, so every config can share it
+_NO_SECRET = Secret("")
+
+
+def _parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    raise ValueError(f"Invalid boolean: {value!r}")
+
+
+def _optional(parse: Callable[[str], Any]) -> Callable[[str], Any]:
+    def parse_optional(value: str) -> Any:
+        return None if value.strip().lower() in ("", "none", "null") else parse(value)
+
+    return parse_optional
+
+
+_PARSERS: dict[str, Callable[[str], Any]] = {
+    "int": int,
+    "float": float,
+    "bool": _parse_bool,
+    "int | None": _optional(int),
+    "str | None": _optional(str),
+    "Secret | None": _optional(Secret),
+    "Secret": Secret,
+}
+
+
+def default_config() -> ReverbConfig:
+    """ReverbConfig from the environment, importing pydantic only now."""
+    from .config import ReverbConfig
+
+    return ReverbConfig()  # type: ignore[call-arg]
+
+
+def read_env_file(path: str | os.PathLike[str], prefix: str = ENV_PREFIX) -> dict[str, str]:
+    """
+    Read ``KEY=value`` lines with the given prefix from a .env file.
+
+    Handles comments, blank lines, an ``export`` prefix and single or double
+    quotes; no variable expansion. A missing file yields an empty dict.
+    Keys are matched case-insensitively, as pydantic-settings does.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return {}
+
+    values: dict[str, str] = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[7:].lstrip()
+        key, sep, value = line.partition("=")
+        key = key.strip().upper()
+        if not sep or not key.startswith(prefix):
+            continue
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        elif " #" in value:
+            value = value.split(" #", 1)[0].rstrip()
+        values[key] = value
+    return values
+
+
+@dataclass(**_SLOTS)
+class LiteConfig:
+    """
+    Client configuration without pydantic.
+
+    Same fields, defaults and environment variables as ReverbConfig, but a
+    plain slotted dataclass: importing it and reading the environment take
+    microseconds instead of loading pydantic and pydantic-settings. Values
+    are converted by type and Literal fields are checked; there is no other
+    validation. Build it from the environment with ``from_env()``.
+
+    Example:
+        client = ReverbClient(config=LiteConfig.from_env())
+    """
+
+    # Required settings
+    app_key: str
+    host: str
+
+    # Authorization of private/presence channels: local signing or an endpoint
+    app_secret: Secret = _NO_SECRET
+    auth_endpoint: str | None = None
+    auth_batch_endpoint: str | None = None
+    auth_token: Secret | None = None
+
+    # Optional settings with defaults
+    port: int = 443
+    scheme: Literal["ws", "wss"] = "wss"
+
+    # Protocol settings
+    protocol_version: int = 7
+    client_name: str = "python-reverb"
+    client_version: str = "0.1.0"
+
+    # Reconnection settings
+    reconnect_enabled: bool = True
+    reconnect_delay_min: float = 1.0
+    reconnect_delay_max: float = 30.0
+    reconnect_delay_multiplier: float = 2.0
+    max_reconnect_attempts: int | None = None
+
+    subscribe_timeout: float = 10.0
+    resubscribe_concurrency: int = 64
+
+    # Keepalive settings
+    ping_interval: float = 30.0
+    ping_timeout: float = 10.0
+
+    # Inbound dispatch settings
+    dispatch_workers: int = 8
+    dispatch_queue_size: int = 1000
+    dispatch_overflow: Literal["block", "drop_oldest", "drop_newest", "coalesce"] = "block"
+    handler_threads: int = 4
+    handler_processes: int | None = None
+    dispatch_mode: Literal["concurrent", "ordered"] = "concurrent"
+    channel_queue_size: int = 100
+
+    # Outbound buffering while reconnecting
+    send_buffer_size: int = 1000
+    send_buffer_ttl: float = 30.0
+
+    # Serialization
+    json_codec: Literal["auto", "json", "orjson", "msgspec", "ujson"] = "auto"
+
+    # Metrics
+    metrics_port: int | None = None
+    metrics_host: str = "127.0.0.1"
+
+    # Logging
+    log_level: str = "INFO"
+
+    def __post_init__(self) -> None:
+        if isinstance(self.app_secret, str):
+            self.app_secret = Secret(self.app_secret)
+        if isinstance(self.auth_token, str):
+            self.auth_token = Secret(self.auth_token)
+        for name, choices in _CHOICES.items():
+            if getattr(self, name) not in choices:
+                raise ValueError(f"{name} must be one of {choices}, got {getattr(self, name)!r}")
+
+    @classmethod
+    def from_env(
+        cls,
+        env_file: str | os.PathLike[str] | None = ".env",
+        environ: Mapping[str, str] | None = None,
+        **overrides: Any,
+    ) -> LiteConfig:
+        """
+        Build a config from ``REVERB_*`` variables.
+
+        Precedence matches ReverbConfig: keyword arguments, then environment
+        variables, then the .env file, then defaults.
+
+        Args:
+            env_file: .env file to read, or None to skip it
+            environ: Environment to read (default: os.environ)
+            **overrides: Field values that take precedence over the environment
+
+        Raises:
+            ValueError: If a required setting is missing or a value is invalid
+        """
+        values = read_env_file(env_file) if env_file is not None else {}
+        env = os.environ if environ is None else environ
+        for key, value in env.items():
+            upper = key.upper()
+            if upper.startswith(ENV_PREFIX):
+                values[upper] = value
+
+        kwargs: dict[str, Any] = {}
+        for field in fields(cls):
+            if field.name in overrides:
+                kwargs[field.name] = overrides[field.name]
+                continue
+            raw = values.get(ENV_PREFIX + field.name.upper())
+            if raw is None:
+                continue
+            parse = _PARSERS.get(str(field.type))
+            try:
+                kwargs[field.name] = parse(raw) if parse is not None else raw
+            except ValueError as e:
+                raise ValueError(f"Invalid {ENV_PREFIX}{field.name.upper()}: {e}") from None
+
+        missing = [name for name in ("app_key", "host") if name not in kwargs]
+        if missing:
+            names = ", ".join(ENV_PREFIX + name.upper() for name in missing)
+            raise ValueError(f"Missing required settings: {names}")
+        return cls(**kwargs)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None) -> LiteConfig:
+        """A copy with some fields changed (mirrors ReverbConfig.model_copy)."""
+        return dataclasses.replace(self, **(update or {}))
+
+    def build_url(self) -> str:
+        """Construct the WebSocket connection URL."""
+        base = f"{self.scheme}://{self.host}:{self.port}"
+        path = f"/app/{self.app_key}"
+        params = (
+            f"?protocol={self.protocol_version}"
+            f"&client={self.client_name}"
+            f"&version={self.client_version}"
+        )
+        return f"{base}{path}{params}"
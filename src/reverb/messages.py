@@ -2,11 +2,151 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
-from dataclasses import dataclass, field
+from collections.abc import Callable
 from typing import Any
 
 
+class JsonCodec:
+    """
+    JSON codec backed by the standard library.
+
+    Also serves as the base class for the faster optional backends. All codecs
+    accept both ``str`` and ``bytes`` input, so frames can be decoded straight
+    from the websocket without an intermediate ``str()`` conversion.
+    """
+
+    name = "json"
+
+    # Exceptions raised by loads() on malformed input
+    decode_errors: tuple[type[Exception], ...] = (ValueError,)
+
+    def loads(self, raw: str | bytes) -> Any:
+        """Decode a JSON document."""
+        return json.loads(raw)
+
+    def dumps(self, obj: Any) -> str:
+        """Encode an object to a JSON string."""
+        return json.dumps(obj)
+
+    def encode(self, obj: Any) -> str | bytes:
+        """
+        Encode an object in the backend's native output type.
+
+        Used for outbound frames; ``bytes`` output is UTF-8 and is sent as a
+        text frame without being decoded first.
+        """
+        return self.dumps(obj)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads: Callable[[str | bytes], Any] = orjson.loads
+        self._dumps: Callable[[Any], bytes] = orjson.dumps
+
+    def loads(self, raw: str | bytes) -> Any:
+        return self._loads(raw)
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj).decode("utf-8")
+
+    def encode(self, obj: Any) -> str | bytes:
+        return self._dumps(obj)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self.decode_errors = (ValueError, msgspec.DecodeError)
+        self._loads: Callable[[str | bytes], Any] = msgspec.json.Decoder().decode
+        self._dumps: Callable[[Any], bytes] = msgspec.json.Encoder().encode
+
+    def loads(self, raw: str | bytes) -> Any:
+        return self._loads(raw)
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj).decode("utf-8")
+
+    def encode(self, obj: Any) -> str | bytes:
+        return self._dumps(obj)
+
+
+class UjsonCodec(JsonCodec):
+    """JSON codec backed by ujson."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        import ujson
+
+        self._loads: Callable[[str | bytes], Any] = ujson.loads
+        self._dumps: Callable[[Any], str] = ujson.dumps
+
+    def loads(self, raw: str | bytes) -> Any:
+        return self._loads(raw)
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj)
+
+
+# Codec classes by name, in "auto" preference order
+_CODECS: dict[str, type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "ujson": UjsonCodec,
+    "json": JsonCodec,
+}
+
+_codec_cache: dict[str, JsonCodec] = {}
+
+# Codec used when none is passed explicitly
+DEFAULT_CODEC = JsonCodec()
+
+
+def get_codec(name: str = "auto") -> JsonCodec:
+    """
+    Get a JSON codec by name.
+
+    Args:
+        name: One of 'json', 'orjson', 'msgspec', 'ujson', or 'auto' to pick
+            the fastest installed backend (falling back to the stdlib)
+
+    Returns:
+        A shared codec instance
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the requested backend is not installed
+    """
+    if name in _codec_cache:
+        return _codec_cache[name]
+
+    if name == "auto":
+        for candidate in _CODECS:
+            if candidate == "json" or importlib.util.find_spec(candidate) is not None:
+                codec = get_codec(candidate)
+                break
+    elif name in _CODECS:
+        codec = _CODECS[name]()
+    else:
+        raise ValueError(f"Unknown JSON codec: {name!r}")
+
+    _codec_cache[name] = codec
+    return codec
+
+
 class Events:
     """Pusher protocol event names."""
 
@@ -23,6 +163,8 @@ class Events:
     # Presence events
     MEMBER_ADDED = "pusher_internal:member_added"
     MEMBER_REMOVED = "pusher_internal:member_removed"
+    # Raised by the client, not the server: a MemberChange for each membership change
+    MEMBERS_CHANGED = "reverb:members_changed"
 
     # Keepalive events
     PING = "pusher:ping"
@@ -32,33 +174,144 @@ class Events:
     SIGNIN = "pusher:signin"
 
 
-@dataclass
+class NameTable:
+    """
+    Intern table for event and channel names.
+
+    Names are registered when channels are subscribed and handlers are bound.
+    Parsed messages swap their freshly decoded ``event``/``channel`` strings for
+    the registered instance, so the per-frame copies are freed right away and
+    handler dict lookups hit identity-equal keys. Unknown names pass through
+    unchanged. Each registration is counted and undone by release() when the
+    channel is unsubscribed or the handler unbound, so the table only holds
+    names that are still in use.
+    """
+
+    __slots__ = ("_names", "_refs")
+
+    def __init__(self) -> None:
+        self._names: dict[str, str] = {}
+        self._refs: dict[str, int] = {}
+
+    def intern(self, name: str) -> str:
+        """Register a name and return its canonical instance."""
+        name = self._names.setdefault(name, name)
+        self._refs[name] = self._refs.get(name, 0) + 1
+        return name
+
+    def release(self, name: str, count: int = 1) -> None:
+        """Drop registrations of a name, forgetting it once none are left."""
+        refs = self._refs.get(name)
+        if refs is None or count <= 0:
+            return
+        if refs > count:
+            self._refs[name] = refs - count
+        else:
+            del self._refs[name]
+            del self._names[name]
+
+    def get(self, name: str) -> str:
+        """Return the canonical instance of a name, or the name itself if unregistered."""
+        return self._names.get(name, name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+# Process-wide name table used by Message.from_json, seeded with protocol events
+# (registered once here and never released)
+names = NameTable()
+for _attr, _value in vars(Events).items():
+    if not _attr.startswith("_"):
+        names.intern(_value)
+
+
+_MISSING: Any = object()
+
+
 class Message:
-    """Base message structure for Pusher protocol."""
+    """
+    Base message structure for Pusher protocol.
+
+    Messages parsed from the server keep a double-encoded ``data`` string
+    undecoded until ``data`` is first read, so frames routed on
+    ``event``/``channel`` alone (or dropped for lack of handlers) never pay
+    for the inner decode. The decoded value is cached.
+
+    Instances are slotted (no per-instance ``__dict__``) and carry interned
+    ``event``/``channel`` strings when those names are registered in ``names``.
+    """
+
+    __slots__ = ("_codec", "_data", "_raw_data", "channel", "event", "received_at")
+
+    def __init__(self, event: str, data: Any = _MISSING, channel: str | None = None) -> None:
+        self.event = event
+        self.channel = channel
+        self._data: Any = {} if data is _MISSING else data
+        # Undecoded inner payload and the codec to decode it with
+        self._raw_data: str | None = None
+        self._codec: JsonCodec = DEFAULT_CODEC
+        # Monotonic time the frame was read from the socket (0.0 if built locally)
+        self.received_at = 0.0
+
+    @property
+    def data(self) -> Any:
+        """Event payload, decoded on first access."""
+        raw = self._raw_data
+        if raw is not None:
+            self._raw_data = None
+            try:
+                self._data = self._codec.loads(raw)
+            except self._codec.decode_errors:
+                self._data = raw  # Keep as string if not valid JSON
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+        self._raw_data = None
+
+    @property
+    def is_decoded(self) -> bool:
+        """Whether the data payload has been decoded (or never needed decoding)."""
+        return self._raw_data is None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Message):
+            return NotImplemented
+        return (self.event, self.channel, self.data) == (other.event, other.channel, other.data)
 
-    event: str
-    data: Any = field(default_factory=dict)
-    channel: str | None = None
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Message(event={self.event!r}, data={self.data!r}, channel={self.channel!r})"
 
     @classmethod
-    def from_json(cls, raw: str) -> "Message":
-        """Parse JSON message from server."""
-        parsed = json.loads(raw)
-        event = parsed.get("event", "")
+    def from_json(cls, raw: str | bytes, codec: JsonCodec | None = None) -> Message:
+        """Parse JSON message from server (text or raw UTF-8 bytes)."""
+        codec = codec or DEFAULT_CODEC
+        parsed = codec.loads(raw)
         channel = parsed.get("channel")
+        message = cls(
+            names.get(parsed.get("event", "")),
+            channel=names.get(channel) if channel is not None else None,
+        )
 
-        # Data may be double-encoded JSON string
+        # Data may be double-encoded JSON string; decoding is deferred
         data = parsed.get("data", {})
         if isinstance(data, str):
-            try:
-                data = json.loads(data)
-            except json.JSONDecodeError:
-                pass  # Keep as string if not valid JSON
+            message._raw_data = data
+            message._codec = codec
+        else:
+            message._data = data
 
-        return cls(event=event, data=data, channel=channel)
+        return message
 
-    def to_json(self) -> str:
-        """Serialize to JSON for sending."""
+    def _envelope(self, codec: JsonCodec) -> dict[str, Any]:
+        """Build the outbound frame dict with the data field pre-encoded."""
         msg: dict[str, Any] = {"event": self.event}
 
         if self.channel:
@@ -66,11 +319,21 @@ class Message:
 
         # Data should be JSON-encoded string for protocol compliance
         if isinstance(self.data, (dict, list)):
-            msg["data"] = json.dumps(self.data)
+            msg["data"] = codec.dumps(self.data)
         else:
             msg["data"] = self.data
 
-        return json.dumps(msg)
+        return msg
+
+    def to_json(self, codec: JsonCodec | None = None) -> str:
+        """Serialize to JSON for sending."""
+        codec = codec or DEFAULT_CODEC
+        return codec.dumps(self._envelope(codec))
+
+    def encode(self, codec: JsonCodec | None = None) -> str | bytes:
+        """Serialize to the codec's native frame type (``bytes`` are UTF-8 text)."""
+        codec = codec or DEFAULT_CODEC
+        return codec.encode(self._envelope(codec))
 
 
 class Messages:
@@ -95,6 +358,11 @@ class Messages:
         """Create unsubscription message."""
         return Message(event=Events.UNSUBSCRIBE, data={"channel": channel})
 
+    @staticmethod
+    def ping() -> Message:
+        """Create ping message."""
+        return Message(event=Events.PING, data={})
+
     @staticmethod
     def pong() -> Message:
         """Create pong message."""
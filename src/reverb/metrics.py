@@ -0,0 +1,292 @@
+"""Lightweight in-process metrics: counters, gauges and histograms."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Callable
+
+
+class Counter:
+    """Monotonically increasing count."""
+
+    __slots__ = ("description", "name", "value")
+
+    def __init__(self, name: str = "", description: str = "") -> None:
+        self.name = name
+        self.description = description
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """Increase the count."""
+        self.value += amount
+
+
+class Gauge:
+    """
+    Point-in-time value.
+
+    Either set explicitly or computed on read from a callback, which keeps
+    values such as queue depth free on the hot path.
+    """
+
+    __slots__ = ("_fn", "_value", "description", "name")
+
+    def __init__(
+        self,
+        name: str = "",
+        description: str = "",
+        fn: Callable[[], float] | None = None,
+    ) -> None:
+        self.name = name
+        self.description = description
+        self._value = 0.0
+        self._fn = fn
+
+    @property
+    def value(self) -> float:
+        """Current value."""
+        if self._fn is not None:
+            return self._fn()
+        return self._value
+
+    def set(self, value: float) -> None:
+        """Set the value."""
+        self._value = value
+
+
+class Histogram:
+    """
+    Distribution of observed values with HDR-style log-linear buckets.
+
+    Each power of two is split into ``_SUB_BUCKETS`` equal sub-buckets, so a
+    reported percentile is within 1/8 (12.5%) of the true value across the whole
+    range, while recording is a frexp and a dict increment. Values at or below
+    ``_LOWEST`` (1 microsecond, for durations in seconds) share the first bucket.
+
+    With ``window`` set, only the most recent ``window`` observations count:
+    the oldest one is removed from its bucket as each new one arrives.
+    """
+
+    __slots__ = ("_buckets", "_recent", "count", "description", "name", "sum", "window")
+
+    _SUB_BUCKETS = 8
+    _LOWEST = 1e-6
+
+    def __init__(self, name: str = "", description: str = "", window: int | None = None) -> None:
+        self.name = name
+        self.description = description
+        self.window = window
+        self.count = 0
+        self.sum = 0.0
+        self._buckets: dict[int, int] = {}
+        self._recent: deque[tuple[int, float]] | None = deque() if window else None
+
+    @classmethod
+    def _index(cls, value: float) -> int:
+        if value <= cls._LOWEST:
+            return 0
+        mantissa, exponent = math.frexp(value / cls._LOWEST)  # mantissa in [0.5, 1)
+        return exponent * cls._SUB_BUCKETS + int((mantissa - 0.5) * 2 * cls._SUB_BUCKETS)
+
+    @classmethod
+    def _upper_bound(cls, index: int) -> float:
+        if index == 0:
+            return cls._LOWEST
+        exponent, sub = divmod(index, cls._SUB_BUCKETS)
+        return cls._LOWEST * math.ldexp(0.5 + (sub + 1) / (2 * cls._SUB_BUCKETS), exponent)
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        index = self._index(value)
+        buckets = self._buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+
+        recent = self._recent
+        if recent is not None:
+            recent.append((index, value))
+            if len(recent) > self.window:  # type: ignore[operator]
+                old_index, old_value = recent.popleft()
+                remaining = buckets[old_index] - 1
+                if remaining:
+                    buckets[old_index] = remaining
+                else:
+                    del buckets[old_index]
+                self.count -= 1
+                self.sum -= old_value
+
+    def percentile(self, q: float) -> float:
+        """
+        Approximate value below which ``q`` percent of observations fall.
+
+        Args:
+            q: Percentile, 0-100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, or 0.0 if empty
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return self._upper_bound(index)
+        return self._upper_bound(max(self._buckets))
+
+    @property
+    def mean(self) -> float:
+        """Mean of the observations, or 0.0 if empty."""
+        return self.sum / self.count if self.count else 0.0
+
+    def snapshot(self) -> dict[str, float]:
+        """Count, sum, mean and common percentiles."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.percentile(100),
+        }
+
+
+class HistogramFamily:
+    """
+    Histograms of one measurement split by a label (``event``, ``handler``).
+
+    Series are created on first use. Past ``max_series`` distinct label
+    values, new values share an ``_other`` series, so label values taken from
+    the network cannot grow memory without bound.
+    """
+
+    __slots__ = ("_series", "description", "label", "max_series", "name")
+
+    OTHER = "_other"
+
+    def __init__(
+        self, name: str, description: str = "", label: str = "name", max_series: int = 1000
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.label = label
+        self.max_series = max_series
+        self._series: dict[str, Histogram] = {}
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+    def labels(self, value: str) -> Histogram:
+        """The histogram for one label value."""
+        histogram = self._series.get(value)
+        if histogram is None:
+            if len(self._series) >= self.max_series:
+                value = self.OTHER
+                histogram = self._series.get(value)
+            if histogram is None:
+                histogram = self._series[value] = Histogram(self.name, self.description)
+        return histogram
+
+    def items(self) -> list[tuple[str, Histogram]]:
+        """(label value, histogram) pairs."""
+        return list(self._series.items())
+
+
+class MetricsRegistry:
+    """
+    Named collection of metrics.
+
+    Metrics are created on first use and shared afterwards, so components can
+    look them up by name without coordinating.
+    """
+
+    def __init__(self) -> None:
+        self._counters: dict[str, Counter] = {}
+        self._gauges: dict[str, Gauge] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._families: dict[str, HistogramFamily] = {}
+
+    def counter(self, name: str, description: str = "") -> Counter:
+        """Get or create a counter."""
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = self._counters[name] = Counter(name, description)
+        return counter
+
+    def gauge(
+        self,
+        name: str,
+        description: str = "",
+        fn: Callable[[], float] | None = None,
+    ) -> Gauge:
+        """Get or create a gauge. A callback replaces any previous one."""
+        gauge = self._gauges.get(name)
+        if gauge is None:
+            gauge = self._gauges[name] = Gauge(name, description, fn)
+        elif fn is not None:
+            gauge._fn = fn
+        return gauge
+
+    def histogram(self, name: str, description: str = "", window: int | None = None) -> Histogram:
+        """Get or create a histogram."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram(name, description, window)
+        return histogram
+
+    def histogram_family(
+        self, name: str, description: str = "", label: str = "name", max_series: int = 1000
+    ) -> HistogramFamily:
+        """Get or create a labelled histogram family."""
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = HistogramFamily(name, description, label, max_series)
+        return family
+
+    @property
+    def counters(self) -> list[Counter]:
+        """All counters."""
+        return list(self._counters.values())
+
+    @property
+    def gauges(self) -> list[Gauge]:
+        """All gauges."""
+        return list(self._gauges.values())
+
+    @property
+    def histograms(self) -> list[Histogram]:
+        """All unlabelled histograms."""
+        return list(self._histograms.values())
+
+    @property
+    def families(self) -> list[HistogramFamily]:
+        """All labelled histogram families."""
+        return list(self._families.values())
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Current value of every metric, keyed by name.
+
+        Histograms contribute ``<name>_count``, ``<name>_sum``, ``<name>_mean``,
+        ``<name>_p50``, ``<name>_p90``, ``<name>_p99`` and ``<name>_max``.
+        Histogram families contribute the same keys per series, suffixed with
+        the label, e.g. ``event_handler_seconds_p99{event="status"}``.
+        """
+        values: dict[str, float] = {}
+        for name, counter in self._counters.items():
+            values[name] = counter.value
+        for name, gauge in self._gauges.items():
+            values[name] = gauge.value
+        for name, histogram in self._histograms.items():
+            for stat, value in histogram.snapshot().items():
+                values[f"{name}_{stat}"] = value
+        for name, family in self._families.items():
+            for label_value, histogram in family.items():
+                suffix = f'{{{family.label}="{label_value}"}}'
+                for stat, value in histogram.snapshot().items():
+                    values[f"{name}_{stat}{suffix}"] = value
+        return values
@@ -0,0 +1,195 @@
+"""Outbound message queue shared by senders and the connection's writer task."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+from .metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from .messages import Message
+
+
+class Outbound:
+    """A queued outbound message."""
+
+    __slots__ = ("expires_at", "frame", "future", "key", "message")
+
+    def __init__(
+        self,
+        message: Message,
+        frame: str | bytes,
+        expires_at: float,
+        key: Hashable | None = None,
+        future: asyncio.Future[None] | None = None,
+    ) -> None:
+        self.message = message
+        # Encoded by the sender, so a message that cannot be encoded never gets queued
+        self.frame = frame
+        # Monotonic time after which the message is no longer worth sending
+        self.expires_at = expires_at
+        # Coalescing key; a newer message with the same key replaces this one
+        self.key = key
+        # Resolved once written (protocol frames only)
+        self.future = future
+
+
+class Outbox:
+    """
+    Outbound messages waiting for the writer.
+
+    Two FIFOs: protocol frames (subscribe, pong, ...) always go first and are
+    only accepted while a socket is up; their senders await the write.
+    Client events go into the data FIFO, which is bounded and survives
+    reconnects. Entries there expire after ``ttl`` seconds, and an entry
+    pushed with a coalescing key replaces a still-queued entry with the same
+    key ("latest value wins").
+    """
+
+    def __init__(self, size: int, ttl: float, metrics: MetricsRegistry) -> None:
+        # Room for at least one message, so sends work with buffering disabled
+        self.size = max(1, size)
+        self.ttl = ttl
+        self._control: deque[Outbound] = deque()
+        self._data: deque[Outbound] = deque()
+        self._keyed: dict[Hashable, Outbound] = {}
+        # Set when there is something for the writer to look at
+        self.wakeup = asyncio.Event()
+        # Set when the data FIFO has room
+        self._space = asyncio.Event()
+        self._space.set()
+
+        self._buffered = metrics.counter(
+            "send_buffered_total", "Outbound messages buffered while disconnected"
+        )
+        self._expired = metrics.counter(
+            "send_expired_total", "Buffered outbound messages discarded after their TTL"
+        )
+        self._dropped = metrics.counter(
+            "send_dropped_total", "Buffered outbound messages discarded because the buffer was full"
+        )
+        self._coalesced = metrics.counter(
+            "send_coalesced_total", "Outbound messages replaced by a newer one with the same key"
+        )
+        metrics.gauge("send_buffer_depth", "Outbound messages waiting to be written", self.__len__)
+
+    def __len__(self) -> int:
+        return len(self._control) + len(self._data)
+
+    def push_control(self, message: Message, frame: str | bytes) -> asyncio.Future[None]:
+        """Queue a protocol frame; the returned future resolves once it is written."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._control.append(Outbound(message, frame, float("inf"), future=future))
+        self.wakeup.set()
+        return future
+
+    async def push(
+        self,
+        message: Message,
+        frame: str | bytes,
+        *,
+        key: Hashable | None = None,
+        buffering: bool = False,
+    ) -> None:
+        """
+        Queue a client event.
+
+        Args:
+            message: Message to send
+            frame: The message encoded for the wire
+            key: Coalescing key; replaces a queued message with the same key
+            buffering: True while the connection is down. A full queue then
+                evicts its oldest entry; otherwise the sender waits for room.
+        """
+        if key is not None:
+            queued = self._keyed.get(key)
+            if queued is not None:
+                queued.message = message
+                queued.frame = frame
+                queued.expires_at = time.monotonic() + self.ttl
+                self._coalesced.inc()
+                return
+
+        data = self._data
+        if len(data) >= self.size:
+            if buffering:
+                self._discard(data.popleft())
+                self._dropped.inc()
+            else:
+                while len(data) >= self.size:
+                    self._space.clear()
+                    await self._space.wait()
+
+        entry = Outbound(message, frame, time.monotonic() + self.ttl, key)
+        data.append(entry)
+        if key is not None:
+            self._keyed[key] = entry
+        if buffering:
+            self._buffered.inc()
+        self.wakeup.set()
+
+    def take(self, limit: int, include_data: bool) -> list[Outbound]:
+        """
+        Remove and return up to ``limit`` entries for writing.
+
+        Protocol frames come first; client events only if ``include_data``.
+        Expired client events are discarded on the way.
+        """
+        batch: list[Outbound] = []
+        control = self._control
+        while control and len(batch) < limit:
+            batch.append(control.popleft())
+
+        if include_data:
+            data = self._data
+            now = time.monotonic()
+            while data and len(batch) < limit:
+                entry = data.popleft()
+                self._discard(entry)
+                if entry.expires_at < now:
+                    self._expired.inc()
+                    continue
+                batch.append(entry)
+            if len(data) < self.size:
+                self._space.set()
+
+        return batch
+
+    def restore(self, entries: list[Outbound]) -> None:
+        """Put unwritten client events back at the head, in their original order."""
+        for entry in reversed(entries):
+            if entry.future is not None:
+                continue
+            if entry.key is not None:
+                if entry.key in self._keyed:
+                    # A newer value was queued meanwhile
+                    self._coalesced.inc()
+                    continue
+                self._keyed[entry.key] = entry
+            self._data.appendleft(entry)
+
+    def fail_control(self, exc: BaseException) -> None:
+        """Fail every queued protocol frame (the socket they were meant for is gone)."""
+        while self._control:
+            future = self._control.popleft().future
+            if future is not None and not future.done():
+                future.set_exception(exc)
+
+    def has_work(self, include_data: bool) -> bool:
+        """Whether take() would return anything."""
+        return bool(self._control) or (include_data and bool(self._data))
+
+    def clear(self) -> None:
+        """Drop all queued client events."""
+        self._data.clear()
+        self._keyed.clear()
+        self._space.set()
+
+    def _discard(self, entry: Outbound) -> None:
+        """Forget an entry's coalescing key if it still points at the entry."""
+        if entry.key is not None and self._keyed.get(entry.key) is entry:
+            del self._keyed[entry.key]
@@ -0,0 +1,491 @@
+"""Connection pool that shards channels across several WebSocket connections."""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import hashlib
+import logging
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from .channels import Channel
+from .client import ReverbClient
+from .connection import ConnectionState
+from .exceptions import ConnectionError
+from .executors import ExecutorOption
+from .lite_config import ClientConfig, default_config
+from .metrics import MetricsRegistry
+from .types import EventHandler, SyncEventHandler
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(key: str) -> int:
+    """Stable 64-bit hash (the builtin hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring mapping keys to node ids.
+
+    Each node is placed on the ring at ``replicas`` points, so keys spread
+    evenly and removing a node only moves the keys that were on it.
+    """
+
+    def __init__(self, replicas: int = 100) -> None:
+        self.replicas = replicas
+        self._points: list[int] = []
+        self._owners: dict[int, int] = {}
+        self._nodes: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._nodes
+
+    def add(self, node: int) -> None:
+        """Add a node (no-op if present)."""
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for i in range(self.replicas):
+            point = _hash(f"{node}:{i}")
+            self._owners[point] = node
+            bisect.insort(self._points, point)
+
+    def remove(self, node: int) -> None:
+        """Remove a node (no-op if absent)."""
+        if node not in self._nodes:
+            return
+        self._nodes.discard(node)
+        for i in range(self.replicas):
+            point = _hash(f"{node}:{i}")
+            if self._owners.get(point) == node:
+                del self._owners[point]
+                self._points.pop(bisect.bisect_left(self._points, point))
+
+    def get(self, key: str) -> int | None:
+        """Node owning a key, or None if the ring is empty."""
+        if not self._points:
+            return None
+        i = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._owners[self._points[i]]
+
+
+def _latest_option(events: bool | str | Iterable[str]) -> bool | tuple[str, ...]:
+    """A latest_only argument in a form that can be kept and passed again."""
+    if isinstance(events, bool):
+        return events
+    return (events,) if isinstance(events, str) else tuple(events)
+
+
+class PooledChannel:
+    """
+    Channel handle returned by ReverbPool.
+
+    The underlying Channel may move to another connection when the pool
+    rebalances; bindings and the latest-value setting are kept here and
+    re-applied to the new Channel, so the handle stays valid. Other
+    attributes (``members``, ``me``, ...) are read from the current Channel.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        user_data: dict[str, Any] | None,
+        latest_only: bool | Iterable[str] = False,
+    ) -> None:
+        self._name = name
+        self._user_data = user_data
+        self._channel: Channel | None = None
+        self._member: int | None = None
+        self._handlers: list[tuple[str, EventHandler | SyncEventHandler, dict[str, Any]]] = []
+        self._latest_only = _latest_option(latest_only)
+
+    @property
+    def name(self) -> str:
+        """Channel name."""
+        return self._name
+
+    @property
+    def is_subscribed(self) -> bool:
+        """Whether currently subscribed on some connection."""
+        return self._channel is not None and self._channel.is_subscribed
+
+    def bind(
+        self,
+        event: str,
+        handler: EventHandler | SyncEventHandler,
+        *,
+        executor: ExecutorOption | None = None,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        concurrent: bool = False,
+    ) -> PooledChannel:
+        """Bind an event handler (see Channel.bind). Returns self for chaining."""
+        options: dict[str, Any] = {
+            "executor": executor,
+            "concurrency": concurrency,
+            "timeout": timeout,
+            "concurrent": concurrent,
+        }
+        self._handlers.append((event, handler, options))
+        if self._channel is not None:
+            self._channel.bind(event, handler, **options)
+        return self
+
+    def unbind(self, event: str, handler: EventHandler | None = None) -> PooledChannel:
+        """Remove event handler(s). Returns self for chaining."""
+        self._handlers = [
+            entry
+            for entry in self._handlers
+            if not (entry[0] == event and handler in (None, entry[1]))
+        ]
+        if self._channel is not None:
+            self._channel.unbind(event, handler)
+        return self
+
+    def latest_only(self, events: bool | str | Iterable[str] = True) -> PooledChannel:
+        """Deliver only the latest value of events (see Channel.latest_only)."""
+        self._latest_only = _latest_option(events)
+        if self._channel is not None:
+            self._channel.latest_only(self._latest_only)
+        return self
+
+    async def trigger(self, event: str, data: Any, *, coalesce: bool = False) -> None:
+        """Trigger a client event on this channel."""
+        if self._channel is None:
+            raise RuntimeError(f"Cannot trigger event on unsubscribed channel '{self._name}'")
+        await self._channel.trigger(event, data, coalesce=coalesce)
+
+    def _attach(self, member: int, channel: Channel) -> None:
+        """Point the handle at a (new) Channel and re-apply the bindings."""
+        self._member = member
+        self._channel = channel
+        for event, handler, options in self._handlers:
+            channel.bind(event, handler, **options)
+
+    def __getattr__(self, name: str) -> Any:
+        channel = self.__dict__.get("_channel")
+        if channel is None or name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(channel, name)
+
+
+class ReverbPool:
+    """
+    N client connections presented as one client.
+
+    Channels are assigned to connections by consistent hashing of the channel
+    name, so each socket (and its receive loop) carries roughly 1/N of the
+    channels. When a connection drops, its channels move to the remaining
+    connections until it is back, then move home again; only the affected
+    channels move. ``hosts`` spreads the connections over several server nodes.
+
+    Example:
+        async with ReverbPool(config=config, size=4) as pool:
+            channel = await pool.subscribe("device.1")
+            channel.bind("status", handler)
+            await pool.listen()
+    """
+
+    def __init__(
+        self,
+        config: ClientConfig | None = None,
+        size: int = 4,
+        *,
+        hosts: Sequence[str] | None = None,
+        replicas: int = 100,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            config: Shared configuration (default: from environment)
+            size: Number of connections
+            hosts: Optional server hosts, assigned to connections round-robin
+            replicas: Points per connection on the hash ring
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self._config = config if config is not None else default_config()
+
+        self._members: list[ReverbClient] = []
+        for i in range(size):
+            member_config = self._config
+            if hosts:
+                member_config = self._config.model_copy(update={"host": hosts[i % len(hosts)]})
+            self._members.append(ReverbClient(config=member_config))
+
+        self._ring = HashRing(replicas)
+        self._channels: dict[str, PooledChannel] = {}
+        self._rebalance_lock = asyncio.Lock()
+        self._watchers: list[asyncio.Task[None]] = []
+        self._all_down = asyncio.Event()
+
+        self._metrics = MetricsRegistry()
+        self._rebalances = self._metrics.counter(
+            "pool_rebalances_total", "Times channels were reassigned after a membership change"
+        )
+        self._migrations = self._metrics.counter(
+            "pool_channel_migrations_total", "Channels moved to another connection"
+        )
+        self._metrics.gauge(
+            "pool_connections_live", "Connections on the hash ring", self._ring.__len__
+        )
+
+    @property
+    def clients(self) -> list[ReverbClient]:
+        """The member clients, one per connection."""
+        return list(self._members)
+
+    @property
+    def channels(self) -> dict[str, PooledChannel]:
+        """Dict of subscribed channels by name."""
+        return self._channels.copy()
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether at least one connection is up."""
+        return any(member.is_connected for member in self._members)
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Pool-level metrics; per-connection metrics are on each client."""
+        return self._metrics
+
+    def client_for(self, channel_name: str) -> ReverbClient | None:
+        """The connection a channel is (or would be) assigned to."""
+        pooled = self._channels.get(channel_name)
+        if pooled is not None and pooled._member is not None:
+            return self._members[pooled._member]
+        member = self._ring.get(channel_name)
+        return self._members[member] if member is not None else None
+
+    async def connect(self) -> None:
+        """
+        Connect all members concurrently.
+
+        Raises:
+            The first connection error, if no member could connect
+        """
+        results = await asyncio.gather(
+            *(member.connect() for member in self._members), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logger.error(f"Pool connection {i} failed to connect: {result}")
+            else:
+                self._ring.add(i)
+        if len(errors) == len(self._members):
+            raise errors[0]
+
+        self._watchers = [asyncio.create_task(self._watch(i)) for i in range(len(self._members))]
+
+    async def disconnect(self) -> None:
+        """Close every connection."""
+        for task in self._watchers:
+            task.cancel()
+        await asyncio.gather(*self._watchers, return_exceptions=True)
+        self._watchers = []
+        await asyncio.gather(*(member.disconnect() for member in self._members))
+        for node in range(len(self._members)):
+            self._ring.remove(node)
+        self._channels.clear()
+        self._all_down.set()
+
+    async def subscribe(
+        self,
+        channel_name: str,
+        user_data: dict[str, Any] | None = None,
+        *,
+        wait: bool = False,
+        timeout: float | None = None,
+        latest_only: bool | Iterable[str] = False,
+    ) -> PooledChannel:
+        """
+        Subscribe to a channel on the connection that owns it.
+
+        Args:
+            channel_name: Name of the channel to subscribe to
+            user_data: User data for presence channels
+            wait: Wait until the server confirms the subscription
+            timeout: Seconds to wait for the confirmation
+            latest_only: Latest-value delivery (see ReverbClient.subscribe)
+
+        Returns:
+            A PooledChannel handle that survives rebalancing
+        """
+        pooled = self._channels.get(channel_name)
+        if pooled is not None:
+            return pooled
+
+        member = self._ring.get(channel_name)
+        if member is None:
+            raise ConnectionError("No pool connection is available")
+
+        pooled = PooledChannel(channel_name, user_data, latest_only)
+        channel = await self._members[member].subscribe(
+            channel_name, user_data, wait=wait, timeout=timeout, latest_only=pooled._latest_only
+        )
+        pooled._attach(member, channel)
+        self._channels[channel_name] = pooled
+        return pooled
+
+    async def subscribe_many(
+        self,
+        channel_names: Iterable[str],
+        user_data: dict[str, Any] | None = None,
+        *,
+        wait: bool = True,
+        timeout: float | None = None,
+        latest_only: bool | Iterable[str] = False,
+    ) -> list[PooledChannel]:
+        """
+        Subscribe to several channels, pipelined per connection.
+
+        Returns:
+            The PooledChannel handles, in the order given
+        """
+        names = list(dict.fromkeys(channel_names))
+        latest_only = _latest_option(latest_only)
+        groups: dict[int, list[str]] = {}
+        for name in names:
+            if name in self._channels:
+                continue
+            member = self._ring.get(name)
+            if member is None:
+                raise ConnectionError("No pool connection is available")
+            groups.setdefault(member, []).append(name)
+
+        async def subscribe_group(member: int, group: list[str]) -> None:
+            channels = await self._members[member].subscribe_many(
+                group, user_data, wait=wait, timeout=timeout, latest_only=latest_only
+            )
+            for channel in channels:
+                pooled = PooledChannel(channel.name, user_data, latest_only)
+                pooled._attach(member, channel)
+                self._channels[channel.name] = pooled
+
+        await asyncio.gather(*(subscribe_group(m, g) for m, g in groups.items()))
+        return [self._channels[name] for name in names]
+
+    async def unsubscribe(self, channel_name: str) -> None:
+        """Unsubscribe from a channel."""
+        pooled = self._channels.pop(channel_name, None)
+        if pooled is None or pooled._member is None:
+            return
+        await self._members[pooled._member].unsubscribe(channel_name)
+
+    def bind(
+        self,
+        event: str,
+        handler: EventHandler | SyncEventHandler,
+        *,
+        channel: str | None = None,
+        executor: ExecutorOption | None = None,
+        concurrency: int | None = None,
+        timeout: float | None = None,
+        concurrent: bool = False,
+    ) -> None:
+        """Bind a global event handler on every connection (see ReverbClient.bind)."""
+        for member in self._members:
+            member.bind(
+                event,
+                handler,
+                channel=channel,
+                executor=executor,
+                concurrency=concurrency,
+                timeout=timeout,
+                concurrent=concurrent,
+            )
+
+    def unbind(
+        self,
+        event: str,
+        handler: EventHandler | None = None,
+        *,
+        channel: str | None = None,
+    ) -> None:
+        """Remove global event handler(s) from every connection."""
+        for member in self._members:
+            member.unbind(event, handler, channel=channel)
+
+    async def listen(self) -> None:
+        """Block until no connection is left (all lost or closed)."""
+        if len(self._ring):
+            await self._all_down.wait()
+
+    async def _watch(self, node: int) -> None:
+        """Follow one member's state and rebalance when it leaves or rejoins."""
+        connection = self._members[node]._connection
+        while True:
+            await connection.wait_for_state(ConnectionState.RECONNECTING, ConnectionState.CLOSED)
+            if node in self._ring:
+                logger.warning(f"Pool connection {node} lost, moving its channels")
+                self._ring.remove(node)
+                if not len(self._ring):
+                    self._all_down.set()
+                await self._rebalance()
+
+            await connection.wait_for_state(ConnectionState.CONNECTED)
+            logger.info(f"Pool connection {node} is back, rebalancing")
+            self._ring.add(node)
+            self._all_down.clear()
+            await self._rebalance()
+
+    async def _rebalance(self) -> None:
+        """Move every channel whose owner changed to its new connection."""
+        async with self._rebalance_lock:
+            moves = []
+            for pooled in self._channels.values():
+                target = self._ring.get(pooled.name)
+                if target is not None and target != pooled._member:
+                    moves.append((pooled, target))
+            if not moves:
+                return
+
+            self._rebalances.inc()
+            limit = asyncio.Semaphore(max(1, self._config.resubscribe_concurrency))
+
+            async def move(pooled: PooledChannel, target: int) -> None:
+                async with limit:
+                    await self._migrate(pooled, target)
+
+            results = await asyncio.gather(
+                *(move(pooled, target) for pooled, target in moves), return_exceptions=True
+            )
+            # One result per move, in order (zip(strict=) needs Python 3.10)
+            for (pooled, _), result in zip(moves, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to move channel '{pooled.name}': {result}")
+
+    async def _migrate(self, pooled: PooledChannel, target: int) -> None:
+        """Subscribe a channel on its new connection, then drop it from the old one."""
+        source = pooled._member
+        channel = await self._members[target].subscribe(
+            pooled.name, pooled._user_data, latest_only=pooled._latest_only
+        )
+        pooled._attach(target, channel)
+        self._migrations.inc()
+
+        if source is not None:
+            old = self._members[source]
+            try:
+                await old.unsubscribe(pooled.name)
+            except ConnectionError:
+                # Socket already gone; just make sure it is not restored on reconnect
+                old._forget_channel(pooled.name)
+
+    async def __aenter__(self) -> ReverbPool:  # noqa: PYI034
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        await self.disconnect()
@@ -0,0 +1,363 @@
+"""Presence channel member tracking with incremental change events."""
+
+from __future__ import annotations
+
+import bisect
+import sys
+from collections.abc import Collection, Hashable, Iterable, Iterator, Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple, Union, cast
+
+UserInfo = Mapping[str, Any]
+
+# Shared by every member without user_info
+_EMPTY: UserInfo = MappingProxyType({})
+
+
+class MemberJoined(NamedTuple):
+    """A member joined the channel (member_added)."""
+
+    user_id: str
+    user_info: UserInfo
+    generation: int
+
+
+class MemberLeft(NamedTuple):
+    """A member left the channel (member_removed); ``user_info`` is what they had."""
+
+    user_id: str
+    user_info: UserInfo
+    generation: int
+
+
+class MembersResynced(NamedTuple):
+    """
+    The member list was replaced by a subscription_succeeded snapshot.
+
+    Only the difference from the previous list is reported: members who
+    joined, left or changed ``user_info`` while the client was away. On the
+    first subscription (``initial``) every member is in ``joined``.
+    """
+
+    joined: Mapping[str, UserInfo]
+    left: Mapping[str, UserInfo]
+    updated: Mapping[str, UserInfo]
+    generation: int
+    initial: bool
+
+    def __bool__(self) -> bool:
+        return bool(self.joined or self.left or self.updated)
+
+
+# Built at import time, and Python 3.9 classes do not support |
+MemberChange = Union[MemberJoined, MemberLeft, MembersResynced]  # noqa: UP007
+
+
+def _compact(user_info: Any) -> UserInfo:
+    """
+    User info in a compact form.
+
+    Keys are interned, so the thousands of member dicts in a large room share
+    one copy of each key instead of one per decoded frame, and members
+    without info share a single empty mapping.
+    """
+    if not user_info:
+        return _EMPTY
+    if not isinstance(user_info, dict):
+        # Pusher allows any JSON value; Laravel always sends an object
+        return cast(UserInfo, user_info)
+    intern = sys.intern
+    return {intern(k) if type(k) is str else k: v for k, v in user_info.items()}
+
+
+class MemberPage(NamedTuple):
+    """One page of members from MemberStore.page()."""
+
+    members: list[tuple[str, UserInfo]]
+    # Pass as ``after`` to get the next page; None on the last page
+    next_after: str | None
+    generation: int
+
+
+def _index_key(info: UserInfo, field: str) -> Hashable | None:
+    """The value of an indexed field, or None if the member cannot be indexed by it."""
+    if not isinstance(info, dict) or field not in info:
+        return None
+    value = info[field]
+    return value if isinstance(value, Hashable) else None
+
+
+class MemberStore:
+    """
+    Members of a presence channel, keyed by user_id.
+
+    ``view`` is a live read-only mapping over the store: reading it never
+    copies, and lookups and ``len()`` are O(1). ``generation`` increases with
+    every change, so consumers can tell cheaply whether anything changed
+    since they last looked. The mutating methods return the change as a
+    MemberJoined, MemberLeft or MembersResynced, or None when nothing changed.
+
+    query(), count() and page() select members by ``user_info`` fields
+    (``role="camera"``). A field with an index (add_index()) is answered from
+    the index instead of scanning the roster; the other criteria only filter
+    the index's candidates.
+    """
+
+    __slots__ = ("_generation", "_indexes", "_members", "_sorted", "_synced", "_view")
+
+    def __init__(self, indexes: Iterable[str] = ()) -> None:
+        self._members: dict[str, UserInfo] = {}
+        self._view: Mapping[str, UserInfo] = MappingProxyType(self._members)
+        self._generation = 0
+        self._synced = False
+        # field -> value -> user_ids (a dict as an insertion-ordered set)
+        self._indexes: dict[str, dict[Hashable, dict[str, None]]] = {}
+        # Sorted user_ids for page(), rebuilt after changes
+        self._sorted: list[str] | None = None
+        for field in indexes:
+            self.add_index(field)
+
+    @property
+    def view(self) -> Mapping[str, UserInfo]:
+        """Read-only, live mapping of user_id to user_info."""
+        return self._view
+
+    @property
+    def generation(self) -> int:
+        """Number of changes applied so far."""
+        return self._generation
+
+    @property
+    def indexes(self) -> tuple[str, ...]:
+        """Indexed user_info fields."""
+        return tuple(self._indexes)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, user_id: object) -> bool:
+        return user_id in self._members
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def get(self, user_id: str) -> UserInfo | None:
+        """A member's user_info, or None if they are not in the channel."""
+        return self._members.get(user_id)
+
+    def add_index(self, field: str) -> None:
+        """Index a user_info field for query(), count() and page() (O(n) once)."""
+        if field in self._indexes:
+            return
+        index: dict[Hashable, dict[str, None]] = {}
+        for user_id, info in self._members.items():
+            key = _index_key(info, field)
+            if key is not None:
+                index.setdefault(key, {})[user_id] = None
+        self._indexes[field] = index
+
+    def drop_index(self, field: str) -> None:
+        """Remove a field's index."""
+        self._indexes.pop(field, None)
+
+    def items(self) -> Iterator[tuple[str, UserInfo]]:
+        """Iterate over (user_id, user_info) without copying the roster."""
+        return iter(self._members.items())
+
+    def query(self, **fields: Any) -> Iterator[tuple[str, UserInfo]]:
+        """
+        Iterate over the members whose user_info has all the given field values.
+
+        Members are produced lazily, in join order. The store must not change
+        while iterating (do not await between items); use page() to read a
+        large roster across awaits.
+
+        Example:
+            cameras = [user_id for user_id, _ in store.query(role="camera")]
+        """
+        if not fields:
+            yield from self._members.items()
+            return
+        candidates, rest = self._candidates(fields)
+        members = self._members
+        for user_id in candidates:
+            info = members[user_id]
+            if _matches(info, rest):
+                yield user_id, info
+
+    def count(self, **fields: Any) -> int:
+        """Number of members matching the field values (O(1) for one indexed field)."""
+        if not fields:
+            return len(self._members)
+        candidates, rest = self._candidates(fields)
+        if not rest:
+            return len(candidates)
+        members = self._members
+        return sum(1 for user_id in candidates if _matches(members[user_id], rest))
+
+    def page(self, limit: int = 100, after: str | None = None, **fields: Any) -> MemberPage:
+        """
+        A page of members ordered by user_id, optionally filtered by fields.
+
+        Pages are keyed by the last user_id seen rather than an offset, so
+        members joining or leaving between calls do not shift later pages.
+
+        Args:
+            limit: Maximum members in the page
+            after: ``next_after`` of the previous page (None for the first)
+            **fields: user_info field values to match
+
+        Returns:
+            The members and the cursor for the next page
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        if fields:
+            candidates, rest = self._candidates(fields)
+            ordered = sorted(candidates) if candidates is not self._members else self._ordered()
+        else:
+            rest = {}
+            ordered = self._ordered()
+        start = bisect.bisect_right(ordered, after) if after is not None else 0
+
+        members = self._members
+        found: list[tuple[str, UserInfo]] = []
+        for i in range(start, len(ordered)):
+            user_id = ordered[i]
+            info = members[user_id]
+            if rest and not _matches(info, rest):
+                continue
+            if len(found) == limit:
+                return MemberPage(found, found[-1][0], self._generation)
+            found.append((user_id, info))
+        return MemberPage(found, None, self._generation)
+
+    def _ordered(self) -> list[str]:
+        ordered = self._sorted
+        if ordered is None:
+            ordered = self._sorted = sorted(self._members)
+        return ordered
+
+    def _candidates(self, fields: dict[str, Any]) -> tuple[Collection[str], dict[str, Any]]:
+        """Member ids from the most selective usable index, and the criteria left to check."""
+        best: dict[str, None] | None = None
+        best_field = None
+        for field, value in fields.items():
+            index = self._indexes.get(field)
+            if index is None or not isinstance(value, Hashable):
+                continue
+            ids = index.get(value)
+            if ids is None:
+                return (), {}
+            if best is None or len(ids) < len(best):
+                best, best_field = ids, field
+        if best is None:
+            return self._members, fields
+        rest = {field: value for field, value in fields.items() if field != best_field}
+        return best.keys(), rest
+
+    def _index(self, user_id: str, info: UserInfo) -> None:
+        for field, index in self._indexes.items():
+            key = _index_key(info, field)
+            if key is not None:
+                index.setdefault(key, {})[user_id] = None
+
+    def _unindex(self, user_id: str, info: UserInfo) -> None:
+        for field, index in self._indexes.items():
+            key = _index_key(info, field)
+            if key is not None:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.pop(user_id, None)
+                    if not ids:
+                        del index[key]
+
+    def add(self, user_id: str, user_info: Any = None) -> MemberJoined | None:
+        """Add or update a member; returns the change, or None if nothing changed."""
+        info = _compact(user_info)
+        user_id = str(user_id)
+        current = self._members.get(user_id)
+        if current is not None:
+            if current == info:
+                return None
+            self._unindex(user_id, current)
+        self._members[user_id] = info
+        self._index(user_id, info)
+        self._changed()
+        return MemberJoined(user_id, info, self._generation)
+
+    def remove(self, user_id: str) -> MemberLeft | None:
+        """Remove a member; returns the change, or None if they were not there."""
+        user_id = str(user_id)
+        info = self._members.pop(user_id, None)
+        if info is None:
+            return None
+        self._unindex(user_id, info)
+        self._changed()
+        return MemberLeft(user_id, info, self._generation)
+
+    def resync(self, members: Mapping[str, Any]) -> MembersResynced:
+        """
+        Replace the member list with a snapshot and return the difference.
+
+        The result is falsy if nothing differs (the generation is then left
+        alone); on the first sync after creation or clear() it is marked
+        ``initial``.
+        """
+        old = self._members
+        new = {str(uid): _compact(info) for uid, info in members.items()}
+        if not old:
+            # Nothing to compare against: everyone joined, and the snapshot
+            # itself serves as the diff
+            joined: dict[str, UserInfo] = new
+            left: dict[str, UserInfo] = {}
+            updated: dict[str, UserInfo] = {}
+        else:
+            joined = {uid: info for uid, info in new.items() if uid not in old}
+            left = {uid: info for uid, info in old.items() if uid not in new}
+            updated = {uid: info for uid, info in new.items() if uid in old and old[uid] != info}
+        if self._indexes:
+            for uid, info in left.items():
+                self._unindex(uid, info)
+            for uid, info in updated.items():
+                self._unindex(uid, old[uid])
+        # Swap the contents, not the dict, so existing views stay live
+        old.clear()
+        old.update(new)
+        if self._indexes:
+            for changed in (joined, updated):
+                for uid, info in changed.items():
+                    self._index(uid, info)
+        if joined or left or updated:
+            self._changed()
+        initial = not self._synced
+        self._synced = True
+        return MembersResynced(joined, left, updated, self._generation, initial)
+
+    def clear(self) -> None:
+        """Forget all members; the next resync() is reported as initial."""
+        if self._members:
+            self._changed()
+        self._members.clear()
+        for index in self._indexes.values():
+            index.clear()
+        self._synced = False
+
+    def _changed(self) -> None:
+        self._generation += 1
+        self._sorted = None
+
+
+def _matches(info: UserInfo, fields: Mapping[str, Any]) -> bool:
+    if not fields:
+        return True
+    if not isinstance(info, dict):
+        return False
+    missing = _MISSING
+    for field, value in fields.items():
+        if info.get(field, missing) != value:
+            return False
+    return True
+
+
+_MISSING = object()
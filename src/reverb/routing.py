@@ -0,0 +1,291 @@
+"""Event routing: a compiled handler table with glob pattern bindings."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+from .types import EventHandler
+
+T = TypeVar("T", bound=Hashable)
+
+# Matches any name, whatever its segments (the historical wildcard)
+MATCH_ALL = "*"
+
+# Lookups remembered per router before the cache is reset
+_CACHE_SIZE = 1024
+
+# Channel names remembered by a ChannelRouter (one small tuple each)
+_CHANNEL_CACHE_SIZE = 65536
+
+
+def is_pattern(name: str) -> bool:
+    """Whether a binding name is a glob pattern rather than an exact name."""
+    return "*" in name
+
+
+def _check_pattern(pattern: str) -> list[str]:
+    segments = pattern.split(".")
+    for i, segment in enumerate(segments):
+        if "*" in segment and segment not in ("*", "**"):
+            raise ValueError(f"Invalid pattern '{pattern}': '*' must be a whole segment")
+        if segment == "**" and i != len(segments) - 1:
+            raise ValueError(f"Invalid pattern '{pattern}': '**' must be the last segment")
+    return segments
+
+
+class _Node:
+    __slots__ = ("children", "rest", "star", "terminal")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.star: _Node | None = None
+        # Patterns ending at this node
+        self.terminal: list[int] = []
+        # Patterns ending in '**' at this node (one or more further segments)
+        self.rest: list[int] = []
+
+
+class PatternIndex(Generic[T]):
+    """
+    Trie of dot-separated glob patterns.
+
+    ``*`` matches exactly one segment (``device.*.status`` matches
+    ``device.7.status``); a trailing ``**`` matches one or more segments
+    (``vitals.**`` matches ``vitals.cpu`` and ``vitals.cpu.temp``). Matching
+    walks the name's segments once, following the literal and ``*`` branches,
+    so the cost depends on the name, not on the number of patterns.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._keys: list[T] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, pattern: str, key: T) -> None:
+        """
+        Add a pattern; ``key`` is returned by match() for names it matches.
+
+        Raises:
+            ValueError: If the pattern is malformed
+        """
+        node = self._root
+        segments = _check_pattern(pattern)
+        for segment in segments[:-1]:
+            node = self._child(node, segment)
+        index = len(self._keys)
+        self._keys.append(key)
+        if segments[-1] == "**":
+            node.rest.append(index)
+        else:
+            self._child(node, segments[-1]).terminal.append(index)
+
+    @staticmethod
+    def _child(node: _Node, segment: str) -> _Node:
+        if segment == "*":
+            if node.star is None:
+                node.star = _Node()
+            return node.star
+        child = node.children.get(segment)
+        if child is None:
+            child = node.children[segment] = _Node()
+        return child
+
+    def match(self, name: str) -> list[T]:
+        """Keys of the patterns matching a name, in the order they were added."""
+        if not self._keys:
+            return []
+        found: list[int] = []
+        self._walk(self._root, name.split("."), 0, found)
+        found.sort()
+        return [self._keys[i] for i in found]
+
+    def _walk(self, node: _Node, segments: list[str], i: int, found: list[int]) -> None:
+        if i == len(segments):
+            found.extend(node.terminal)
+            return
+        found.extend(node.rest)
+        child = node.children.get(segments[i])
+        if child is not None:
+            self._walk(child, segments, i + 1, found)
+        if node.star is not None:
+            self._walk(node.star, segments, i + 1, found)
+
+
+class EventRouter:
+    """
+    Handlers bound by event name or pattern, compiled for lookup.
+
+    ``match(event)`` returns a cached tuple of every handler that should see the
+    event, so routing costs one dict lookup and allocates nothing. The pattern
+    index is rebuilt and the cache cleared only by bind() and unbind(). Handlers
+    come back in order of specificity: exact name, then patterns (in bind
+    order), then ``*``.
+    """
+
+    __slots__ = ("_bindings", "_cache", "_index")
+
+    def __init__(self) -> None:
+        self._bindings: dict[str, list[EventHandler]] = {}
+        self._index: PatternIndex[str] | None = None
+        self._cache: dict[str, tuple[EventHandler, ...]] = {}
+
+    @property
+    def bindings(self) -> dict[str, list[EventHandler]]:
+        """Bound handlers by event name or pattern (do not modify)."""
+        return self._bindings
+
+    def bind(self, name: str, handler: EventHandler) -> None:
+        """
+        Add a handler for an event name or pattern.
+
+        Raises:
+            ValueError: If the pattern is malformed
+        """
+        if name != MATCH_ALL and is_pattern(name):
+            _check_pattern(name)
+        handlers = self._bindings.get(name)
+        if handlers is None:
+            self._bindings[name] = [handler]
+        else:
+            handlers.append(handler)
+        self._invalidate(name)
+
+    def unbind(self, name: str, handler: EventHandler | None = None) -> int:
+        """
+        Remove one handler, or all handlers, bound under a name or pattern.
+
+        Returns:
+            Number of handlers removed
+        """
+        handlers = self._bindings.get(name)
+        if handlers is None:
+            return 0
+        bound = len(handlers)
+        if handler is not None:
+            handlers = [h for h in handlers if h != handler]
+        if handlers and handler is not None:
+            self._bindings[name] = handlers
+        else:
+            del self._bindings[name]
+            handlers = []
+        self._invalidate(name)
+        return bound - len(handlers)
+
+    def _invalidate(self, name: str) -> None:
+        self._cache.clear()
+        if name != MATCH_ALL and is_pattern(name):
+            self._index = None
+
+    def match(self, event: str) -> tuple[EventHandler, ...]:
+        """All handlers for an event, most specific first."""
+        handlers = self._cache.get(event)
+        if handlers is None:
+            handlers = self._compile(event)
+            if len(self._cache) >= _CACHE_SIZE:
+                self._cache.clear()
+            self._cache[event] = handlers
+        return handlers
+
+    def _compile(self, event: str) -> tuple[EventHandler, ...]:
+        bindings = self._bindings
+        if not bindings:
+            return ()
+        index = self._index
+        if index is None:
+            index = self._index = PatternIndex()
+            for name in bindings:
+                if name != MATCH_ALL and is_pattern(name):
+                    index.add(name, name)
+
+        handlers: list[EventHandler] = list(bindings.get(event, ()))
+        for pattern in index.match(event):
+            handlers.extend(bindings[pattern])
+        if event != MATCH_ALL:
+            handlers.extend(bindings.get(MATCH_ALL, ()))
+        return tuple(handlers)
+
+
+class ChannelRouter:
+    """
+    Handlers bound to channel-name patterns (``device.*``).
+
+    One EventRouter per pattern holds the handlers, however many concrete
+    channels the pattern covers. A channel name is resolved to its matching
+    routers through a PatternIndex once and then cached, so each message costs
+    a dict lookup for the channel plus the router's own event lookup.
+    """
+
+    __slots__ = ("_cache", "_index", "_routers")
+
+    def __init__(self) -> None:
+        self._routers: dict[str, EventRouter] = {}
+        self._index: PatternIndex[str] | None = None
+        self._cache: dict[str, tuple[EventRouter, ...]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._routers)
+
+    @property
+    def routers(self) -> dict[str, EventRouter]:
+        """Event routers by channel pattern (do not modify)."""
+        return self._routers
+
+    def bind(self, channel: str, event: str, handler: EventHandler) -> None:
+        """
+        Add a handler for an event on every channel matching a pattern.
+
+        Raises:
+            ValueError: If either pattern is malformed
+        """
+        router = self._routers.get(channel)
+        if router is None:
+            if channel != MATCH_ALL and is_pattern(channel):
+                _check_pattern(channel)
+            router = self._routers[channel] = EventRouter()
+            self._index = None
+            self._cache.clear()
+        router.bind(event, handler)
+
+    def unbind(self, channel: str, event: str, handler: EventHandler | None = None) -> int:
+        """
+        Remove handler(s) bound under a channel pattern and event.
+
+        Returns:
+            Number of handlers removed
+        """
+        router = self._routers.get(channel)
+        if router is None:
+            return 0
+        removed = router.unbind(event, handler)
+        if not router.bindings:
+            del self._routers[channel]
+            self._index = None
+            self._cache.clear()
+        return removed
+
+    def match(self, channel: str, event: str) -> tuple[EventHandler, ...]:
+        """Handlers for an event on a channel, in channel-pattern bind order."""
+        routers = self._cache.get(channel)
+        if routers is None:
+            routers = self._resolve(channel)
+            if len(self._cache) >= _CHANNEL_CACHE_SIZE:
+                self._cache.clear()
+            self._cache[channel] = routers
+        if len(routers) == 1:
+            return routers[0].match(event)
+        handlers: tuple[EventHandler, ...] = ()
+        for router in routers:
+            handlers += router.match(event)
+        return handlers
+
+    def _resolve(self, channel: str) -> tuple[EventRouter, ...]:
+        index = self._index
+        if index is None:
+            index = self._index = PatternIndex()
+            for name in self._routers:
+                # '*' alone is the historical match-everything wildcard
+                index.add("**" if name == MATCH_ALL else name, name)
+        return tuple(self._routers[name] for name in index.match(channel))
@@ -0,0 +1,340 @@
+"""Multi-process mode: worker processes that each run a client on a share of the channels."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.synchronize import Event as EventType
+from typing import Any
+
+from .client import ReverbClient
+from .connection import ConnectionState
+from .lite_config import ClientConfig, default_config
+from .metrics import MetricsRegistry
+from .pool import HashRing
+
+logger = logging.getLogger(__name__)
+
+# Called in each worker once its channels are subscribed, to bind handlers
+WorkerSetup = Callable[[ReverbClient], Awaitable[None]]
+
+# How often workers refresh their heartbeat and check for a stop request
+_TICK = 0.25
+
+
+def partition(channels: Iterable[str], workers: int, replicas: int = 100) -> list[list[str]]:
+    """
+    Split channel names into disjoint partitions by consistent hashing.
+
+    A channel always lands in the same partition for a given worker count, in
+    every process, and changing the count only moves a share of the channels.
+
+    Args:
+        channels: Channel names (duplicates are ignored)
+        workers: Number of partitions
+        replicas: Points per partition on the hash ring
+
+    Returns:
+        One list of channel names per worker
+    """
+    ring = HashRing(replicas)
+    for i in range(workers):
+        ring.add(i)
+    parts: list[list[str]] = [[] for _ in range(workers)]
+    for name in dict.fromkeys(channels):
+        parts[ring.get(name)].append(name)  # type: ignore[index]
+    return parts
+
+
+def _worker_main(
+    index: int,
+    channels: list[str],
+    config: ClientConfig,
+    setup: WorkerSetup | None,
+    user_data: dict[str, Any] | None,
+    heartbeat: Synchronized[float],
+    stop: EventType,
+) -> None:
+    """Worker process entry point."""
+    # Ctrl-C reaches the whole process group; the supervisor decides when we stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    clean = asyncio.run(_run_worker(index, channels, config, setup, user_data, heartbeat, stop))
+    if not clean:
+        sys.exit(1)
+
+
+async def _run_worker(
+    index: int,
+    channels: list[str],
+    config: ClientConfig,
+    setup: WorkerSetup | None,
+    user_data: dict[str, Any] | None,
+    heartbeat: Synchronized[float],
+    stop: EventType,
+) -> bool:
+    """
+    Run one worker's client until asked to stop.
+
+    Returns:
+        True if stopped on request, False if the connection closed for good
+    """
+    client = ReverbClient(config=config)
+
+    async def serve() -> None:
+        await client.connect()
+        await client.subscribe_many(channels, user_data, wait=False)
+        if setup is not None:
+            await setup(client)
+        logger.info(f"Worker {index} serving {len(channels)} channel(s)")
+        await client._connection.wait_for_state(ConnectionState.CLOSED)
+
+    async def beat() -> None:
+        # Ticks only while the event loop is responsive, so a handler that blocks
+        # the loop shows up as a stale heartbeat
+        while not stop.is_set():
+            heartbeat.value = time.monotonic()
+            await asyncio.sleep(_TICK)
+
+    serving = asyncio.create_task(serve())
+    beating = asyncio.create_task(beat())
+    try:
+        await asyncio.wait((serving, beating), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        serving.cancel()
+        beating.cancel()
+        await asyncio.gather(serving, beating, return_exceptions=True)
+        await client.disconnect()
+
+    if serving.done() and not serving.cancelled() and serving.exception() is not None:
+        raise serving.exception()  # type: ignore[misc]
+    return stop.is_set()
+
+
+class _Worker:
+    """Supervisor-side record of one worker slot."""
+
+    __slots__ = ("channels", "due_at", "failures", "heartbeat", "index", "process", "started_at")
+
+    def __init__(self, index: int, channels: list[str], heartbeat: Synchronized[float]) -> None:
+        self.index = index
+        self.channels = channels
+        self.process: BaseProcess | None = None
+        self.heartbeat = heartbeat
+        # Consecutive failures, for the restart backoff
+        self.failures = 0
+        self.started_at = 0.0
+        # When a dead worker may be started again
+        self.due_at = 0.0
+
+
+class Supervisor:
+    """
+    Runs N worker processes, each with its own ReverbClient.
+
+    The channels are partitioned across the workers by consistent hashing, so
+    every channel is handled by exactly one process and handlers use all cores.
+    The supervisor watches the workers: a process that exits, or whose
+    heartbeat is older than ``heartbeat_timeout`` (its event loop is stuck), is
+    killed and restarted with exponential backoff.
+
+    ``setup`` and ``config`` are sent to the workers, so with the default
+    ``spawn`` start method ``setup`` must be a module-level function.
+
+    Workers are not daemonic, so their handlers may start processes of their
+    own (``bind(..., executor="process")``). stop() ends them; it is also
+    registered to run at interpreter exit while workers are running.
+
+    Example:
+        async def setup(client: ReverbClient) -> None:
+            for channel in client.channels.values():
+                channel.bind("frame", process_frame)
+
+        if __name__ == "__main__":
+            Supervisor(device_channels, setup, workers=8).run()
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[str],
+        setup: WorkerSetup | None = None,
+        *,
+        workers: int | None = None,
+        config: ClientConfig | None = None,
+        user_data: dict[str, Any] | None = None,
+        heartbeat_timeout: float = 30.0,
+        restart_delay_min: float = 1.0,
+        restart_delay_max: float = 30.0,
+        start_method: str = "spawn",
+    ) -> None:
+        """
+        Initialize the supervisor.
+
+        Args:
+            channels: Channel names to subscribe to, across all workers
+            setup: Async function(client) run in each worker after subscribing
+            workers: Number of processes (default: CPU count)
+            config: Client configuration (default: from environment)
+            user_data: User data for presence channels
+            heartbeat_timeout: Seconds without a heartbeat before a worker is restarted
+            restart_delay_min: Delay before the first restart of a failing worker
+            restart_delay_max: Maximum restart delay
+            start_method: multiprocessing start method
+        """
+        count = workers if workers is not None else (os.cpu_count() or 1)
+        if count < 1:
+            raise ValueError("Need at least one worker")
+
+        self._config = config if config is not None else default_config()
+        self._setup = setup
+        self._user_data = user_data
+        self._heartbeat_timeout = heartbeat_timeout
+        self._restart_delay_min = restart_delay_min
+        self._restart_delay_max = restart_delay_max
+        self._context: BaseContext = multiprocessing.get_context(start_method)
+        self._stop = self._context.Event()
+
+        # Workers without channels would have nothing to do
+        self._workers = [
+            _Worker(i, part, self._context.Value("d", 0.0))
+            for i, part in enumerate(partition(channels, count))
+            if part
+        ]
+
+        self._metrics = MetricsRegistry()
+        self._restarts = self._metrics.counter(
+            "supervisor_restarts_total", "Worker processes restarted after dying or hanging"
+        )
+        self._metrics.gauge(
+            "supervisor_workers_alive", "Worker processes currently running", self._alive
+        )
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Supervisor metrics (restarts, live workers)."""
+        return self._metrics
+
+    @property
+    def partitions(self) -> list[list[str]]:
+        """Channel names handled by each worker."""
+        return [worker.channels for worker in self._workers]
+
+    def _alive(self) -> float:
+        return sum(1 for w in self._workers if w.process is not None and w.process.is_alive())
+
+    def start(self) -> None:
+        """Start all worker processes (call stop() to end them)."""
+        self._stop.clear()
+        # Non-daemonic workers would otherwise keep the interpreter from exiting
+        atexit.register(self.stop)
+        for worker in self._workers:
+            self._spawn(worker)
+
+    def _spawn(self, worker: _Worker) -> None:
+        # A fresh process gets until heartbeat_timeout to start beating
+        worker.heartbeat.value = time.monotonic()
+        process = self._context.Process(  # type: ignore[attr-defined]
+            target=_worker_main,
+            args=(
+                worker.index,
+                worker.channels,
+                self._config,
+                self._setup,
+                self._user_data,
+                worker.heartbeat,
+                self._stop,
+            ),
+            name=f"reverb-worker-{worker.index}",
+            # Daemonic processes cannot have children, which would rule out
+            # process-pool handlers; stop() ends the workers instead
+            daemon=False,
+        )
+        process.start()
+        worker.process = process
+        worker.started_at = time.monotonic()
+        logger.info(f"Started worker {worker.index} (pid {process.pid})")
+
+    def poll(self) -> list[int]:
+        """
+        Check every worker once and restart the ones that are due.
+
+        Returns:
+            Indexes of the workers that were (re)started
+        """
+        started: list[int] = []
+        now = time.monotonic()
+        for worker in self._workers:
+            process = worker.process
+            if process is not None:
+                if not process.is_alive():
+                    reason = f"exited with code {process.exitcode}"
+                elif now - worker.heartbeat.value > self._heartbeat_timeout:
+                    reason = f"no heartbeat for {self._heartbeat_timeout}s"
+                    process.kill()
+                    process.join(5.0)
+                else:
+                    # Healthy long enough to forget earlier failures
+                    if worker.failures and now - worker.started_at > self._restart_delay_max:
+                        worker.failures = 0
+                    continue
+
+                worker.process = None
+                worker.failures += 1
+                delay = min(
+                    self._restart_delay_min * 2 ** (worker.failures - 1), self._restart_delay_max
+                )
+                worker.due_at = now + delay
+                logger.warning(f"Worker {worker.index} {reason}, restarting in {delay:.1f}s")
+
+            if now >= worker.due_at:
+                self._restarts.inc()
+                self._spawn(worker)
+                started.append(worker.index)
+        return started
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Ask the workers to disconnect and exit; kill those that do not."""
+        atexit.unregister(self.stop)
+        self._stop.set()
+        deadline = time.monotonic() + timeout
+        for worker in self._workers:
+            process = worker.process
+            if process is None:
+                continue
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Worker {worker.index} did not stop, killing it")
+                process.kill()
+                process.join()
+            worker.process = None
+
+    def run(self, poll_interval: float = 1.0) -> None:
+        """Start the workers and supervise them until SIGINT or SIGTERM."""
+        stopping = False
+
+        def request_stop(signum: int, frame: Any) -> None:
+            nonlocal stopping
+            stopping = True
+
+        previous = {
+            sig: signal.signal(sig, request_stop) for sig in (signal.SIGINT, signal.SIGTERM)
+        }
+        self.start()
+        try:
+            while not stopping:
+                time.sleep(poll_interval)
+                self.poll()
+        finally:
+            logger.info("Stopping workers...")
+            self.stop()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
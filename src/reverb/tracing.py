@@ -0,0 +1,48 @@
+"""Tracing hooks for observing frames and dispatch without logging."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from .messages import Message
+
+# Called with each decoded inbound message and the raw frame it came from
+FrameInHook = Callable[["Message", bytes], None]
+
+# Called with each outbound message and the frame written for it
+# (Union, as the alias is evaluated at import time and must work on Python 3.9)
+FrameOutHook = Callable[["Message", Union[str, bytes]], None]  # noqa: UP007
+
+# Called after a message's handlers have run, with their duration in seconds
+DispatchHook = Callable[["Message", float], None]
+
+
+class TraceHooks:
+    """
+    Callbacks for tracing the connection's hot path.
+
+    Hooks are plain functions called inline on the event loop, so they should
+    be quick (append to a buffer, bump a span) and must not block. An unset
+    hook costs one ``is None`` check. Exceptions raised by a hook are logged
+    and otherwise ignored.
+
+    Example:
+        def on_frame_in(message: Message, raw: bytes) -> None:
+            tracer.record("in", message.event, len(raw))
+
+        client = ReverbClient(trace=TraceHooks(on_frame_in=on_frame_in))
+    """
+
+    __slots__ = ("on_dispatch", "on_frame_in", "on_frame_out")
+
+    def __init__(
+        self,
+        on_frame_in: FrameInHook | None = None,
+        on_frame_out: FrameOutHook | None = None,
+        on_dispatch: DispatchHook | None = None,
+    ) -> None:
+        self.on_frame_in = on_frame_in
+        self.on_frame_out = on_frame_out
+        self.on_dispatch = on_dispatch
@@ -4,8 +4,13 @@ from __future__ import annotations
 
 from typing import Any, Awaitable, Callable, Dict, Optional, Protocol
 
+# The aliases are evaluated at import time, so they keep Optional for Python 3.9
+
 # Event handler that receives (event_name, data, channel_name)
-EventHandler = Callable[[str, Any, Optional[str]], Awaitable[None]]
+EventHandler = Callable[[str, Any, Optional[str]], Awaitable[None]]  # noqa: UP045
+
+# Synchronous event handler, run off the event loop in an executor
+SyncEventHandler = Callable[[str, Any, Optional[str]], Any]  # noqa: UP045
 
 # Simpler handler that just receives data
 SimpleEventHandler = Callable[[Any], Awaitable[None]]
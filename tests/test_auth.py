@@ -3,7 +3,10 @@
 import hashlib
 import hmac
 
-from reverb.auth import Authenticator
+import pytest
+
+from reverb.auth import Authenticator, LocalAuthProvider
+from reverb.exceptions import AuthenticationError
 
 
 class TestAuthenticator:
@@ -49,3 +52,100 @@ class TestAuthenticator:
 
         assert "auth" in result
         assert "channel_data" not in result
+
+    def test_signature_reused_from_cache(self, config, socket_id):
+        """Test repeated subscriptions are served from the cache."""
+        auth = Authenticator(config.app_key, config.app_secret.get_secret_value())
+        first = auth.authenticate(socket_id, "private-test")
+
+        auth._sign = None  # any further signing would fail
+
+        assert auth.authenticate(socket_id, "private-test") == first
+
+    def test_cache_is_bounded(self, config, socket_id):
+        """Test the least recently used signature is evicted first."""
+        auth = Authenticator(config.app_key, config.app_secret.get_secret_value(), cache_size=2)
+
+        auth.authenticate(socket_id, "private-a")
+        auth.authenticate(socket_id, "private-b")
+        auth.authenticate(socket_id, "private-a")
+        auth.authenticate(socket_id, "private-c")
+
+        assert list(auth._cache) == [
+            (socket_id, "private-a", None),
+            (socket_id, "private-c", None),
+        ]
+
+    def test_cache_keyed_on_socket_and_user_data(self, config, socket_id):
+        """Test a new socket or different user data produces a new signature."""
+        auth = Authenticator(config.app_key, config.app_secret.get_secret_value())
+
+        base = auth.authenticate(socket_id, "presence-room", user_data={"user_id": "1"})
+        other_socket = auth.authenticate("999.1", "presence-room", user_data={"user_id": "1"})
+        other_user = auth.authenticate(socket_id, "presence-room", user_data={"user_id": "2"})
+
+        assert len({base["auth"], other_socket["auth"], other_user["auth"]}) == 3
+
+    def test_changing_secret_rekeys(self, config, socket_id):
+        """Test setting app_secret re-keys the HMAC and drops cached signatures."""
+        auth = Authenticator(config.app_key, "old-secret")
+        old = auth.authenticate(socket_id, "private-test")
+
+        auth.app_secret = config.app_secret.get_secret_value()
+
+        assert auth.authenticate(socket_id, "private-test") != old
+        assert auth.authenticate(socket_id, "private-test") == Authenticator(
+            config.app_key, config.app_secret.get_secret_value()
+        ).authenticate(socket_id, "private-test")
+
+    def test_authenticate_many_matches_authenticate(self, config, socket_id):
+        """Test bulk signing gives the same payloads as signing one by one."""
+        secret = config.app_secret.get_secret_value()
+        names = [f"private-device.{i}" for i in range(50)]
+        user_data = {"user_id": "7", "user_info": {"name": "Pi"}}
+
+        bulk = Authenticator(config.app_key, secret, cache_size=0)
+        single = Authenticator(config.app_key, secret, cache_size=0)
+
+        assert bulk.authenticate_many(socket_id, names) == {
+            name: single.authenticate(socket_id, name) for name in names
+        }
+        assert bulk.authenticate_many(socket_id, ["presence-a"], user_data) == {
+            "presence-a": single.authenticate(socket_id, "presence-a", user_data)
+        }
+
+    def test_precomputed_channel_data(self, config, socket_id):
+        """Test passing serialized channel_data signs the same as user_data."""
+        auth = Authenticator(config.app_key, config.app_secret.get_secret_value())
+        user_data = {"user_id": "456"}
+
+        result = auth.authenticate(
+            socket_id, "presence-x", channel_data=Authenticator.encode_user_data(user_data)
+        )
+
+        assert result == auth.authenticate(socket_id, "presence-x", user_data=user_data)
+
+
+class TestLocalAuthProvider:
+    """Tests for the LocalAuthProvider class."""
+
+    async def test_signs_locally(self, config, socket_id):
+        """Test the provider returns the authenticator's payloads."""
+        authenticator = Authenticator(config.app_key, config.app_secret.get_secret_value())
+        auth = LocalAuthProvider(authenticator)
+        channel_data = Authenticator.encode_user_data({"user_id": "1"})
+
+        assert await auth.authorize(socket_id, "private-a") == authenticator.authenticate(
+            socket_id, "private-a"
+        )
+        assert await auth.authorize_many(socket_id, ["presence-a"], channel_data) == {
+            "presence-a": authenticator.authenticate(socket_id, "presence-a", {"user_id": "1"})
+        }
+
+    async def test_requires_secret(self, config, socket_id):
+        """Test signing without an app secret raises AuthenticationError."""
+        auth = LocalAuthProvider(Authenticator(config.app_key, ""))
+
+        assert await auth.authorize_many(socket_id, ["private-a"]) == {}
+        with pytest.raises(AuthenticationError, match="app_secret"):
+            await auth.authorize(socket_id, "private-a")
@@ -8,6 +8,8 @@ from reverb.channels import (
     PublicChannel,
     create_channel,
 )
+from reverb.messages import Events
+from reverb.presence import MemberJoined, MemberLeft, MembersResynced
 
 
 class TestCreateChannel:
@@ -31,10 +33,12 @@ class TestCreateChannel:
         channel = create_channel("presence-chat.room1", client=None, user_data=user_data)  # type: ignore
         assert isinstance(channel, PresenceChannel)
 
-    def test_presence_requires_user_data(self):
-        """Test that presence channels require user_data."""
+    def test_presence_requires_user_data(self, config):
+        """Test that presence channels require user_data when signed locally."""
+        from reverb.client import ReverbClient
+
         with pytest.raises(ValueError, match="require user_data"):
-            create_channel("presence-chat.room1", client=None)  # type: ignore
+            create_channel("presence-chat.room1", client=ReverbClient(config=config))
 
 
 class TestPublicChannel:
@@ -109,14 +113,134 @@ class TestPresenceChannel:
 
         assert channel.members == {}
 
-    def test_members_returns_copy(self):
-        """Test that members property returns a copy."""
+    def test_members_is_read_only_view(self):
+        """Test that members is a live view that cannot be modified."""
         user_data = {"user_id": "123"}
         channel = PresenceChannel("presence-chat", client=None, user_data=user_data)  # type: ignore
-        channel._members = {"123": {"name": "Alice"}}
-
         members = channel.members
-        members["456"] = {"name": "Bob"}
+        channel.member_store.add("123", {"name": "Alice"})
+
+        assert members == {"123": {"name": "Alice"}}
+        assert channel.members is members
+        with pytest.raises(TypeError):
+            members["456"] = {"name": "Bob"}  # type: ignore[index]
+
+    async def test_member_changes_dispatched(self, config):
+        """Test joins, leaves and the re-subscription diff reach MEMBERS_CHANGED handlers."""
+        from reverb.client import ReverbClient
+
+        channel = PresenceChannel(
+            "presence-chat", ReverbClient(config=config), user_data={"user_id": "1"}
+        )
+        changes = []
+
+        async def on_change(event, change, channel_name):
+            changes.append(change)
+
+        channel.bind(Events.MEMBERS_CHANGED, on_change)
+        snapshot = {"presence": {"hash": {"1": {}, "2": {"name": "Bo"}}}}
+
+        await channel._handle_event(Events.SUBSCRIPTION_SUCCEEDED, snapshot)
+        await channel._handle_event(Events.MEMBER_ADDED, {"user_id": "3"})
+        await channel._handle_event(Events.MEMBER_REMOVED, {"user_id": "2"})
+        # Reconnected: 3 left and 4 joined meanwhile
+        snapshot = {"presence": {"hash": {"1": {}, "4": {}}}}
+        await channel._handle_event(Events.SUBSCRIPTION_SUCCEEDED, snapshot)
+        # Re-subscribed with nothing changed: no event
+        await channel._handle_event(Events.SUBSCRIPTION_SUCCEEDED, snapshot)
+
+        kinds = [MembersResynced, MemberJoined, MemberLeft, MembersResynced]
+        assert [type(c) for c in changes] == kinds
+        assert changes[0].initial and set(changes[0].joined) == {"1", "2"}
+        assert changes[3].initial is False
+        assert dict(changes[3].joined) == {"4": {}}
+        assert list(changes[3].left) == ["3"]
+        assert [c.generation for c in changes] == [1, 2, 3, 4]
+        assert set(channel.members) == {"1", "4"}
+
+    async def test_member_changes_not_sent_to_catch_all(self, config):
+        """Test "*" handlers get the server's presence events but no MemberChange objects."""
+        from reverb.client import ReverbClient
+
+        channel = PresenceChannel(
+            "presence-chat", ReverbClient(config=config), user_data={"user_id": "1"}
+        )
+        seen = []
+
+        async def log_all(event, data, channel_name):
+            seen.append((event, data))
+
+        channel.bind("*", log_all)
+
+        await channel._handle_event(Events.MEMBER_ADDED, {"user_id": "3"})
+
+        assert seen == [(Events.MEMBER_ADDED, {"user_id": "3"})]
+
+
+class TestTrigger:
+    """Tests for Channel.trigger."""
+
+    async def test_trigger_on_unregistered_channel_raises(self, config):
+        """Test triggering before subscribing is rejected."""
+        from reverb.client import ReverbClient
+
+        client = ReverbClient(config=config)
+        channel = PrivateChannel("private-device.1", client)
+
+        with pytest.raises(RuntimeError, match="unsubscribed"):
+            await channel.trigger("status", {})
+
+    async def test_trigger_while_reconnecting_is_buffered(self, config):
+        """Test a registered channel awaiting re-subscription buffers client events."""
+        from reverb.client import ReverbClient
+        from reverb.connection import ConnectionState
+
+        client = ReverbClient(config=config)
+        channel = PrivateChannel("private-device.1", client)
+        client._channels[channel.name] = channel
+        client._connection._running = True
+        client._connection._set_state(ConnectionState.RECONNECTING)
+
+        await channel.trigger("status", {"cpu": 1})
+
+        assert [e.message.event for e in client._connection._outbox._data] == ["client-status"]
+
+    async def test_trigger_coalesce_keeps_latest(self, config):
+        """Test coalesced triggers keep only the newest unsent value."""
+        from reverb.client import ReverbClient
+        from reverb.connection import ConnectionState
+
+        client = ReverbClient(config=config)
+        channel = PrivateChannel("private-device.1", client)
+        client._channels[channel.name] = channel
+        client._connection._running = True
+        client._connection._set_state(ConnectionState.RECONNECTING)
+
+        await channel.trigger("status", {"cpu": 1}, coalesce=True)
+        await channel.trigger("status", {"cpu": 2}, coalesce=True)
+
+        queued = [e.message for e in client._connection._outbox._data]
+        assert [m.data for m in queued] == [{"cpu": 2}]
+
+
+class TestPatternBinding:
+    """Tests for pattern bindings on channels."""
+
+    async def test_pattern_handler_receives_family(self, config):
+        """Test a 'vitals.*' binding receives every vitals event."""
+        from reverb.client import ReverbClient
+
+        channel = PublicChannel("device.1", ReverbClient(config=config))
+        received = []
+
+        async def handler(event, data, channel_name):
+            received.append(event)
+
+        channel.bind("vitals.*", handler)
+
+        assert channel._has_handlers("vitals.cpu")
+        assert not channel._has_handlers("capture.request")
+        await channel._handle_event("vitals.cpu", {})
+        await channel._handle_event("vitals.memory", {})
 
-        # Original should not be modified
-        assert "456" not in channel._members
+        assert received == ["vitals.cpu", "vitals.memory"]
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Collection
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
+from reverb.channels import PrivateChannel, PublicChannel
 from reverb.client import ReverbClient
 from reverb.config import ReverbConfig
+from reverb.connection import ConnectionState
+from reverb.exceptions import SubscriptionError, TimeoutError
+from reverb.messages import Events, Message, names
 
 
 class TestReverbClient:
@@ -75,6 +83,391 @@ class TestReverbClient:
 
         assert "test-event" not in client._global_handlers
 
+    def test_metrics_exposed(self, config: ReverbConfig) -> None:
+        """Test dispatch queue metrics are available on the client."""
+        client = ReverbClient(config=config)
+
+        snapshot = client.metrics.snapshot()
+
+        assert snapshot["dispatch_queue_depth"] == 0
+        assert snapshot["dispatch_dropped_total"] == 0
+
+    async def test_unhandled_event_is_not_decoded(self, config: ReverbConfig) -> None:
+        """Test events without handlers are routed without decoding their data."""
+        client = ReverbClient(config=config)
+        client._channels["updates"] = PublicChannel("updates", client)
+        message = Message.from_json(
+            '{"event": "other", "channel": "updates", "data": "{\\"a\\": 1}"}'
+        )
+
+        await client._handle_message(message)
+
+        assert message.is_decoded is False
+
+    async def test_handled_event_receives_decoded_data(self, config: ReverbConfig) -> None:
+        """Test bound handlers receive the decoded payload."""
+        client = ReverbClient(config=config)
+        channel = PublicChannel("updates", client)
+        client._channels["updates"] = channel
+        received: list[object] = []
+
+        async def handler(event, data, channel_name):
+            received.append(data)
+
+        channel.bind("changed", handler)
+        message = Message.from_json(
+            '{"event": "changed", "channel": "updates", "data": "{\\"a\\": 1}"}'
+        )
+
+        await client._handle_message(message)
+
+        assert received == [{"a": 1}]
+
+    async def test_listen_returns_when_not_connected(self, config: ReverbConfig) -> None:
+        """Test listen() returns immediately without a connection."""
+        client = ReverbClient(config=config)
+
+        await asyncio.wait_for(client.listen(), timeout=0.1)
+
+    async def test_listen_wakes_on_connection_loss(self, config: ReverbConfig) -> None:
+        """Test listen() returns as soon as the connection leaves CONNECTED."""
+        client = ReverbClient(config=config)
+        conn = client._connection
+        conn._ws = MagicMock()
+        conn._ws.state.name = "OPEN"
+        conn._connected = True
+        conn._set_state(ConnectionState.CONNECTED)
+
+        listener = asyncio.create_task(client.listen())
+        await asyncio.sleep(0)
+        assert not listener.done()
+
+        conn._set_state(ConnectionState.RECONNECTING)
+
+        await asyncio.wait_for(listener, timeout=0.1)
+        assert client.state is ConnectionState.RECONNECTING
+
+
+class TestResubscribe:
+    """Tests for restoring subscriptions after a reconnect."""
+
+    async def test_channels_resubscribed_concurrently(self, config: ReverbConfig) -> None:
+        """Test channels are re-subscribed in parallel, bounded by the config."""
+        config.resubscribe_concurrency = 4
+        client = ReverbClient(config=config)
+        active = 0
+        peak = 0
+
+        async def subscribe(channel: PublicChannel) -> None:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            channel._subscribed = True
+
+        for i in range(20):
+            channel = PublicChannel(f"updates.{i}", client)
+            channel._subscribe = (  # type: ignore[method-assign]
+                lambda auth=None, channel=channel: subscribe(channel)
+            )
+            client._channels[channel.name] = channel
+
+        await client._handle_connect("123.456")
+
+        assert all(channel.is_subscribed for channel in client._channels.values())
+        assert peak == 4
+        snapshot = client.metrics.snapshot()
+        assert snapshot["resubscribe_seconds_count"] == 1
+        assert snapshot["resubscribe_seconds_sum"] > 0
+
+    async def test_resubscribe_failure_is_raised(self, config: ReverbConfig) -> None:
+        """Test a failed re-subscription fails the connection attempt after the rest finish."""
+        client = ReverbClient(config=config)
+        good = PublicChannel("good", client)
+        bad = PublicChannel("bad", client)
+
+        async def fail(auth: object = None) -> None:
+            raise ConnectionError("socket gone")
+
+        async def succeed(auth: object = None) -> None:
+            good._subscribed = True
+
+        bad._subscribe = fail  # type: ignore[method-assign]
+        good._subscribe = succeed  # type: ignore[method-assign]
+        client._channels = {"bad": bad, "good": good}
+
+        with pytest.raises(ConnectionError, match="socket gone"):
+            await client._handle_connect("123.456")
+
+        assert good.is_subscribed
+
+    async def test_private_channels_signed_in_bulk(self, config: ReverbConfig) -> None:
+        """Test private channels are signed with one authenticate_many() call."""
+        client = ReverbClient(config=config)
+        client._connection._socket_id = "123.456"
+        sent = _fake_server(client)
+        for i in range(20):
+            channel = PrivateChannel(f"private-device.{i}", client)
+            client._channels[channel.name] = channel
+        sign = client._authenticator.authenticate
+
+        with patch.object(client._authenticator, "authenticate", wraps=sign) as single:
+            await client._resubscribe()
+
+        single.assert_not_called()
+        assert [m.data["auth"] for m in sent] == [
+            sign("123.456", f"private-device.{i}")["auth"] for i in range(20)
+        ]
+
+
+def _fake_server(
+    client: ReverbClient, reject: Collection[str] = (), silent: Collection[str] = ()
+) -> list[Message]:
+    """Answer subscribe frames like a server would; returns the frames sent."""
+    sent: list[Message] = []
+    loop = asyncio.get_running_loop()
+
+    async def send(message: Message, **kwargs: object) -> None:
+        sent.append(message)
+        if message.event != Events.SUBSCRIBE:
+            return
+        channel = message.data["channel"]
+        if channel in silent:
+            return
+        event = Events.SUBSCRIPTION_ERROR if channel in reject else Events.SUBSCRIPTION_SUCCEEDED
+        data = {"type": "AuthError", "error": "Forbidden", "status": 403}
+        reply = Message(event=event, channel=channel, data=data)
+        # Delivered through the connection, as the receive loop would
+        loop.call_soon(lambda: loop.create_task(client._connection._handle_message(reply)))
+
+    client._connection.send = AsyncMock(side_effect=send)  # type: ignore[method-assign]
+    return sent
+
+
+class TestSubscriptionConfirmation:
+    """Tests for awaiting subscription confirmations."""
+
+    async def test_subscribe_waits_for_confirmation(self, config: ReverbConfig) -> None:
+        """Test subscribe(wait=True) returns once the server confirms."""
+        client = ReverbClient(config=config)
+        _fake_server(client)
+
+        channel = await asyncio.wait_for(client.subscribe("updates", wait=True), timeout=1.0)
+
+        assert channel.name == "updates"
+        assert "updates" not in client._pending_subscriptions
+
+    async def test_subscribe_rejected(self, config: ReverbConfig) -> None:
+        """Test a subscription_error is raised and the channel is dropped."""
+        client = ReverbClient(config=config)
+        _fake_server(client, reject={"updates"})
+
+        with pytest.raises(SubscriptionError, match="Forbidden"):
+            await client.subscribe("updates", wait=True, timeout=1.0)
+
+        assert "updates" not in client.channels
+
+    async def test_subscribe_timeout(self, config: ReverbConfig) -> None:
+        """Test an unanswered subscription times out and is withdrawn."""
+        client = ReverbClient(config=config)
+        sent = _fake_server(client, silent={"updates"})
+
+        with pytest.raises(TimeoutError):
+            await client.subscribe("updates", wait=True, timeout=0.01)
+
+        assert "updates" not in client.channels
+        assert [m.event for m in sent] == [Events.SUBSCRIBE, Events.UNSUBSCRIBE]
+
+    async def test_subscribe_without_wait_returns_immediately(self, config: ReverbConfig) -> None:
+        """Test the default subscribe() does not wait for the server."""
+        client = ReverbClient(config=config)
+        _fake_server(client, silent={"updates"})
+
+        channel = await asyncio.wait_for(client.subscribe("updates"), timeout=0.1)
+
+        assert client.channels["updates"] is channel
+
+    async def test_unawaited_subscription_leaves_no_waiter(self, config: ReverbConfig) -> None:
+        """Test subscribe() without wait registers nothing that outlives the confirmation."""
+        client = ReverbClient(config=config)
+        _fake_server(client)
+
+        await client.subscribe("updates")
+        await client.subscribe_many(["a", "b"], wait=False)
+        await asyncio.sleep(0)
+
+        assert client._pending_subscriptions == {}
+
+    async def test_confirmation_resolved_without_workers(self, config: ReverbConfig) -> None:
+        """Test confirmations are resolved by the receive loop, not a dispatch worker."""
+        client = ReverbClient(config=config)
+        future = asyncio.get_running_loop().create_future()
+        client._pending_subscriptions["updates"] = future
+
+        await client._connection._handle_message(
+            Message(event=Events.SUBSCRIPTION_SUCCEEDED, channel="updates")
+        )
+
+        assert future.done()
+
+    async def test_subscribe_many_pipelines(self, config: ReverbConfig) -> None:
+        """Test subscribe_many() sends every frame before awaiting confirmations."""
+        client = ReverbClient(config=config)
+        sent = _fake_server(client)
+        names = [f"updates.{i}" for i in range(50)]
+
+        channels = await asyncio.wait_for(client.subscribe_many(names), timeout=1.0)
+
+        assert [channel.name for channel in channels] == names
+        assert [m.data["channel"] for m in sent] == names
+        assert client._pending_subscriptions == {}
+
+    async def test_subscribe_many_reports_rejection(self, config: ReverbConfig) -> None:
+        """Test subscribe_many() raises for a rejected channel but keeps the others."""
+        client = ReverbClient(config=config)
+        _fake_server(client, reject={"b"})
+
+        with pytest.raises(SubscriptionError):
+            await client.subscribe_many(["a", "b", "c"], timeout=1.0)
+
+        assert sorted(client.channels) == ["a", "c"]
+
+
+class TestLatestValueChannels:
+    """Tests for channels subscribed with latest_only."""
+
+    async def test_slow_handler_gets_latest_value(self, config: ReverbConfig) -> None:
+        """Test events pile up into one newest value while the handler is busy."""
+        client = ReverbClient(config=config)
+        _fake_server(client)
+        channel = await client.subscribe("device.1", latest_only=["position"], wait=True)
+        positions: list[int] = []
+        alerts: list[int] = []
+        release = asyncio.Event()
+
+        async def on_position(event, data, channel):
+            await release.wait()
+            positions.append(data["x"])
+
+        async def on_alert(event, data, channel):
+            alerts.append(data["x"])
+
+        channel.bind("position", on_position).bind("alert", on_alert)
+        client._connection._start_workers()
+        for x in range(20):
+            for event in ("position", "alert"):
+                await client._connection._handle_message(
+                    Message(event=event, channel="device.1", data={"x": x})
+                )
+            await asyncio.sleep(0.01 if x == 0 else 0)
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert positions == [0, 19]
+        assert alerts == list(range(20))
+        await client.disconnect()
+
+    async def test_unsubscribe_turns_it_off(self, config: ReverbConfig) -> None:
+        """Test the setting goes away with the subscription."""
+        client = ReverbClient(config=config)
+        _fake_server(client)
+        channel = await client.subscribe("device.1", latest_only=True)
+        assert "device.1" in client._connection.latest._channels
+
+        channel.latest_only(False)
+        assert not client._connection.latest
+        channel.latest_only("position")
+        await client.unsubscribe("device.1")
+
+        assert not client._connection.latest
+
+
+class TestNameRelease:
+    """Tests for releasing interned names when subscriptions end."""
+
+    async def test_channel_cycling_does_not_grow_names(self, config: ReverbConfig) -> None:
+        """Test names of unsubscribed channels and their events are released."""
+        client = ReverbClient(config=config)
+        _fake_server(client)
+        before = len(names)
+
+        for i in range(20):
+            channel = await client.subscribe(f"cycle.{i}")
+            channel.bind(f"reading.{i}", lambda e, d, c: None)
+            await client.unsubscribe(f"cycle.{i}")
+
+        assert len(names) == before
+        assert "cycle.0" not in names
+        await client.disconnect()
+
+    async def test_name_kept_while_still_bound(self, config: ReverbConfig) -> None:
+        """Test a name stays interned until its last binding is removed."""
+        client = ReverbClient(config=config)
+        _fake_server(client)
+
+        async def handler(event, data, channel):
+            pass
+
+        client.bind("shared-event", handler)
+        channel = await client.subscribe("shared.1")
+        channel.bind("shared-event", handler)
+        await client.unsubscribe("shared.1")
+        assert "shared-event" in names
+
+        client.unbind("shared-event", handler)
+        assert "shared-event" not in names
+        await client.disconnect()
+
+
+class TestChannelPatternBinding:
+    """Tests for handlers bound to channel-name patterns."""
+
+    async def test_pattern_handler_receives_matching_channels(self, config: ReverbConfig) -> None:
+        """Test a channel pattern binding sees events from every matching channel."""
+        client = ReverbClient(config=config)
+        received = []
+
+        async def handler(event, data, channel):
+            received.append((event, channel))
+
+        client.bind("status", handler, channel="device.*")
+
+        for name in ("device.1", "device.2", "sensor.1"):
+            await client._handle_message(Message(event="status", data={}, channel=name))
+        await client._handle_message(Message(event="other", data={}, channel="device.1"))
+
+        assert received == [("status", "device.1"), ("status", "device.2")]
+
+    async def test_no_per_channel_state(self, config: ReverbConfig) -> None:
+        """Test subscribed channels carry no handlers of their own."""
+        client = ReverbClient(config=config)
+        _fake_server(client)
+        client.bind("status", AsyncMock(), channel="device.*")
+
+        channels = await client.subscribe_many([f"device.{i}" for i in range(50)])
+
+        assert all(not channel._handlers for channel in channels)
+        assert list(client._channel_router.routers) == ["device.*"]
+
+    async def test_unbind_with_channel(self, config: ReverbConfig) -> None:
+        """Test unbinding a channel pattern binding stops delivery."""
+        client = ReverbClient(config=config)
+        handler = AsyncMock()
+        client.bind("status", handler, channel="device.*")
+
+        client.unbind("status", handler, channel="device.*")
+        await client._handle_message(Message(event="status", data={}, channel="device.1"))
+
+        handler.assert_not_called()
+
+    def test_invalid_channel_pattern(self, config: ReverbConfig) -> None:
+        """Test a malformed channel pattern is rejected."""
+        client = ReverbClient(config=config)
+
+        with pytest.raises(ValueError):
+            client.bind("status", AsyncMock(), channel="device*")
+
 
 class TestReverbClientIntegration:
     """Integration tests that require a running Reverb server.
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+import contextlib
+import json
+import time
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+
+from reverb.channels import PrivateChannel
+from reverb.client import ReverbClient
 from reverb.config import ReverbConfig
-from reverb.connection import Connection
-from reverb.messages import Message
+from reverb.connection import Connection, ConnectionState
+from reverb.exceptions import ConnectionError
+from reverb.messages import Message, Messages
 
 
 def _create_connection(config: ReverbConfig) -> Connection:
@@ -112,7 +122,9 @@ class TestConnection:
         mock_ws = MagicMock()
         mock_ws.state.name = property(lambda self: (_ for _ in ()).throw(AttributeError()))
         # Make accessing state.name raise an exception
-        type(mock_ws.state).name = property(lambda self: (_ for _ in ()).throw(AttributeError("no state")))
+        type(mock_ws.state).name = property(
+            lambda self: (_ for _ in ()).throw(AttributeError("no state"))
+        )
 
         conn._ws = mock_ws
         conn._connected = True
@@ -138,3 +150,636 @@ class TestConnection:
         conn._reconnect_attempts = 100
         delay_max = conn._calculate_backoff_delay()
         assert delay_max <= config.reconnect_delay_max * 1.25
+
+
+class FakeSocket:
+    """Stand-in for a websockets ClientConnection that records written frames."""
+
+    def __init__(self) -> None:
+        self.state = MagicMock()
+        self.state.name = "OPEN"
+        self.frames: list[bytes] = []
+        self.writes = 0
+        self.error: Exception | None = None
+        # When set, each drain waits for this event
+        self.drain: asyncio.Event | None = None
+        self._framed: list[bytes] = []
+        self.protocol = MagicMock()
+        self.protocol.send_text.side_effect = self._framed.append
+        self.protocol.data_to_send.side_effect = self._data_to_send
+        self.transport = MagicMock()
+        self.transport.writelines.side_effect = self._write
+        # Frames for recv() to return
+        self.incoming: asyncio.Queue[bytes] = asyncio.Queue()
+
+    def _data_to_send(self) -> list[bytes]:
+        chunks = list(self._framed)
+        self._framed.clear()
+        return chunks
+
+    def _write(self, chunks: list[bytes]) -> None:
+        self.writes += 1
+        self.frames.extend(chunks)
+
+    @contextlib.asynccontextmanager
+    async def send_context(self) -> AsyncIterator[None]:
+        if self.error is not None:
+            raise self.error
+        yield
+        if self.drain is not None:
+            await self.drain.wait()
+
+    async def recv(self, decode: bool = True) -> bytes:
+        return await self.incoming.get()
+
+    async def close(self) -> None:
+        self.state.name = "CLOSED"
+
+    @property
+    def events(self) -> list[str]:
+        """Event names written so far, in order."""
+        return [json.loads(frame)["event"] for frame in self.frames]
+
+
+def _attach_socket(conn: Connection, start_writer: bool = True) -> FakeSocket:
+    """Give a connection a fake open websocket (and a writer task for it)."""
+    ws = FakeSocket()
+    conn._ws = ws  # type: ignore[assignment]
+    conn._connected = True
+    if start_writer:
+        conn._start_writer()
+    return ws
+
+
+async def _drain(conn: Connection) -> None:
+    """Let the writer task run until the outbox stops shrinking."""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestConnectionState:
+    """Tests for the connection state machine."""
+
+    def test_initial_state_is_closed(self, config: ReverbConfig) -> None:
+        """Test a new connection starts in the CLOSED state."""
+        conn = _create_connection(config)
+
+        assert conn.state is ConnectionState.CLOSED
+
+    async def test_wait_for_current_state_returns_immediately(self, config: ReverbConfig) -> None:
+        """Test waiting for the current state does not block."""
+        conn = _create_connection(config)
+
+        state = await asyncio.wait_for(conn.wait_for_state(ConnectionState.CLOSED), timeout=0.1)
+
+        assert state is ConnectionState.CLOSED
+
+    async def test_wait_for_state_wakes_on_transition(self, config: ReverbConfig) -> None:
+        """Test waiters are woken by the matching transition only."""
+        conn = _create_connection(config)
+        conn._set_state(ConnectionState.CONNECTED)
+
+        waiter = asyncio.create_task(
+            conn.wait_for_state(ConnectionState.RECONNECTING, ConnectionState.CLOSED)
+        )
+        await asyncio.sleep(0)
+        conn._set_state(ConnectionState.CONNECTING)
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        conn._set_state(ConnectionState.RECONNECTING)
+
+        assert await asyncio.wait_for(waiter, timeout=0.1) is ConnectionState.RECONNECTING
+        assert conn._state_waiters == []
+
+    async def test_connection_lost_without_reconnect_closes(self, config: ReverbConfig) -> None:
+        """Test connection loss moves to CLOSED when reconnect is disabled."""
+        config.reconnect_enabled = False
+        conn = _create_connection(config)
+        conn._running = True
+        conn._set_state(ConnectionState.CONNECTED)
+
+        await conn._handle_connection_lost()
+
+        assert conn.state is ConnectionState.CLOSED
+
+    async def test_disconnect_closes(self, config: ReverbConfig) -> None:
+        """Test disconnect() moves to CLOSED and wakes waiters."""
+        conn = _create_connection(config)
+        conn._set_state(ConnectionState.CONNECTED)
+        waiter = asyncio.create_task(conn.wait_for_state(ConnectionState.CLOSED))
+        await asyncio.sleep(0)
+
+        await conn.disconnect()
+
+        assert await asyncio.wait_for(waiter, timeout=0.1) is ConnectionState.CLOSED
+
+
+class TestInboundDispatch:
+    """Tests for the bounded inbound dispatch queue and workers."""
+
+    async def test_workers_bound_handler_concurrency(self, config: ReverbConfig) -> None:
+        """Test no more than dispatch_workers handlers run at once."""
+        config.dispatch_workers = 2
+        running = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def slow_handler(msg: Message) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+        conn = _create_connection(config)
+        conn._on_message = slow_handler
+        conn._start_workers()
+        for i in range(5):
+            await conn._handle_message(Message(event="e", data={"i": i}, channel="c"))
+        await asyncio.sleep(0.01)
+
+        assert peak == 2
+        assert conn.metrics.snapshot()["dispatch_queue_depth"] == 3
+
+        release.set()
+        await asyncio.wait_for(conn._inbox.join(), timeout=1.0)
+        await conn._stop_workers()
+        assert running == 0
+
+    async def test_overflow_drops_are_counted(self, config: ReverbConfig) -> None:
+        """Test drops from the overflow policy show up in the metrics."""
+        config.dispatch_queue_size = 1
+        config.dispatch_overflow = "drop_newest"
+        conn = _create_connection(config)
+
+        for _ in range(3):
+            await conn._handle_message(Message(event="e", channel="c"))
+
+        snapshot = conn.metrics.snapshot()
+        assert snapshot["dispatch_queue_depth"] == 1
+        assert snapshot["dispatch_dropped_total"] == 2
+
+    async def test_disconnect_stops_workers(self, config: ReverbConfig) -> None:
+        """Test disconnect() cancels workers and clears queued messages."""
+        conn = _create_connection(config)
+        conn._start_workers()
+        conn._inbox.put_nowait(Message(event="e"))
+
+        await conn.disconnect()
+
+        assert conn._workers == []
+        assert conn._inbox.empty()
+
+    async def test_ordered_mode_preserves_channel_order(self, config: ReverbConfig) -> None:
+        """Test ordered mode handles each channel serially while channels overlap."""
+        config.dispatch_mode = "ordered"
+        config.dispatch_workers = 4
+        handled: dict[str, list[int]] = {"a": [], "b": []}
+        active: dict[str, int] = {"a": 0, "b": 0}
+        overlap = False
+        max_per_channel = 0
+
+        async def handler(msg: Message) -> None:
+            nonlocal overlap, max_per_channel
+            channel = msg.channel
+            assert channel is not None
+            active[channel] += 1
+            max_per_channel = max(max_per_channel, active[channel])
+            overlap = overlap or all(active.values())
+            await asyncio.sleep(0.001 * (msg.data["i"] % 3))
+            handled[channel].append(msg.data["i"])
+            active[channel] -= 1
+
+        conn = _create_connection(config)
+        conn._on_message = handler
+        conn._start_workers()
+        for i in range(20):
+            await conn._handle_message(Message(event="e", data={"i": i}, channel="a"))
+            await conn._handle_message(Message(event="e", data={"i": i}, channel="b"))
+
+        while conn._lanes:
+            await asyncio.sleep(0.005)
+        await conn._stop_workers()
+
+        assert handled["a"] == list(range(20))
+        assert handled["b"] == list(range(20))
+        assert max_per_channel == 1
+        assert overlap
+
+    @pytest.mark.parametrize("mode", ["concurrent", "ordered"])
+    async def test_latest_value_channel(self, config: ReverbConfig, mode: str) -> None:
+        """Test a slow handler on a latest-value channel gets only the newest backlog value."""
+        config.dispatch_mode = mode  # type: ignore[assignment]
+        config.dispatch_workers = 4
+        handled: list[int] = []
+        release = asyncio.Event()
+
+        async def slow_handler(msg: Message) -> None:
+            await release.wait()
+            handled.append(msg.data["i"])
+
+        conn = _create_connection(config)
+        conn._on_message = slow_handler
+        conn.latest.enable("c")
+        conn._start_workers()
+        for i in range(10):
+            await conn._handle_message(Message(event="e", data={"i": i}, channel="c"))
+            # The first message is being handled while the rest arrive
+            await asyncio.sleep(0.01 if i == 0 else 0)
+
+        release.set()
+        for _ in range(50):
+            if not conn.latest.holds(Message(event="e", channel="c")):
+                break
+            await asyncio.sleep(0.001)
+        await conn._stop_workers()
+
+        assert handled == [0, 9]
+        assert conn.metrics.snapshot()["dispatch_coalesced_total"] == 8
+
+    async def test_latest_value_handler_errors_release_key(self, config: ReverbConfig) -> None:
+        """Test a failing handler does not leave a latest-value key stuck."""
+        calls = 0
+
+        async def failing_handler(msg: Message) -> None:
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("boom")
+
+        conn = _create_connection(config)
+        conn._on_message = failing_handler
+        conn.latest.enable("c")
+        conn._start_workers()
+        await conn._handle_message(Message(event="e", channel="c"))
+        await asyncio.wait_for(conn._inbox.join(), timeout=1.0)
+        await conn._handle_message(Message(event="e", channel="c"))
+        await asyncio.wait_for(conn._inbox.join(), timeout=1.0)
+        await conn._stop_workers()
+
+        assert calls == 2
+
+
+class TestOutboundBuffer:
+    """Tests for buffering client events across reconnects."""
+
+    def _reconnecting(self, config: ReverbConfig) -> Connection:
+        conn = _create_connection(config)
+        conn._running = True
+        conn._set_state(ConnectionState.RECONNECTING)
+        return conn
+
+    def _connected(self, config: ReverbConfig) -> tuple[Connection, FakeSocket]:
+        conn = _create_connection(config)
+        conn._running = True
+        conn._set_state(ConnectionState.CONNECTED)
+        return conn, _attach_socket(conn)
+
+    async def test_send_when_closed_raises(self, config: ReverbConfig) -> None:
+        """Test sending without a connection still raises."""
+        conn = _create_connection(config)
+
+        with pytest.raises(ConnectionError, match="Not connected"):
+            await conn.send(Message(event="client-status", channel="c"))
+
+    async def test_client_events_buffered_while_reconnecting(self, config: ReverbConfig) -> None:
+        """Test client events are held while the connection is down."""
+        conn = self._reconnecting(config)
+
+        await conn.send(Message(event="client-status", channel="c"))
+
+        snapshot = conn.metrics.snapshot()
+        assert snapshot["send_buffer_depth"] == 1
+        assert snapshot["send_buffered_total"] == 1
+
+    async def test_protocol_frames_not_buffered(self, config: ReverbConfig) -> None:
+        """Test pusher:* frames need a live socket."""
+        conn = self._reconnecting(config)
+
+        with pytest.raises(ConnectionError):
+            await conn.send(Messages.subscribe("c"))
+
+        assert len(conn._outbox) == 0
+
+    async def test_buffer_evicts_oldest_when_full(self, config: ReverbConfig) -> None:
+        """Test the buffer keeps the newest messages when full."""
+        config.send_buffer_size = 2
+        conn = self._reconnecting(config)
+
+        for i in range(3):
+            await conn.send(Message(event=f"client-{i}", channel="c"))
+
+        assert [entry.message.event for entry in conn._outbox._data] == ["client-1", "client-2"]
+        assert conn.metrics.snapshot()["send_dropped_total"] == 1
+
+    async def test_buffering_disabled(self, config: ReverbConfig) -> None:
+        """Test send_buffer_size=0 restores fail-fast sends."""
+        config.send_buffer_size = 0
+        conn = self._reconnecting(config)
+
+        with pytest.raises(ConnectionError):
+            await conn.send(Message(event="client-status", channel="c"))
+
+    async def test_flush_in_order_skipping_expired(self, config: ReverbConfig) -> None:
+        """Test the buffer is flushed in order and expired messages are discarded."""
+        conn = self._reconnecting(config)
+        for i in range(3):
+            await conn.send(Message(event=f"client-{i}", channel="c"))
+        conn._outbox._data[1].expires_at = 0.0
+        ws = _attach_socket(conn)
+        await _drain(conn)
+        assert ws.events == []  # Held until CONNECTED
+
+        conn._set_state(ConnectionState.CONNECTED)
+        conn._outbox.wakeup.set()
+        await _drain(conn)
+
+        assert ws.events == ["client-0", "client-2"]
+        assert conn.metrics.snapshot()["send_expired_total"] == 1
+        assert len(conn._outbox) == 0
+
+    async def test_protocol_frames_written_before_connected(self, config: ReverbConfig) -> None:
+        """Test re-subscription frames go out while buffered client events wait."""
+        conn = self._reconnecting(config)
+        await conn.send(Message(event="client-status", channel="c"))
+        ws = _attach_socket(conn)
+
+        await asyncio.wait_for(conn.send(Messages.subscribe("c")), timeout=0.1)
+
+        assert ws.events == ["pusher:subscribe"]
+
+    async def test_failed_write_keeps_messages(self, config: ReverbConfig) -> None:
+        """Test a failed write puts the client events back at the head."""
+        conn, ws = self._connected(config)
+        ws.error = OSError("broken pipe")
+
+        await conn.send(Message(event="client-0", channel="c"))
+        await _drain(conn)
+
+        assert [entry.message.event for entry in conn._outbox._data] == ["client-0"]
+
+    async def test_protocol_frame_fails_with_socket(self, config: ReverbConfig) -> None:
+        """Test awaiting a protocol frame raises if the socket write fails."""
+        conn, ws = self._connected(config)
+        ws.error = OSError("connection reset")
+
+        with pytest.raises(ConnectionError, match="Failed to send"):
+            await asyncio.wait_for(conn.send(Messages.subscribe("c")), timeout=0.1)
+
+    async def test_disconnect_discards_buffer(self, config: ReverbConfig) -> None:
+        """Test an explicit disconnect drops buffered messages."""
+        conn = self._reconnecting(config)
+        await conn.send(Message(event="client-status", channel="c"))
+
+        await conn.disconnect()
+
+        assert len(conn._outbox) == 0
+
+
+class TestWriteBatching:
+    """Tests for the writer task's batching and coalescing."""
+
+    async def test_burst_written_in_one_batch(self, config: ReverbConfig) -> None:
+        """Test frames queued together are taken by the writer as one batch."""
+        conn = _create_connection(config)
+        conn._running = True
+        conn._set_state(ConnectionState.CONNECTED)
+        ws = _attach_socket(conn, start_writer=False)
+
+        for i in range(10):
+            await conn.send(Message(event=f"client-{i}", channel="c"))
+        conn._start_writer()
+        await _drain(conn)
+
+        assert ws.events == [f"client-{i}" for i in range(10)]
+        assert ws.writes == 1
+        snapshot = conn.metrics.snapshot()
+        assert snapshot["send_batches_total"] == 1
+        assert snapshot["frames_sent_total"] == 10
+
+    async def test_unencodable_message_raises_to_sender(self, config: ReverbConfig) -> None:
+        """Test a message that cannot be encoded fails its send() and blocks nothing else."""
+        conn = _create_connection(config)
+        conn._running = True
+        conn._set_state(ConnectionState.CONNECTED)
+        ws = _attach_socket(conn)
+
+        with pytest.raises(ConnectionError, match="Failed to send"):
+            await conn.send(Message(event="client-bad", channel="c", data={"t": object()}))
+        await conn.send(Message(event="client-good", channel="c"))
+        await asyncio.wait_for(conn.send(Messages.pong()), timeout=0.1)
+        await _drain(conn)
+
+        assert ws.events == ["client-good", "pusher:pong"]
+        assert len(conn._outbox) == 0
+
+    async def test_stopped_during_drain_does_not_resend(self, config: ReverbConfig) -> None:
+        """Test frames already written are not requeued when the writer stops mid-drain."""
+        conn = _create_connection(config)
+        conn._running = True
+        conn._set_state(ConnectionState.CONNECTED)
+        ws = _attach_socket(conn, start_writer=False)
+        ws.drain = asyncio.Event()
+        for i in range(3):
+            await conn.send(Message(event=f"client-{i}", channel="c"))
+        conn._start_writer()
+        await _drain(conn)
+
+        await conn._stop_writer(ConnectionError("Connection lost"))
+
+        assert ws.events == ["client-0", "client-1", "client-2"]
+        assert len(conn._outbox) == 0
+        assert conn.metrics.snapshot()["frames_sent_total"] == 3
+
+    async def test_coalesce_keeps_latest_value(self, config: ReverbConfig) -> None:
+        """Test coalesced sends replace the queued value instead of queueing another."""
+        conn = _create_connection(config)
+        conn._running = True
+        conn._set_state(ConnectionState.RECONNECTING)
+        for i in range(5):
+            await conn.send(
+                Message(event="client-status", channel="c", data={"seq": i}),
+                coalesce=("c", "client-status"),
+            )
+        await conn.send(Message(event="client-other", channel="c"))
+
+        ws = _attach_socket(conn)
+        conn._set_state(ConnectionState.CONNECTED)
+        conn._outbox.wakeup.set()
+        await _drain(conn)
+
+        assert ws.events == ["client-status", "client-other"]
+        assert json.loads(json.loads(ws.frames[0])["data"]) == {"seq": 4}
+        assert conn.metrics.snapshot()["send_coalesced_total"] == 4
+
+
+class TestInstrumentation:
+    """Tests for the hot-path metrics recorded by the connection."""
+
+    async def test_received_frames_timed_through_dispatch(self, config: ReverbConfig) -> None:
+        """Test frames, decode time, queue wait and per-event latency are recorded."""
+        handled = asyncio.Event()
+
+        async def handler(msg: Message) -> None:
+            await asyncio.sleep(0.01)
+            handled.set()
+
+        conn = _create_connection(config)
+        conn._on_message = handler
+        conn._start_workers()
+        ws = _attach_socket(conn, start_writer=False)
+        frame = b'{"event":"status","channel":"device.1","data":"{}"}'
+        ws.incoming.put_nowait(frame)
+
+        receiving = asyncio.create_task(conn._receive_loop())
+        await asyncio.wait_for(handled.wait(), timeout=1.0)
+        await asyncio.sleep(0)
+        receiving.cancel()
+        await conn._stop_workers()
+
+        snapshot = conn.metrics.snapshot()
+        assert snapshot["frames_received_total"] == 1
+        assert snapshot["bytes_received_total"] == len(frame)
+        assert snapshot["decode_seconds_count"] == 1
+        assert snapshot["dispatch_wait_seconds_count"] == 1
+        assert snapshot['event_handler_seconds_count{event="status"}'] == 1
+        assert snapshot['event_handler_seconds_max{event="status"}'] >= 0.01
+
+    async def test_sent_frames_counted(self, config: ReverbConfig) -> None:
+        """Test frames and bytes written are counted."""
+        conn = _create_connection(config)
+        conn._running = True
+        conn._set_state(ConnectionState.CONNECTED)
+        ws = _attach_socket(conn)
+
+        for i in range(3):
+            await conn.send(Message(event=f"client-{i}", channel="c"))
+        await _drain(conn)
+
+        snapshot = conn.metrics.snapshot()
+        assert snapshot["frames_sent_total"] == 3
+        assert snapshot["bytes_sent_total"] == sum(len(frame) for frame in ws.frames)
+
+    async def test_reconnect_counted_and_timed(self, config: ReverbConfig) -> None:
+        """Test a lost-then-restored connection counts as one timed reconnect."""
+        conn = _create_connection(config)
+        conn._running = True
+        _attach_socket(conn)
+
+        await conn._stop_writer(ConnectionError("lost"))
+        conn._lost_at = time.monotonic() - 2.0
+        conn._set_state(ConnectionState.RECONNECTING)
+
+        async def fake_connect(url: str) -> FakeSocket:
+            ws = FakeSocket()
+            ws.incoming.put_nowait(
+                b'{"event":"pusher:connection_established","data":"{\\"socket_id\\":\\"1.2\\"}"}'
+            )
+            return ws
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("reverb.connection.websockets.connect", fake_connect)
+            await conn._establish_connection()
+
+        snapshot = conn.metrics.snapshot()
+        assert snapshot["reconnects_total"] == 1
+        assert snapshot["reconnect_seconds_max"] >= 2.0
+        await conn.disconnect()
+
+    async def test_failed_reconnect_leaves_no_writer(self, config: ReverbConfig) -> None:
+        """Test a reconnect whose re-subscription fails closes its socket and writer."""
+        client = ReverbClient(config=config)
+        conn = client._connection
+        conn._running = True
+        conn._set_state(ConnectionState.RECONNECTING)
+        client._channels["private-a"] = PrivateChannel("private-a", client)
+        authorize_many = client.auth.authorize_many
+        client.auth.authorize_many = AsyncMock(  # type: ignore[method-assign]
+            side_effect=RuntimeError("auth endpoint down")
+        )
+        sockets: list[FakeSocket] = []
+
+        async def fake_connect(url: str) -> FakeSocket:
+            ws = FakeSocket()
+            ws.incoming.put_nowait(
+                b'{"event":"pusher:connection_established","data":"{\\"socket_id\\":\\"1.2\\"}"}'
+            )
+            sockets.append(ws)
+            return ws
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("reverb.connection.websockets.connect", fake_connect)
+            with pytest.raises(RuntimeError):
+                await conn._establish_connection()
+
+            assert conn._writer_task is None
+            assert conn._ws is None
+            assert sockets[0].state.name == "CLOSED"
+
+            client.auth.authorize_many = authorize_many  # type: ignore[method-assign]
+            await conn._establish_connection()
+        for i in range(10):
+            await conn.send(Message(event=f"client-{i}", channel="private-a"))
+        await _drain(conn)
+
+        assert sockets[0].frames == []
+        assert sockets[1].events == ["pusher:subscribe"] + [f"client-{i}" for i in range(10)]
+        await conn.disconnect()
+
+
+class TestKeepalive:
+    """Tests for ping/pong keepalive and dead-peer detection."""
+
+    def _connected(self, config: ReverbConfig) -> tuple[Connection, FakeSocket]:
+        conn = _create_connection(config)
+        conn._running = True
+        conn._set_state(ConnectionState.CONNECTED)
+        return conn, _attach_socket(conn)
+
+    async def test_idle_link_is_pinged_and_rtt_recorded(self, config: ReverbConfig) -> None:
+        """Test a ping goes out when idle and the pong's round trip is recorded."""
+        config.ping_interval = 0.01
+        conn, ws = self._connected(config)
+
+        keepalive = asyncio.create_task(conn._keepalive_loop())
+        for _ in range(100):
+            await asyncio.sleep(0.005)
+            if conn._pending_pong is not None and ws.events:
+                break
+        assert ws.events == ["pusher:ping"]
+
+        conn._last_received = time.monotonic()
+        await conn._handle_message(Message(event="pusher:pong"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        keepalive.cancel()
+        await asyncio.gather(keepalive, return_exceptions=True)
+
+        assert conn.rtt.count == 1
+        assert conn.metrics.snapshot()["ping_rtt_seconds_count"] == 1
+
+    async def test_busy_link_is_not_pinged(self, config: ReverbConfig) -> None:
+        """Test received traffic postpones the ping."""
+        config.ping_interval = 10.0
+        conn, ws = self._connected(config)
+        conn._last_received = time.monotonic()
+
+        keepalive = asyncio.create_task(conn._keepalive_loop())
+        await asyncio.sleep(0.02)
+        keepalive.cancel()
+        await asyncio.gather(keepalive, return_exceptions=True)
+
+        assert ws.events == []
+
+    async def test_missing_pong_aborts_socket(self, config: ReverbConfig) -> None:
+        """Test a ping timeout drops the socket so the receive loop reconnects."""
+        config.ping_interval = 0.01
+        config.ping_timeout = 0.02
+        conn, ws = self._connected(config)
+
+        keepalive = asyncio.create_task(conn._keepalive_loop())
+        await asyncio.wait_for(keepalive, timeout=1.0)
+
+        ws.transport.abort.assert_called_once()
+        assert conn.metrics.snapshot()["ping_timeouts_total"] == 1
+        assert conn._pending_pong is None
@@ -0,0 +1,221 @@
+"""Tests for the inbound dispatch queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from reverb.dispatch import ChannelLanes, DispatchQueue, LatestValues
+from reverb.messages import Message
+
+
+def _msg(event: str, channel: str = "c", seq: int = 0) -> Message:
+    return Message(event=event, data={"seq": seq}, channel=channel)
+
+
+class TestDispatchQueue:
+    """Tests for DispatchQueue overflow policies."""
+
+    async def test_fifo(self) -> None:
+        """Test messages come out in arrival order."""
+        queue = DispatchQueue(10)
+        for i in range(3):
+            await queue.put(_msg("e", seq=i))
+
+        assert [queue.get_nowait().data["seq"] for _ in range(3)] == [0, 1, 2]
+
+    async def test_block_waits_for_room(self) -> None:
+        """Test the block policy pauses the producer until a slot frees up."""
+        queue = DispatchQueue(1, "block")
+        await queue.put(_msg("e", seq=0))
+
+        producer = asyncio.create_task(queue.put(_msg("e", seq=1)))
+        await asyncio.sleep(0)
+        assert not producer.done()
+
+        assert queue.get_nowait().data["seq"] == 0
+        await asyncio.wait_for(producer, timeout=0.1)
+        assert queue.get_nowait().data["seq"] == 1
+
+    async def test_drop_newest(self) -> None:
+        """Test the drop_newest policy discards incoming messages when full."""
+        queue = DispatchQueue(2, "drop_newest")
+        for i in range(4):
+            await queue.put(_msg("e", seq=i))
+
+        assert [queue.get_nowait().data["seq"] for _ in range(2)] == [0, 1]
+        assert queue.dropped.value == 2
+
+    async def test_drop_oldest(self) -> None:
+        """Test the drop_oldest policy evicts the head when full."""
+        queue = DispatchQueue(2, "drop_oldest")
+        for i in range(4):
+            await queue.put(_msg("e", seq=i))
+
+        assert [queue.get_nowait().data["seq"] for _ in range(2)] == [2, 3]
+        assert queue.dropped.value == 2
+
+    async def test_coalesce_replaces_same_key(self) -> None:
+        """Test the coalesce policy keeps only the newest message per (channel, event)."""
+        queue = DispatchQueue(2, "coalesce")
+        await queue.put(_msg("status", seq=0))
+        await queue.put(_msg("other", seq=1))
+        await queue.put(_msg("status", seq=2))
+
+        assert queue.qsize() == 2
+        assert queue.coalesced.value == 1
+        assert [queue.get_nowait().data["seq"] for _ in range(2)] == [2, 1]
+
+    async def test_coalesce_blocks_on_new_key(self) -> None:
+        """Test the coalesce policy blocks when no queued message can be replaced."""
+        queue = DispatchQueue(1, "coalesce")
+        await queue.put(_msg("a"))
+
+        producer = asyncio.create_task(queue.put(_msg("b")))
+        await asyncio.sleep(0)
+        assert not producer.done()
+
+        queue.get_nowait()
+        await asyncio.wait_for(producer, timeout=0.1)
+
+    @pytest.mark.parametrize("policy", ["drop_oldest", "drop_newest", "coalesce"])
+    async def test_policies_do_not_apply_below_capacity(self, policy) -> None:
+        """Test non-blocking policies behave like a plain queue until full."""
+        queue = DispatchQueue(3, policy)
+        for i in range(3):
+            await queue.put(_msg("e", seq=i))
+
+        assert queue.qsize() == 3
+        assert queue.dropped.value == 0
+        assert queue.coalesced.value == 0
+
+
+class TestChannelLanes:
+    """Tests for per-channel ordered lanes."""
+
+    async def test_one_claim_per_channel(self) -> None:
+        """Test a channel's lane is claimed by one worker until released."""
+        lanes = ChannelLanes(10)
+        await lanes.put(_msg("e", channel="a", seq=0))
+        await lanes.put(_msg("e", channel="a", seq=1))
+        await lanes.put(_msg("e", channel="b", seq=2))
+
+        key1, first = await lanes.get()
+        key2, second = await lanes.get()
+
+        assert (key1, first.data["seq"]) == ("a", 0)
+        assert (key2, second.data["seq"]) == ("b", 2)
+
+        # "a" still has a message but is claimed, so nothing is ready
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(lanes.get(), timeout=0.01)
+
+        lanes.release("a")
+        key3, third = await asyncio.wait_for(lanes.get(), timeout=0.1)
+        assert (key3, third.data["seq"]) == ("a", 1)
+
+    async def test_empty_lanes_are_retired(self) -> None:
+        """Test lanes are dropped once drained."""
+        lanes = ChannelLanes(10)
+        await lanes.put(_msg("e", channel="a"))
+        assert len(lanes) == 1
+
+        key, _ = await lanes.get()
+        lanes.release(key)
+
+        assert len(lanes) == 0
+        assert lanes.qsize() == 0
+
+    async def test_lane_overflow_policy(self) -> None:
+        """Test the per-lane limit applies the overflow policy per channel."""
+        lanes = ChannelLanes(1, "drop_newest")
+        await lanes.put(_msg("e", channel="a", seq=0))
+        await lanes.put(_msg("e", channel="a", seq=1))
+        await lanes.put(_msg("e", channel="b", seq=2))
+
+        assert lanes.qsize() == 2
+        assert lanes.dropped.value == 1
+
+    async def test_release_after_clear(self) -> None:
+        """Test releasing a lane that was cleared mid-dispatch is harmless."""
+        lanes = ChannelLanes(10)
+        await lanes.put(_msg("e", channel="a"))
+        key, _ = await lanes.get()
+
+        lanes.clear()
+        lanes.release(key)
+
+        assert len(lanes) == 0
+
+
+class TestLatestValues:
+    """Tests for latest-value delivery."""
+
+    def test_newest_value_replaces_pending(self) -> None:
+        """Test only one message per key is queued and later ones replace each other."""
+        latest = LatestValues()
+        latest.enable("c")
+
+        admitted = [latest.offer(_msg("e", seq=i)) for i in range(4)]
+
+        assert admitted == [True, False, False, False]
+        assert len(latest) == 1
+        assert latest.take(_msg("e", seq=0)).data["seq"] == 3
+        assert latest.coalesced.value == 3
+
+    def test_done_hands_over_then_releases(self) -> None:
+        """Test a value that arrived while handling comes next, and the key frees up after."""
+        latest = LatestValues()
+        latest.enable("c")
+        first = _msg("e", seq=0)
+        latest.offer(first)
+        assert latest.holds(first)
+
+        latest.offer(_msg("e", seq=1))
+        newer = latest.done(first)
+
+        assert newer is not None and newer.data["seq"] == 1
+        assert latest.done(newer) is None
+        assert not latest.holds(newer)
+        assert latest.offer(_msg("e", seq=2))
+
+    def test_selected_events_only(self) -> None:
+        """Test other channels, unlisted events and protocol events are never held."""
+        latest = LatestValues()
+        latest.enable("c", ["telemetry"])
+        latest.offer(_msg("telemetry"))
+
+        assert latest.offer(_msg("telemetry", channel="other"))
+        assert latest.offer(_msg("telemetry", channel="other"))
+        assert latest.offer(_msg("alert"))
+        assert latest.offer(_msg("alert"))
+        assert latest.offer(_msg("pusher_internal:member_added"))
+        assert latest.offer(_msg("pusher_internal:member_added"))
+        assert not latest.offer(_msg("telemetry"))
+
+    def test_disable_drops_pending(self) -> None:
+        """Test disabling a channel forgets its pending values."""
+        latest = LatestValues()
+        latest.enable("c")
+        latest.offer(_msg("e", seq=0))
+        latest.offer(_msg("e", seq=1))
+
+        latest.disable("c")
+
+        assert len(latest) == 0
+        assert latest.offer(_msg("e", seq=2))
+        assert not latest
+
+    async def test_overflow_drop_releases_key(self) -> None:
+        """Test a queued message dropped by the overflow policy does not block its key."""
+        latest = LatestValues()
+        latest.enable("c", ["e"])
+        queue = DispatchQueue(1, "drop_oldest", on_drop=latest.discard)
+        for message in (_msg("other"), _msg("e", seq=0)):
+            assert latest.offer(message)
+            await queue.put(message)
+        await queue.put(_msg("other", seq=1))
+
+        assert not latest.holds(_msg("e"))
+        assert latest.offer(_msg("e", seq=1))
@@ -0,0 +1,270 @@
+"""Tests for running handlers off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from reverb.channels import PublicChannel
+from reverb.client import ReverbClient
+from reverb.config import ReverbConfig
+from reverb.executors import HandlerExecutors, OffloadedHandler, wrap_handler
+
+
+def _record_pid(event, data, channel):
+    """Module-level so it can be sent to a process pool."""
+    Path(data["path"]).write_text(str(os.getpid()))
+
+
+class TestWrapHandler:
+    """Tests for wrap_handler."""
+
+    def test_plain_async_handler_unchanged(self) -> None:
+        """Test async handlers without options are bound as they are."""
+
+        async def handler(event, data, channel):
+            pass
+
+        assert wrap_handler(handler, HandlerExecutors()) is handler
+
+    def test_sync_handler_defaults_to_thread_pool(self) -> None:
+        """Test sync handlers go to the shared thread pool."""
+        executors = HandlerExecutors(threads=2)
+
+        wrapped = wrap_handler(lambda e, d, c: None, executors)
+
+        assert isinstance(wrapped, OffloadedHandler)
+        assert wrapped.executor is executors.resolve("thread")
+        executors.shutdown()
+
+    def test_executor_rejected_for_async_handler(self) -> None:
+        """Test asking to offload an async handler is an error."""
+
+        async def handler(event, data, channel):
+            pass
+
+        with pytest.raises(ValueError, match="sync handlers"):
+            wrap_handler(handler, HandlerExecutors(), executor="thread")
+
+    def test_wrapper_equals_original(self) -> None:
+        """Test the wrapper compares equal to the function it wraps."""
+
+        def handler(event, data, channel):
+            pass
+
+        executors = HandlerExecutors()
+        assert wrap_handler(handler, executors) == handler
+        executors.shutdown()
+
+
+class TestOffloading:
+    """Tests for sync handlers bound on clients and channels."""
+
+    async def test_sync_handler_runs_off_loop(self, config: ReverbConfig) -> None:
+        """Test a blocking sync handler does not block the event loop."""
+        client = ReverbClient(config=config)
+        channel = PublicChannel("vitals", client)
+        loop_thread = threading.get_ident()
+        seen: list[int] = []
+
+        def collect(event, data, channel_name):
+            time.sleep(0.05)
+            seen.append(threading.get_ident())
+
+        channel.bind("vitals.request", collect)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        await channel._handle_event("vitals.request", {})
+        task.cancel()
+
+        assert seen and seen[0] != loop_thread
+        assert ticks > 3
+        client._executors.shutdown()
+
+    async def test_custom_executor(self, config: ReverbConfig) -> None:
+        """Test an Executor instance is used as given."""
+        client = ReverbClient(config=config)
+        calls: list[str] = []
+
+        with ThreadPoolExecutor(1, thread_name_prefix="custom") as pool:
+            client.bind(
+                "ping",
+                lambda e, d, c: calls.append(threading.current_thread().name),
+                executor=pool,
+            )
+            await client._dispatch_global("ping", {}, None)
+
+        assert calls[0].startswith("custom")
+
+    async def test_process_executor(self, config: ReverbConfig, tmp_path: Path) -> None:
+        """Test executor='process' runs the handler in another process."""
+        client = ReverbClient(config=config)
+        channel = PublicChannel("frames", client)
+        channel.bind("frame", _record_pid, executor="process")
+        path = tmp_path / "pid"
+
+        await channel._handle_event("frame", {"path": str(path)})
+
+        assert int(path.read_text()) != os.getpid()
+        client._executors.shutdown()
+
+    async def test_concurrency_limit(self, config: ReverbConfig) -> None:
+        """Test a handler never runs more than its concurrency limit at once."""
+        client = ReverbClient(config=config)
+        channel = PublicChannel("jobs", client)
+        active = 0
+        peak = 0
+
+        async def handler(event, data, channel_name):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.005)
+            active -= 1
+
+        channel.bind("job", handler, concurrency=2)
+        await asyncio.gather(*(channel._handle_event("job", {}) for _ in range(8)))
+
+        assert peak == 2
+
+    def test_unbind_with_original_function(self, config: ReverbConfig) -> None:
+        """Test unbinding a sync handler by the function that was bound."""
+        client = ReverbClient(config=config)
+
+        def handler(event, data, channel):
+            pass
+
+        client.bind("ping", handler)
+        assert handler in client._global_handlers["ping"]
+
+        client.unbind("ping", handler)
+
+        assert "ping" not in client._global_handlers
+        client._executors.shutdown()
+
+
+class TestConcurrentFanOut:
+    """Tests for concurrent handlers, timeouts and handler latency."""
+
+    async def test_concurrent_handler_does_not_delay_others(self, config: ReverbConfig) -> None:
+        """Test a slow concurrent handler runs alongside the event's other handlers."""
+        client = ReverbClient(config=config)
+        channel = PublicChannel("device.1", client)
+        order: list[str] = []
+
+        async def slow_post(event, data, channel_name):
+            await asyncio.sleep(0.05)
+            order.append("slow")
+
+        async def fast(event, data, channel_name):
+            order.append("fast")
+
+        channel.bind("status", slow_post, concurrent=True)
+        channel.bind("status", fast)
+
+        await channel._handle_event("status", {})
+
+        assert order == ["fast", "slow"]
+
+    async def test_concurrent_handlers_overlap(self, config: ReverbConfig) -> None:
+        """Test concurrent handlers of one event run at the same time."""
+        client = ReverbClient(config=config)
+
+        async def wait(event, data, channel_name):
+            await asyncio.sleep(0.05)
+
+        for _ in range(3):
+            client.bind("ping", lambda *a: None, concurrent=True)
+        client.bind("ping", wait, concurrent=True)
+        client.bind("ping", lambda *a: time.sleep(0.05), concurrent=True)
+
+        started = time.perf_counter()
+        await client._dispatch_global("ping", {}, None)
+
+        assert time.perf_counter() - started < 0.09
+        client._executors.shutdown()
+
+    async def test_timeout_abandons_handler(self, config: ReverbConfig) -> None:
+        """Test a handler over its timeout is cancelled, counted and does not raise."""
+        client = ReverbClient(config=config)
+        cancelled = asyncio.Event()
+
+        async def hang(event, data, channel_name):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        client.bind("ping", hang, timeout=0.01)
+        await client._dispatch_global("ping", {}, None)
+
+        assert cancelled.is_set()
+        assert client.metrics.snapshot()["handler_timeouts_total"] == 1
+
+    async def test_latency_recorded_per_handler(self, config: ReverbConfig) -> None:
+        """Test every handler call is timed under the handler's name."""
+        client = ReverbClient(config=config)
+
+        async def quick(event, data, channel_name):
+            pass
+
+        async def slow(event, data, channel_name):
+            await asyncio.sleep(0.02)
+
+        client.bind("ping", quick)
+        client.bind("ping", slow)
+        await client._dispatch_global("ping", {}, None)
+
+        latency = client.handler_latency()
+        names = list(latency)
+        assert names[0].endswith("slow") and names[1].endswith("quick")
+        assert latency[names[0]]["count"] == 1
+        assert client.metrics.snapshot()["handler_seconds_count"] == 2
+
+    async def test_unbound_handler_is_freed(self, config: ReverbConfig) -> None:
+        """Test latency bookkeeping does not keep an unbound handler alive."""
+        client = ReverbClient(config=config)
+
+        def make_handler():
+            async def handler(event, data, channel_name):
+                pass
+
+            return handler
+
+        handler = make_handler()
+        freed = threading.Event()
+        weakref.finalize(handler, freed.set)
+        client.bind("ping", handler, concurrent=True)
+        await client._dispatch_global("ping", {}, None)
+
+        client.unbind("ping", handler)
+        del handler
+        gc.collect()
+
+        assert freed.is_set()
+        assert len(client.handler_latency()) == 1
+
+    def test_invalid_timeout(self) -> None:
+        """Test a non-positive timeout is rejected at bind time."""
+
+        async def handler(event, data, channel):
+            pass
+
+        with pytest.raises(ValueError):
+            wrap_handler(handler, HandlerExecutors(), timeout=0)
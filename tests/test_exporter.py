@@ -0,0 +1,92 @@
+"""Tests for the Prometheus exporter."""
+
+from __future__ import annotations
+
+import asyncio
+
+from reverb.client import ReverbClient
+from reverb.config import ReverbConfig
+from reverb.exporter import MetricsExporter, render
+from reverb.metrics import MetricsRegistry
+
+
+async def _get(port: int, path: str) -> tuple[str, str]:
+    """Send a GET request and return (status line, body)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = (await reader.read()).decode()
+    writer.close()
+    head, _, body = response.partition("\r\n\r\n")
+    return head.split("\r\n")[0], body
+
+
+class TestRender:
+    """Tests for the text exposition format."""
+
+    def test_counters_and_gauges(self) -> None:
+        """Test counters and gauges are rendered with HELP and TYPE lines."""
+        registry = MetricsRegistry()
+        registry.counter("frames_received_total", "Frames received").inc(3)
+        registry.gauge("queue_depth", "Queued", lambda: 2.5)
+
+        text = render(registry)
+
+        assert "# HELP reverb_frames_received_total Frames received\n" in text
+        assert "# TYPE reverb_frames_received_total counter\n" in text
+        assert "reverb_frames_received_total 3\n" in text
+        assert "# TYPE reverb_queue_depth gauge\n" in text
+        assert "reverb_queue_depth 2.5\n" in text
+
+    def test_histograms_as_summaries(self) -> None:
+        """Test histograms are rendered as summaries with quantiles."""
+        registry = MetricsRegistry()
+        registry.histogram("decode_seconds", "Decode time").observe(0.002)
+        registry.histogram_family("event_seconds", "Per event", label="event").labels(
+            'say "hi"'
+        ).observe(0.5)
+
+        text = render(registry)
+
+        assert "# TYPE reverb_decode_seconds summary\n" in text
+        assert 'reverb_decode_seconds{quantile="0.99"} ' in text
+        assert "reverb_decode_seconds_count 1\n" in text
+        assert 'reverb_event_seconds_count{event="say \\"hi\\""} 1\n' in text
+        assert text.endswith("\n")
+
+
+class TestMetricsExporter:
+    """Tests for the HTTP endpoint."""
+
+    async def test_serves_metrics(self) -> None:
+        """Test GET /metrics returns the rendered registry."""
+        registry = MetricsRegistry()
+        registry.counter("frames_sent_total").inc()
+        exporter = MetricsExporter(registry, port=0)
+        await exporter.start()
+        try:
+            status, body = await _get(exporter.port, "/metrics")
+            missing, _ = await _get(exporter.port, "/")
+        finally:
+            await exporter.stop()
+
+        assert status == "HTTP/1.1 200 OK"
+        assert "reverb_frames_sent_total 1" in body
+        assert missing == "HTTP/1.1 404 Not Found"
+        assert not exporter.is_serving
+
+    async def test_client_starts_exporter_from_config(self, config: ReverbConfig) -> None:
+        """Test metrics_port makes the client serve its metrics."""
+        config.metrics_port = 0
+        client = ReverbClient(config=config)
+        assert client._exporter is not None
+
+        await client._exporter.start()
+        try:
+            status, body = await _get(client._exporter.port, "/metrics")
+        finally:
+            await client.disconnect()
+
+        assert status == "HTTP/1.1 200 OK"
+        assert "reverb_frames_received_total 0" in body
+        assert not client._exporter.is_serving
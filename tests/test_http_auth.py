@@ -0,0 +1,283 @@
+"""Tests for HTTP endpoint authorization against a local stub server."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from unittest.mock import AsyncMock
+from urllib.parse import parse_qsl
+
+import pytest
+from pydantic import SecretStr
+
+from reverb.auth import Authenticator
+from reverb.client import ReverbClient
+from reverb.config import ReverbConfig
+from reverb.exceptions import AuthenticationError
+from reverb.http_auth import HttpAuthProvider
+from reverb.messages import Events
+
+# Signs like a Laravel app would; the stub refuses channels containing "denied"
+_SIGNER = Authenticator("test-key", "server-secret")
+
+
+class StubAuthServer(ThreadingHTTPServer):
+    """Records requests and answers /broadcasting/auth and /broadcasting/auth/batch."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.requests: list[tuple[str, dict[str, str], dict[str, str]]] = []
+        self.peers: set[tuple[str, int]] = set()
+        self.lock = threading.Lock()
+        # Drop each connection after replying, without announcing it
+        self.hang_up = False
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/broadcasting/auth"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: StubAuthServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        form = dict(parse_qsl(body))
+        with self.server.lock:
+            self.server.requests.append((self.path, form, dict(self.headers)))
+            self.server.peers.add(self.client_address)
+
+        socket_id = form["socket_id"]
+        if self.path.endswith("/batch"):
+            names = [value for key, value in form.items() if key.startswith("channel_name[")]
+            self._reply(200, {name: self._result(socket_id, name) for name in names})
+        else:
+            result = self._result(socket_id, form["channel_name"])
+            self._reply(result["status"], result.get("data", {"message": "Forbidden"}))
+
+    def _result(self, socket_id: str, channel: str) -> dict[str, Any]:
+        if "denied" in channel:
+            return {"status": 403}
+        user_data = {"user_id": "7"} if channel.startswith("presence-") else None
+        return {"status": 200, "data": _SIGNER.authenticate(socket_id, channel, user_data)}
+
+    def _reply(self, status: int, payload: Any) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        if self.server.hang_up:
+            self.close_connection = True
+
+
+@pytest.fixture
+def server() -> Iterator[StubAuthServer]:
+    """A stub auth endpoint on a free local port."""
+    server = StubAuthServer()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpAuthProvider:
+    """Tests for the HttpAuthProvider class."""
+
+    async def test_authorize(self, server: StubAuthServer, socket_id: str) -> None:
+        """Test the endpoint's signature is returned, with the request Pusher JS would send."""
+        auth = HttpAuthProvider(server.url, headers={"Authorization": "Bearer abc"})
+
+        result = await auth.authorize(socket_id, "private-device.1")
+
+        assert result == _SIGNER.authenticate(socket_id, "private-device.1")
+        path, form, headers = server.requests[0]
+        assert path == "/broadcasting/auth"
+        assert form == {"socket_id": socket_id, "channel_name": "private-device.1"}
+        assert headers["Authorization"] == "Bearer abc"
+        assert headers["Content-Type"] == "application/x-www-form-urlencoded"
+        await auth.close()
+
+    async def test_presence_channel_data_from_server(
+        self, server: StubAuthServer, socket_id: str
+    ) -> None:
+        """Test presence user data comes from the endpoint, not the client."""
+        auth = HttpAuthProvider(server.url)
+
+        result = await auth.authorize(socket_id, "presence-room", channel_data='{"user_id":"x"}')
+
+        assert result["channel_data"] == '{"user_id":"7"}'
+        await auth.close()
+
+    async def test_refused(self, server: StubAuthServer, socket_id: str) -> None:
+        """Test a non-200 reply raises AuthenticationError."""
+        auth = HttpAuthProvider(server.url)
+
+        with pytest.raises(AuthenticationError, match="HTTP 403"):
+            await auth.authorize(socket_id, "private-denied")
+        await auth.close()
+
+    async def test_unreachable(self, socket_id: str) -> None:
+        """Test a connection failure raises AuthenticationError."""
+        auth = HttpAuthProvider("http://127.0.0.1:1/broadcasting/auth", timeout=1.0)
+
+        with pytest.raises(AuthenticationError, match="request failed"):
+            await auth.authorize(socket_id, "private-a")
+
+    async def test_cached_per_socket(self, server: StubAuthServer, socket_id: str) -> None:
+        """Test results are reused for the same socket and fetched again for a new one."""
+        auth = HttpAuthProvider(server.url)
+
+        first = await auth.authorize(socket_id, "private-a")
+        again = await auth.authorize(socket_id, "private-a")
+        other = await auth.authorize("999.1", "private-a")
+
+        assert again is first
+        assert other != first
+        assert len(server.requests) == 2
+        await auth.close()
+
+    async def test_connections_reused(self, server: StubAuthServer, socket_id: str) -> None:
+        """Test requests share a bounded pool of keep-alive connections."""
+        auth = HttpAuthProvider(server.url, pool_size=2)
+
+        auths = await auth.authorize_many(socket_id, [f"private-{i}" for i in range(40)])
+
+        assert len(auths) == 40
+        assert len(server.requests) == 40
+        assert len(server.peers) <= 2
+        await auth.close()
+
+    async def test_stale_connection_retried(self, server: StubAuthServer, socket_id: str) -> None:
+        """Test a pooled connection closed by the server is replaced transparently."""
+        server.hang_up = True
+        auth = HttpAuthProvider(server.url, pool_size=1)
+
+        await auth.authorize(socket_id, "private-a")
+        result = await auth.authorize(socket_id, "private-b")
+
+        assert result == _SIGNER.authenticate(socket_id, "private-b")
+        assert len(server.peers) == 2
+        await auth.close()
+
+    async def test_authorize_many_skips_refused(
+        self, server: StubAuthServer, socket_id: str
+    ) -> None:
+        """Test refused channels are left out of authorize_many()."""
+        auth = HttpAuthProvider(server.url)
+
+        auths = await auth.authorize_many(socket_id, ["private-a", "private-denied"])
+
+        assert list(auths) == ["private-a"]
+        await auth.close()
+
+    async def test_batched(self, server: StubAuthServer, socket_id: str) -> None:
+        """Test a batch endpoint authorizes many channels in a few requests."""
+        auth = HttpAuthProvider(server.url, batch_endpoint=server.url + "/batch", max_batch=100)
+        names = [f"private-device.{i}" for i in range(250)] + ["private-denied"]
+
+        auths = await auth.authorize_many(socket_id, names)
+
+        assert len(server.requests) == 3
+        assert len(auths) == 250
+        assert auths["private-device.42"] == _SIGNER.authenticate(socket_id, "private-device.42")
+        # Now cached: neither call reaches the server
+        await auth.authorize_many(socket_id, names[:250])
+        await auth.authorize(socket_id, "private-device.7")
+        assert len(server.requests) == 3
+        await auth.close()
+
+    def test_invalid_endpoints(self) -> None:
+        """Test non-HTTP endpoints and cross-host batch endpoints are rejected."""
+        with pytest.raises(ValueError):
+            HttpAuthProvider("ws://example.com/auth")
+        with pytest.raises(ValueError):
+            HttpAuthProvider(
+                "https://a.example.com/auth", batch_endpoint="https://b.example.com/auth"
+            )
+
+
+class TestClientAuthEndpoint:
+    """Tests for a client authorizing through an endpoint."""
+
+    async def test_config_selects_endpoint(
+        self, server: StubAuthServer, config: ReverbConfig
+    ) -> None:
+        """Test auth_endpoint and auth_token configure an HttpAuthProvider."""
+        config = config.model_copy(
+            update={
+                "auth_endpoint": server.url,
+                "auth_token": SecretStr("abc"),
+                "app_secret": SecretStr(""),
+            }
+        )
+
+        client = ReverbClient(config=config)
+
+        assert isinstance(client.auth, HttpAuthProvider)
+        assert client.auth._headers["Authorization"] == "Bearer abc"
+
+    async def test_subscribe_many_private(
+        self, server: StubAuthServer, config: ReverbConfig, socket_id: str
+    ) -> None:
+        """Test private channels are subscribed with the endpoint's signatures."""
+        auth = HttpAuthProvider(server.url, batch_endpoint=server.url + "/batch")
+        client = ReverbClient(config=config, auth=auth)
+        client._connection._socket_id = socket_id
+        client._connection.send = AsyncMock()  # type: ignore[method-assign]
+        names = [f"private-device.{i}" for i in range(20)]
+
+        await client.subscribe_many(names, wait=False)
+
+        assert len(server.requests) == 1
+        sent = [call.args[0] for call in client._connection.send.call_args_list]
+        assert [m.event for m in sent] == [Events.SUBSCRIBE] * 20
+        assert sent[3].data["auth"] == _SIGNER.authenticate(socket_id, "private-device.3")["auth"]
+        await client.disconnect()
+
+    async def test_presence_without_user_data(
+        self, server: StubAuthServer, config: ReverbConfig, socket_id: str
+    ) -> None:
+        """Test presence channels need no user_data: the endpoint supplies channel_data."""
+        auth = HttpAuthProvider(server.url, batch_endpoint=server.url + "/batch")
+        client = ReverbClient(config=config, auth=auth)
+        client._connection._socket_id = socket_id
+        client._connection.send = AsyncMock()  # type: ignore[method-assign]
+
+        channels = await client.subscribe_many(
+            ["presence-room.1", "presence-room.2", "private-device.1"], wait=False
+        )
+
+        assert len(server.requests) == 1
+        sent = [call.args[0] for call in client._connection.send.call_args_list]
+        assert sent[0].data["channel_data"] == '{"user_id":"7"}'
+        assert channels[0].me == {"user_id": "7"}  # type: ignore[attr-defined]
+        await client.disconnect()
+
+    async def test_refused_channel_raises(
+        self, server: StubAuthServer, config: ReverbConfig, socket_id: str
+    ) -> None:
+        """Test subscribing to a channel the endpoint refuses raises AuthenticationError."""
+        client = ReverbClient(config=config, auth=HttpAuthProvider(server.url))
+        client._connection._socket_id = socket_id
+        client._connection.send = AsyncMock()  # type: ignore[method-assign]
+
+        with pytest.raises(AuthenticationError):
+            await client.subscribe("private-denied")
+
+        assert "private-denied" not in client.channels
+        await client.disconnect()
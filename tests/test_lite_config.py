@@ -0,0 +1,155 @@
+"""Tests for the pydantic-free LiteConfig."""
+
+from __future__ import annotations
+
+import dataclasses
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from reverb.client import ReverbClient
+from reverb.config import ReverbConfig
+from reverb.lite_config import LiteConfig, Secret, read_env_file
+
+REQUIRED = {
+    "REVERB_APP_KEY": "test-key",
+    "REVERB_APP_SECRET": "test-secret",
+    "REVERB_HOST": "localhost",
+}
+
+
+class TestLiteConfig:
+    """Tests for the LiteConfig class."""
+
+    def test_matches_reverb_config(self) -> None:
+        """Test LiteConfig has the same fields and defaults as ReverbConfig."""
+        lite = {f.name: f.default for f in dataclasses.fields(LiteConfig)}
+        full = {name: f.default for name, f in ReverbConfig.model_fields.items()}
+
+        assert lite.keys() == full.keys()
+        for name in ("app_key", "app_secret", "host"):
+            del lite[name], full[name]
+        assert lite == full
+
+    def test_from_env_converts_types(self) -> None:
+        """Test environment strings are converted to the field types."""
+        environ = {
+            **REQUIRED,
+            "REVERB_PORT": "8080",
+            "REVERB_RECONNECT_ENABLED": "false",
+            "REVERB_PING_INTERVAL": "12.5",
+            "REVERB_MAX_RECONNECT_ATTEMPTS": "5",
+            "REVERB_HANDLER_PROCESSES": "",
+            "REVERB_AUTH_ENDPOINT": "https://app.example.com/broadcasting/auth",
+            "reverb_scheme": "ws",
+        }
+
+        config = LiteConfig.from_env(env_file=None, environ=environ)
+
+        assert config.port == 8080
+        assert config.reconnect_enabled is False
+        assert config.ping_interval == 12.5
+        assert config.max_reconnect_attempts == 5
+        assert config.handler_processes is None
+        assert config.scheme == "ws"
+        assert config.app_secret.get_secret_value() == "test-secret"
+        assert config.auth_endpoint == "https://app.example.com/broadcasting/auth"
+        assert config.auth_token is None
+
+    def test_precedence(self, tmp_path: Path) -> None:
+        """Test keyword arguments beat the environment, which beats the .env file."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# comment\n"
+            "export REVERB_HOST=from-file\n"
+            "REVERB_PORT='7000'\n"
+            'REVERB_CLIENT_NAME="from file"\n'
+            "REVERB_LOG_LEVEL=DEBUG # trailing comment\n"
+            "OTHER=ignored\n"
+        )
+
+        config = LiteConfig.from_env(
+            env_file=env_file,
+            environ={"REVERB_APP_KEY": "k", "REVERB_APP_SECRET": "s", "REVERB_PORT": "7001"},
+            client_name="from-kwargs",
+        )
+
+        assert config.host == "from-file"
+        assert config.port == 7001
+        assert config.client_name == "from-kwargs"
+        assert config.log_level == "DEBUG"
+
+    def test_missing_required(self) -> None:
+        """Test missing required settings are reported by variable name."""
+        with pytest.raises(ValueError, match="REVERB_HOST"):
+            LiteConfig.from_env(env_file=None, environ={"REVERB_APP_KEY": "k"})
+
+    def test_invalid_values(self) -> None:
+        """Test bad numbers and Literal values are rejected."""
+        with pytest.raises(ValueError, match="REVERB_PORT"):
+            LiteConfig.from_env(env_file=None, environ={**REQUIRED, "REVERB_PORT": "http"})
+        with pytest.raises(ValueError, match="scheme"):
+            LiteConfig.from_env(env_file=None, environ={**REQUIRED, "REVERB_SCHEME": "http"})
+
+    def test_secret_hidden(self) -> None:
+        """Test the app secret does not appear in the repr."""
+        config = LiteConfig(
+            app_key="key",
+            host="localhost",
+            app_secret="hunter2",  # type: ignore[arg-type]
+            auth_token="t0ken",  # type: ignore[arg-type]
+        )
+
+        assert isinstance(config.app_secret, Secret)
+        assert isinstance(config.auth_token, Secret)
+        assert "hunter2" not in repr(config)
+        assert "t0ken" not in repr(config)
+
+    def test_model_copy(self) -> None:
+        """Test model_copy() returns an updated copy, as ReverbConfig's does."""
+        config = LiteConfig.from_env(env_file=None, environ=REQUIRED)
+
+        copy = config.model_copy(update={"host": "other"})
+
+        assert copy.host == "other"
+        assert config.host == "localhost"
+
+    def test_read_env_file_missing(self, tmp_path: Path) -> None:
+        """Test a missing .env file reads as empty."""
+        assert read_env_file(tmp_path / "absent") == {}
+
+    def test_client_accepts_lite_config(self) -> None:
+        """Test a client built from LiteConfig uses its settings."""
+        config = LiteConfig.from_env(env_file=None, environ={**REQUIRED, "REVERB_PORT": "8080"})
+
+        client = ReverbClient(config=config)
+
+        assert client._connection.config.build_url().startswith("wss://localhost:8080/app/test-key")
+
+
+class TestLazyImports:
+    """Tests for deferred imports in the reverb package."""
+
+    def test_lite_client_does_not_load_pydantic(self) -> None:
+        """Test importing reverb and building a LiteConfig client skips pydantic."""
+        code = (
+            "import sys\n"
+            "import reverb\n"
+            "assert 'reverb.client' not in sys.modules\n"
+            "from reverb import LiteConfig, ReverbClient\n"
+            "ReverbClient(config=LiteConfig(app_key='k', host='localhost'))\n"
+            "assert 'pydantic' not in sys.modules, 'pydantic loaded'\n"
+            "from reverb import ReverbConfig\n"
+            "assert 'pydantic' in sys.modules\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute(self) -> None:
+        """Test unknown names still raise AttributeError."""
+        import reverb
+
+        with pytest.raises(AttributeError):
+            reverb.NoSuchThing  # noqa: B018
@@ -2,7 +2,14 @@
 
 import json
 
-from reverb.messages import Events, Message, Messages
+import pytest
+
+from reverb.messages import Events, JsonCodec, Message, Messages, NameTable, get_codec, names
+
+
+def _fresh(text: str) -> str:
+    """Return an equal string that is not the compiler's constant instance."""
+    return text[:1] + text[1:]
 
 
 class TestMessage:
@@ -53,6 +60,65 @@ class TestMessage:
 
         assert msg.data == "plain string"
 
+    def test_data_decoded_lazily(self):
+        """Test the inner data string is decoded on first access only."""
+        raw = json.dumps({"event": "e", "data": json.dumps({"key": "value"})})
+
+        msg = Message.from_json(raw)
+
+        assert msg.is_decoded is False
+        assert msg.data == {"key": "value"}
+        assert msg.is_decoded is True
+        assert msg.data is msg.data  # Cached
+
+    def test_data_setter_discards_raw_payload(self):
+        """Test assigning data replaces a pending undecoded payload."""
+        msg = Message.from_json(json.dumps({"event": "e", "data": "{}"}))
+
+        msg.data = {"replaced": True}
+
+        assert msg.is_decoded is True
+        assert msg.data == {"replaced": True}
+
+    def test_equality(self):
+        """Test messages compare by event, data and channel."""
+        parsed = Message.from_json(json.dumps({"event": "e", "channel": "c", "data": '{"a": 1}'}))
+
+        assert parsed == Message(event="e", data={"a": 1}, channel="c")
+        assert parsed != Message(event="e", data={"a": 2}, channel="c")
+
+    def test_default_data(self):
+        """Test messages default to a fresh empty dict."""
+        first = Message(event="e")
+        second = Message(event="e")
+
+        assert first.data == {}
+        assert first.data is not second.data
+
+    def test_slotted(self):
+        """Test messages have no per-instance __dict__."""
+        msg = Message(event="e")
+
+        assert not hasattr(msg, "__dict__")
+
+    def test_registered_names_are_interned(self):
+        """Test parsed event/channel names reuse registered string instances."""
+        event = names.intern(_fresh("interned.event"))
+        channel = names.intern(_fresh("interned-channel"))
+
+        msg = Message.from_json(
+            json.dumps({"event": "interned.event", "channel": "interned-channel", "data": "{}"})
+        )
+
+        assert msg.event is event
+        assert msg.channel is channel
+
+    def test_protocol_events_are_interned(self):
+        """Test protocol event names are registered up front."""
+        msg = Message.from_json(json.dumps({"event": "pusher:ping", "data": "{}"}))
+
+        assert msg.event is Events.PING
+
     def test_to_json(self):
         """Test serializing a message."""
         msg = Message(event="test.event", data={"key": "value"}, channel="test-channel")
@@ -73,6 +139,112 @@ class TestMessage:
         assert "channel" not in result
 
 
+class TestCodecs:
+    """Tests for the pluggable JSON codec layer."""
+
+    def test_stdlib_codec(self):
+        """Test the stdlib codec is always available."""
+        codec = get_codec("json")
+
+        assert type(codec) is JsonCodec
+        assert codec.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_codecs_are_shared(self):
+        """Test codec instances are cached by name."""
+        assert get_codec("json") is get_codec("json")
+
+    def test_auto_codec(self):
+        """Test 'auto' resolves to an installed backend."""
+        codec = get_codec("auto")
+
+        assert codec.loads(codec.encode({"a": [1, 2]})) == {"a": [1, 2]}
+
+    def test_unknown_codec(self):
+        """Test unknown codec names are rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_codec("yaml")
+
+    def test_from_json_bytes(self):
+        """Test parsing a frame passed as raw UTF-8 bytes."""
+        raw = json.dumps(
+            {
+                "event": "my.event",
+                "channel": "my-channel",
+                "data": json.dumps({"name": "Ærlig"}),
+            }
+        ).encode("utf-8")
+
+        msg = Message.from_json(raw)
+
+        assert msg.event == "my.event"
+        assert msg.data == {"name": "Ærlig"}
+
+    @pytest.mark.parametrize("name", ["orjson", "msgspec", "ujson"])
+    def test_optional_backend_round_trip(self, name):
+        """Test optional backends decode and encode protocol frames like the stdlib."""
+        pytest.importorskip(name)
+        codec = get_codec(name)
+        raw = json.dumps({"event": "e", "channel": "c", "data": '{"k": "v"}'}).encode()
+
+        msg = Message.from_json(raw, codec)
+        encoded = msg.encode(codec)
+        result = json.loads(encoded)
+
+        assert msg.data == {"k": "v"}
+        assert json.loads(result["data"]) == {"k": "v"}
+        assert json.loads(msg.to_json(codec)) == result
+
+    @pytest.mark.parametrize("name", ["orjson", "msgspec", "ujson"])
+    def test_optional_backend_keeps_plain_string_data(self, name):
+        """Test optional backends keep non-JSON string data as-is."""
+        pytest.importorskip(name)
+
+        msg = Message.from_json(b'{"event": "e", "data": "plain string"}', get_codec(name))
+
+        assert msg.data == "plain string"
+
+
+class TestNameTable:
+    """Tests for the NameTable intern table."""
+
+    def test_intern_returns_first_instance(self):
+        """Test intern() returns the first registered instance."""
+        table = NameTable()
+        first = _fresh("ab")
+
+        assert table.intern(first) is first
+        assert table.intern(_fresh("ab")) is first
+        assert "ab" in table
+        assert len(table) == 1
+
+    def test_get_unknown_passes_through(self):
+        """Test unknown names are returned unchanged and not registered."""
+        table = NameTable()
+        name = _fresh("xy")
+
+        assert table.get(name) is name
+        assert name not in table
+
+    def test_release_forgets_after_last_registration(self):
+        """Test release() drops a name only once every registration is released."""
+        table = NameTable()
+        table.intern("a")
+        table.intern("a")
+
+        table.release("a")
+        assert "a" in table
+        table.release("a")
+        assert "a" not in table
+        assert len(table) == 0
+
+    def test_release_unknown_is_noop(self):
+        """Test releasing an unregistered name does nothing."""
+        table = NameTable()
+        table.release("missing")
+
+        assert len(table) == 0
+
+
 class TestMessages:
     """Tests for the Messages factory class."""
 
@@ -0,0 +1,113 @@
+"""Tests for the metrics registry."""
+
+from __future__ import annotations
+
+import pytest
+
+from reverb.metrics import Histogram, HistogramFamily, MetricsRegistry
+
+
+class TestHistogram:
+    """Tests for the Histogram class."""
+
+    def test_empty(self) -> None:
+        """Test an empty histogram reports zeros."""
+        histogram = Histogram()
+
+        assert histogram.count == 0
+        assert histogram.percentile(99) == 0.0
+        assert histogram.mean == 0.0
+
+    def test_percentiles_within_bucket_precision(self) -> None:
+        """Test percentiles are accurate to the bucket resolution."""
+        histogram = Histogram()
+        for i in range(1, 1001):
+            histogram.observe(i / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.125)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.125)
+        assert histogram.percentile(100) >= 1.0
+
+    def test_percentile_never_below_value(self) -> None:
+        """Test a single value is reported at or just above itself."""
+        histogram = Histogram()
+        histogram.observe(0.0123)
+
+        assert 0.0123 <= histogram.percentile(50) <= 0.0123 * 1.125
+
+    def test_tiny_values_share_first_bucket(self) -> None:
+        """Test values at or below a microsecond do not break bucketing."""
+        histogram = Histogram()
+        histogram.observe(0.0)
+        histogram.observe(1e-9)
+
+        assert histogram.percentile(100) == pytest.approx(1e-6)
+
+    def test_window_keeps_recent_values(self) -> None:
+        """Test a windowed histogram forgets the oldest observations."""
+        histogram = Histogram(window=3)
+        for value in (10.0, 0.001, 0.001, 0.001):
+            histogram.observe(value)
+
+        assert histogram.count == 3
+        assert histogram.sum == pytest.approx(0.003)
+        assert histogram.percentile(100) < 0.002
+
+
+class TestHistogramFamily:
+    """Tests for the HistogramFamily class."""
+
+    def test_series_per_label_value(self) -> None:
+        """Test each label value gets its own histogram, reused on later calls."""
+        family = HistogramFamily("latency_seconds", label="event")
+
+        family.labels("a").observe(0.1)
+        family.labels("a").observe(0.2)
+        family.labels("b").observe(0.3)
+
+        assert family.labels("a").count == 2
+        assert len(family) == 2
+
+    def test_series_capped(self) -> None:
+        """Test label values past max_series share the overflow series."""
+        family = HistogramFamily("latency_seconds", label="event", max_series=2)
+
+        for name in ("a", "b", "c", "d"):
+            family.labels(name).observe(0.1)
+
+        series = dict(family.items())
+        assert series[HistogramFamily.OTHER].count == 2
+        assert "c" not in series
+
+
+class TestMetricsRegistry:
+    """Tests for the MetricsRegistry class."""
+
+    def test_metrics_are_shared_by_name(self) -> None:
+        """Test looking up a metric twice returns the same object."""
+        registry = MetricsRegistry()
+
+        assert registry.counter("a") is registry.counter("a")
+        assert registry.histogram("h") is registry.histogram("h")
+
+    def test_snapshot_flattens_histograms(self) -> None:
+        """Test histograms appear in the snapshot as summary statistics."""
+        registry = MetricsRegistry()
+        registry.counter("frames_total").inc(2)
+        registry.histogram("rtt_seconds").observe(0.01)
+
+        snapshot = registry.snapshot()
+
+        assert snapshot["frames_total"] == 2
+        assert snapshot["rtt_seconds_count"] == 1
+        assert snapshot["rtt_seconds_p99"] == pytest.approx(0.01, rel=0.125)
+
+    def test_snapshot_labels_family_series(self) -> None:
+        """Test family series appear in the snapshot with their label."""
+        registry = MetricsRegistry()
+        registry.histogram_family("event_seconds", label="event").labels("ping").observe(0.5)
+
+        snapshot = registry.snapshot()
+
+        assert snapshot['event_seconds_count{event="ping"}'] == 1
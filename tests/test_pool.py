@@ -0,0 +1,175 @@
+"""Tests for the connection pool."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock
+
+import pytest
+
+from reverb.config import ReverbConfig
+from reverb.connection import ConnectionState
+from reverb.pool import HashRing, ReverbPool
+
+
+class TestHashRing:
+    """Tests for the HashRing class."""
+
+    def test_empty_ring(self) -> None:
+        """Test an empty ring owns nothing."""
+        assert HashRing().get("device.1") is None
+
+    def test_keys_spread_over_nodes(self) -> None:
+        """Test keys are distributed roughly evenly."""
+        ring = HashRing()
+        for node in range(4):
+            ring.add(node)
+
+        counts = Counter(ring.get(f"device.{i}") for i in range(4000))
+
+        assert set(counts) == {0, 1, 2, 3}
+        assert min(counts.values()) > 500
+
+    def test_removal_moves_only_that_nodes_keys(self) -> None:
+        """Test removing a node reassigns only its own keys."""
+        ring = HashRing()
+        for node in range(4):
+            ring.add(node)
+        keys = [f"device.{i}" for i in range(1000)]
+        before = {key: ring.get(key) for key in keys}
+
+        ring.remove(2)
+        after = {key: ring.get(key) for key in keys}
+
+        for key in keys:
+            if before[key] != 2:
+                assert after[key] == before[key]
+            else:
+                assert after[key] != 2
+
+    def test_readding_restores_assignment(self) -> None:
+        """Test a node that comes back gets its keys back."""
+        ring = HashRing()
+        for node in range(3):
+            ring.add(node)
+        before = {f"k{i}": ring.get(f"k{i}") for i in range(200)}
+
+        ring.remove(1)
+        ring.add(1)
+
+        assert {key: ring.get(key) for key in before} == before
+
+
+def _connected_pool(config: ReverbConfig, size: int = 3) -> ReverbPool:
+    """A pool whose members look connected and accept every frame."""
+    pool = ReverbPool(config=config, size=size)
+    for node, member in enumerate(pool.clients):
+        member._connection.send = AsyncMock()  # type: ignore[method-assign]
+        member._connection._running = True
+        member._connection._set_state(ConnectionState.CONNECTED)
+        pool._ring.add(node)
+    return pool
+
+
+class TestReverbPool:
+    """Tests for the ReverbPool class."""
+
+    def test_size_must_be_positive(self, config: ReverbConfig) -> None:
+        """Test an empty pool is rejected."""
+        with pytest.raises(ValueError):
+            ReverbPool(config=config, size=0)
+
+    def test_hosts_assigned_round_robin(self, config: ReverbConfig) -> None:
+        """Test each member connects to its own host."""
+        pool = ReverbPool(config=config, size=3, hosts=["a.example", "b.example"])
+
+        assert [m._config.host for m in pool.clients] == ["a.example", "b.example", "a.example"]
+
+    async def test_channels_sharded_by_hash(self, config: ReverbConfig) -> None:
+        """Test each channel is subscribed on the connection the ring assigns."""
+        pool = _connected_pool(config)
+
+        channels = await pool.subscribe_many([f"device.{i}" for i in range(30)], wait=False)
+
+        for channel in channels:
+            owner = pool.client_for(channel.name)
+            assert owner is pool.clients[pool._ring.get(channel.name)]  # type: ignore[index]
+            assert channel.name in owner._channels
+        assert all(len(member._channels) > 0 for member in pool.clients)
+
+    async def test_rebalance_on_connection_loss(self, config: ReverbConfig) -> None:
+        """Test a lost connection's channels move elsewhere and come back with their bindings."""
+        pool = _connected_pool(config)
+        pool._watchers = [asyncio.create_task(pool._watch(i)) for i in range(3)]
+        channels = await pool.subscribe_many([f"device.{i}" for i in range(30)], wait=False)
+
+        async def handler(event, data, channel):
+            pass
+
+        for channel in channels:
+            channel.bind("status", handler)
+        lost = pool.clients[0]
+        moved = [name for name in lost._channels]
+        assert moved
+
+        lost._connection._set_state(ConnectionState.RECONNECTING)
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert lost._channels == {}
+        for name in moved:
+            owner = pool.client_for(name)
+            assert owner is not lost
+            assert handler in owner._channels[name]._handlers["status"]
+        assert pool.metrics.snapshot()["pool_channel_migrations_total"] == len(moved)
+
+        lost._connection._set_state(ConnectionState.CONNECTED)
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert sorted(lost._channels) == sorted(moved)
+        for member in pool.clients[1:]:
+            assert not set(member._channels) & set(moved)
+
+        await pool.disconnect()
+
+    async def test_latest_only_survives_rebalance(self, config: ReverbConfig) -> None:
+        """Test a moved channel keeps its latest-value setting on the new connection."""
+        pool = _connected_pool(config)
+        pool._watchers = [asyncio.create_task(pool._watch(i)) for i in range(3)]
+        channels = await pool.subscribe_many(
+            [f"device.{i}" for i in range(30)], wait=False, latest_only=["position"]
+        )
+        lost = pool.clients[0]
+        moved = list(lost._channels)
+        assert moved
+
+        lost._connection._set_state(ConnectionState.RECONNECTING)
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert not lost._connection.latest
+        for name in moved:
+            owner = pool.client_for(name)
+            assert owner is not None
+            assert owner._connection.latest._channels[name] == frozenset({"position"})
+        assert all(channel._latest_only == ("position",) for channel in channels)
+
+        await pool.disconnect()
+
+    async def test_listen_returns_when_all_lost(self, config: ReverbConfig) -> None:
+        """Test listen() returns once no connection is left."""
+        pool = _connected_pool(config, size=2)
+        pool._watchers = [asyncio.create_task(pool._watch(i)) for i in range(2)]
+        listener = asyncio.create_task(pool.listen())
+        await asyncio.sleep(0)
+
+        pool.clients[0]._connection._set_state(ConnectionState.RECONNECTING)
+        await asyncio.sleep(0.01)
+        assert not listener.done()
+
+        pool.clients[1]._connection._set_state(ConnectionState.CLOSED)
+        await asyncio.wait_for(listener, timeout=0.1)
+
+        await pool.disconnect()
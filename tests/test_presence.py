@@ -0,0 +1,217 @@
+"""Tests for the presence member store."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from reverb.presence import MemberJoined, MemberLeft, MembersResynced, MemberStore
+
+
+class TestMemberStore:
+    """Tests for the MemberStore class."""
+
+    def test_add_and_remove(self) -> None:
+        """Test joins and leaves are returned as typed changes."""
+        store = MemberStore()
+
+        joined = store.add("1", {"name": "Alice"})
+        left = store.remove("1")
+
+        assert joined == MemberJoined("1", {"name": "Alice"}, 1)
+        assert left == MemberLeft("1", {"name": "Alice"}, 2)
+        assert len(store) == 0
+        assert store.generation == 2
+
+    def test_no_op_changes(self) -> None:
+        """Test re-adding an unchanged member or removing an absent one changes nothing."""
+        store = MemberStore()
+        store.add("1", {"name": "Alice"})
+
+        assert store.add("1", {"name": "Alice"}) is None
+        assert store.remove("2") is None
+        assert store.generation == 1
+        assert store.add("1", {"name": "Alicia"}) == MemberJoined("1", {"name": "Alicia"}, 2)
+
+    def test_view_is_live_and_read_only(self) -> None:
+        """Test the view reflects changes without copying and rejects writes."""
+        store = MemberStore()
+        view = store.view
+
+        store.add("1")
+        store.resync({"2": {}, "3": {}})
+
+        assert set(view) == {"2", "3"}
+        assert "2" in store and "1" not in store
+        assert store.get("2") == {}
+        with pytest.raises(TypeError):
+            view["4"] = {}  # type: ignore[index]
+
+    def test_resync_diff(self) -> None:
+        """Test a snapshot is reported as the difference from the current list."""
+        store = MemberStore()
+
+        first = store.resync({"1": {"v": 1}, "2": {}, "3": {}})
+        second = store.resync({"1": {"v": 2}, "3": {}, "4": {}})
+
+        assert first.initial
+        assert set(first.joined) == {"1", "2", "3"}
+        assert second == MembersResynced(
+            joined={"4": {}}, left={"2": {}}, updated={"1": {"v": 2}}, generation=2, initial=False
+        )
+
+    def test_unchanged_resync_is_falsy(self) -> None:
+        """Test a snapshot equal to the current list is falsy and keeps the generation."""
+        store = MemberStore()
+        store.resync({"1": {}})
+
+        resynced = store.resync({"1": {}})
+
+        assert not resynced
+        assert store.generation == 1
+
+    def test_clear_makes_next_resync_initial(self) -> None:
+        """Test clear() forgets members and the next resync is initial."""
+        store = MemberStore()
+        store.resync({"1": {}})
+
+        store.clear()
+
+        assert len(store) == 0
+        assert store.resync({"1": {}}).initial
+
+    def test_compact_user_info(self) -> None:
+        """Test user_info keys are interned and empty infos are shared."""
+        store = MemberStore()
+        key = b"avatar".decode()  # not interned by the compiler
+
+        store.add("1", {key: "a.png"})
+        store.add("2", None)
+        store.add("3", {})
+
+        (stored_key,) = store.view["1"]
+        assert stored_key is sys.intern("avatar")
+        assert store.view["2"] is store.view["3"]
+
+    def test_user_ids_normalized(self) -> None:
+        """Test numeric user ids are stored as strings."""
+        store = MemberStore()
+
+        store.add(7, {})  # type: ignore[arg-type]
+        store.resync({8: {}})  # type: ignore[dict-item]
+
+        assert list(store) == ["8"]
+        assert store.remove(8) == MemberLeft("8", {}, 3)  # type: ignore[arg-type]
+
+
+def _roster(store: MemberStore, n: int = 100) -> None:
+    """Fill a store: every 10th member is a camera, the rest sensors; odd ones are outdoors."""
+    store.resync(
+        {
+            f"u{i:03d}": {"role": "camera" if i % 10 == 0 else "sensor", "outdoor": i % 2 == 1}
+            for i in range(n)
+        }
+    )
+
+
+class TestMemberQueries:
+    """Tests for MemberStore queries, indexes and pages."""
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_query(self, indexed: bool) -> None:
+        """Test queries match on user_info fields, with or without an index."""
+        store = MemberStore(indexes=["role"] if indexed else ())
+        _roster(store)
+
+        cameras = [user_id for user_id, _ in store.query(role="camera")]
+
+        assert cameras == [f"u{i:03d}" for i in range(0, 100, 10)]
+        assert store.count(role="camera") == 10
+        assert store.count(role="sensor", outdoor=True) == 50
+        assert list(store.query(role="drone")) == []
+        assert store.count() == 100
+
+    def test_index_avoids_scan(self) -> None:
+        """Test an indexed query only looks at the index's members."""
+        store = MemberStore(indexes=["role"])
+        _roster(store)
+
+        looked_at = []
+        members = store._members
+
+        class Spy(dict):  # type: ignore[type-arg]
+            def __getitem__(self, key: str) -> object:
+                looked_at.append(key)
+                return members[key]
+
+        store._members = Spy()
+        list(store.query(role="camera", outdoor=False))
+
+        assert len(looked_at) == 10
+
+    def test_index_maintained(self) -> None:
+        """Test indexes follow joins, leaves, updates and resyncs."""
+        store = MemberStore()
+        _roster(store, 20)
+        store.add_index("role")
+
+        store.add("new", {"role": "camera"})
+        store.add("u001", {"role": "camera"})
+        store.remove("u000")
+        snapshot = {uid: info for uid, info in store.items() if uid != "u010"}
+        store.resync({**snapshot, "late": {"role": "camera"}})
+
+        assert sorted(uid for uid, _ in store.query(role="camera")) == ["late", "new", "u001"]
+        assert store.count(role="sensor") == 17
+        assert store.indexes == ("role",)
+
+    def test_unindexable_values(self) -> None:
+        """Test members with unhashable or missing fields are skipped by the index."""
+        store = MemberStore(indexes=["tags"])
+        store.add("1", {"tags": ["a"]})
+        store.add("2", {"tags": "a"})
+        store.add("3", {})
+
+        assert [uid for uid, _ in store.query(tags="a")] == ["2"]
+        assert [uid for uid, _ in store.query(tags=["a"])] == ["1"]
+
+    def test_pages(self) -> None:
+        """Test pages cover a filtered roster in user_id order."""
+        store = MemberStore(indexes=["role"])
+        _roster(store)
+
+        seen = []
+        after = None
+        while True:
+            page = store.page(limit=3, after=after, role="camera")
+            seen.extend(user_id for user_id, _ in page.members)
+            after = page.next_after
+            if after is None:
+                break
+
+        assert seen == [f"u{i:03d}" for i in range(0, 100, 10)]
+
+    def test_pages_stable_across_changes(self) -> None:
+        """Test members joining or leaving between pages do not shift the next page."""
+        store = MemberStore()
+        _roster(store, 10)
+
+        first = store.page(limit=4)
+        store.remove("u001")
+        store.add("a-first", {})
+        second = store.page(limit=4, after=first.next_after)
+
+        assert [uid for uid, _ in first.members] == ["u000", "u001", "u002", "u003"]
+        assert [uid for uid, _ in second.members] == ["u004", "u005", "u006", "u007"]
+        assert second.generation == first.generation + 2
+
+    def test_last_page(self) -> None:
+        """Test the last page has no cursor and a bad limit is rejected."""
+        store = MemberStore()
+        _roster(store, 4)
+
+        assert store.page(limit=4).next_after is None
+        assert store.page(limit=3).next_after == "u002"
+        with pytest.raises(ValueError):
+            store.page(limit=0)
@@ -0,0 +1,146 @@
+"""Tests for event routing."""
+
+from __future__ import annotations
+
+import pytest
+
+from reverb.routing import ChannelRouter, EventRouter, PatternIndex
+
+
+async def h1(event, data, channel):
+    pass
+
+
+async def h2(event, data, channel):
+    pass
+
+
+async def h3(event, data, channel):
+    pass
+
+
+class TestPatternIndex:
+    """Tests for the PatternIndex class."""
+
+    def test_single_segment_wildcard(self) -> None:
+        """Test '*' matches exactly one segment."""
+        index: PatternIndex[str] = PatternIndex()
+        index.add("device.*.status", "p")
+
+        assert index.match("device.7.status") == ["p"]
+        assert index.match("device.status") == []
+        assert index.match("device.7.8.status") == []
+
+    def test_trailing_globstar(self) -> None:
+        """Test a trailing '**' matches one or more segments."""
+        index: PatternIndex[str] = PatternIndex()
+        index.add("vitals.**", "p")
+
+        assert index.match("vitals.cpu") == ["p"]
+        assert index.match("vitals.cpu.temp") == ["p"]
+        assert index.match("vitals") == []
+
+    def test_matches_in_insertion_order(self) -> None:
+        """Test overlapping patterns come back in the order they were added."""
+        index: PatternIndex[str] = PatternIndex()
+        index.add("a.*", "second-specific")
+        index.add("*.b", "first-generic")
+        index.add("a.b", "exact")
+
+        assert index.match("a.b") == ["second-specific", "first-generic", "exact"]
+
+    @pytest.mark.parametrize("pattern", ["vit*", "a.**.b", "a.b*c"])
+    def test_invalid_patterns(self, pattern: str) -> None:
+        """Test partial-segment and non-trailing globstars are rejected."""
+        with pytest.raises(ValueError):
+            PatternIndex().add(pattern, "p")
+
+
+class TestEventRouter:
+    """Tests for the EventRouter class."""
+
+    def test_exact_then_patterns_then_match_all(self) -> None:
+        """Test handlers are returned most specific first."""
+        router = EventRouter()
+        router.bind("*", h3)
+        router.bind("vitals.*", h2)
+        router.bind("vitals.cpu", h1)
+
+        assert router.match("vitals.cpu") == (h1, h2, h3)
+        assert router.match("other") == (h3,)
+
+    def test_lookup_is_cached(self) -> None:
+        """Test repeated lookups return the same tuple without recompiling."""
+        router = EventRouter()
+        router.bind("device.*.status", h1)
+
+        first = router.match("device.1.status")
+
+        assert router.match("device.1.status") is first
+
+    def test_bind_and_unbind_invalidate(self) -> None:
+        """Test the table reflects bindings changed after a lookup."""
+        router = EventRouter()
+        assert router.match("vitals.cpu") == ()
+
+        router.bind("vitals.*", h1)
+        assert router.match("vitals.cpu") == (h1,)
+
+        router.unbind("vitals.*", h1)
+        assert router.match("vitals.cpu") == ()
+        assert "vitals.*" not in router.bindings
+
+    def test_unbind_all_for_name(self) -> None:
+        """Test unbinding without a handler removes every handler for the name."""
+        router = EventRouter()
+        router.bind("a", h1)
+        router.bind("a", h2)
+
+        router.unbind("a")
+
+        assert router.match("a") == ()
+
+    def test_invalid_pattern_rejected_on_bind(self) -> None:
+        """Test malformed patterns fail at bind time, not at dispatch."""
+        with pytest.raises(ValueError):
+            EventRouter().bind("device.st*", h1)
+
+
+class TestChannelRouter:
+    """Tests for the ChannelRouter class."""
+
+    def test_pattern_covers_every_matching_channel(self) -> None:
+        """Test one binding serves all channels matching the pattern."""
+        router = ChannelRouter()
+        router.bind("device.*", "status", h1)
+
+        assert router.match("device.1", "status") == (h1,)
+        assert router.match("device.9999", "status") == (h1,)
+        assert router.match("device.1", "other") == ()
+        assert router.match("sensor.1", "status") == ()
+
+    def test_handlers_from_several_patterns(self) -> None:
+        """Test exact names, patterns and '*' combine in bind order."""
+        router = ChannelRouter()
+        router.bind("device.*", "status", h1)
+        router.bind("device.7", "*", h2)
+        router.bind("*", "status", h3)
+
+        assert router.match("device.7", "status") == (h1, h2, h3)
+        assert router.match("device.7.sub", "status") == (h3,)
+
+    def test_unbind_forgets_pattern(self) -> None:
+        """Test the channel lookup reflects bindings removed after a lookup."""
+        router = ChannelRouter()
+        router.bind("device.*", "status", h1)
+        assert router.match("device.1", "status") == (h1,)
+
+        router.unbind("device.*", "status", h1)
+
+        assert router.match("device.1", "status") == ()
+        assert not router
+
+    def test_invalid_channel_pattern_rejected(self) -> None:
+        """Test malformed channel patterns fail at bind time."""
+        with pytest.raises(ValueError):
+            ChannelRouter().bind("device.1*", "status", h1)
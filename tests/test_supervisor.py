@@ -0,0 +1,129 @@
+"""Tests for the multi-process supervisor."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from reverb.config import ReverbConfig
+from reverb.supervisor import Supervisor, partition
+
+
+class TestPartition:
+    """Tests for channel partitioning."""
+
+    def test_partitions_are_disjoint_and_complete(self) -> None:
+        """Test every channel lands in exactly one partition."""
+        channels = [f"device.{i}" for i in range(500)]
+
+        parts = partition(channels, 4)
+
+        assert len(parts) == 4
+        assert sorted(name for part in parts for name in part) == sorted(channels)
+        assert all(part for part in parts)
+
+    def test_partitioning_is_stable(self) -> None:
+        """Test the same input always gives the same partitions."""
+        channels = [f"device.{i}" for i in range(100)]
+
+        assert partition(channels, 3) == partition(list(channels), 3)
+
+    def test_duplicates_ignored(self) -> None:
+        """Test a channel listed twice is only subscribed once."""
+        parts = partition(["a", "a", "b"], 2)
+
+        assert sorted(name for part in parts for name in part) == ["a", "b"]
+
+
+@pytest.fixture
+def offline_config(config: ReverbConfig) -> ReverbConfig:
+    """Config pointing at a port nothing listens on; workers keep retrying."""
+    config.port = 1
+    return config
+
+
+def _wait_until(condition, timeout: float = 10.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestSupervisor:
+    """Tests for the Supervisor class."""
+
+    def test_empty_partitions_get_no_worker(self, offline_config: ReverbConfig) -> None:
+        """Test a worker is only created for partitions with channels."""
+        supervisor = Supervisor(["only-one"], workers=4, config=offline_config)
+
+        assert supervisor.partitions == [["only-one"]]
+
+    def test_dead_worker_is_restarted(self, offline_config: ReverbConfig) -> None:
+        """Test a worker that dies is replaced by a new process."""
+        supervisor = Supervisor(
+            [f"device.{i}" for i in range(20)],
+            workers=2,
+            config=offline_config,
+            restart_delay_min=0.0,
+        )
+        supervisor.start()
+        try:
+            worker = supervisor._workers[0]
+            old = worker.process
+            assert old is not None
+            old.kill()
+            old.join()
+
+            assert supervisor.poll() == [0]
+            assert worker.process is not old
+            assert worker.process is not None and worker.process.is_alive()
+            assert supervisor.metrics.snapshot()["supervisor_restarts_total"] == 1
+        finally:
+            supervisor.stop()
+
+    def test_hung_worker_is_restarted(self, offline_config: ReverbConfig) -> None:
+        """Test a worker with a stale heartbeat is killed and replaced."""
+        supervisor = Supervisor(
+            ["a", "b"],
+            workers=1,
+            config=offline_config,
+            heartbeat_timeout=5.0,
+            restart_delay_min=0.0,
+        )
+        supervisor.start()
+        try:
+            worker = supervisor._workers[0]
+            old = worker.process
+            # Wait for the first real heartbeat, then make it look stale
+            assert _wait_until(lambda: time.monotonic() - worker.heartbeat.value < 0.5)
+            with worker.heartbeat.get_lock():
+                worker.heartbeat.value = 0.0
+
+            assert supervisor.poll() == [0]
+            assert old is not None and not old.is_alive()
+        finally:
+            supervisor.stop()
+
+    def test_workers_may_start_processes(self, offline_config: ReverbConfig) -> None:
+        """Test workers are not daemonic, so process-pool handlers can run in them."""
+        supervisor = Supervisor(["a"], workers=1, config=offline_config)
+        supervisor.start()
+        try:
+            process = supervisor._workers[0].process
+            assert process is not None and not process.daemon
+        finally:
+            supervisor.stop()
+
+    def test_stop_ends_workers(self, offline_config: ReverbConfig) -> None:
+        """Test stop() makes the workers exit."""
+        supervisor = Supervisor(["a", "b", "c"], workers=2, config=offline_config)
+        supervisor.start()
+        processes = [w.process for w in supervisor._workers]
+
+        supervisor.stop()
+
+        assert all(p is not None and p.exitcode == 0 for p in processes)
+        assert supervisor.metrics.snapshot()["supervisor_workers_alive"] == 0
@@ -0,0 +1,112 @@
+"""Tests for tracing hooks and library logging."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import pytest
+
+from reverb.client import ReverbClient
+from reverb.config import ReverbConfig
+from reverb.connection import Connection, ConnectionState
+from reverb.messages import Message
+from reverb.tracing import TraceHooks
+
+from .test_connection import _attach_socket, _create_connection, _drain
+
+
+class TestTraceHooks:
+    """Tests for on_frame_in, on_frame_out and on_dispatch."""
+
+    async def test_hooks_see_frames_and_dispatch(self, config: ReverbConfig) -> None:
+        """Test each hook is called with the message and its frame or duration."""
+        seen: list[tuple[str, object]] = []
+        dispatched = asyncio.Event()
+
+        def on_dispatch(message: Message, elapsed: float) -> None:
+            seen.append(("dispatch", message.event))
+            dispatched.set()
+
+        conn = _create_connection(config)
+        conn.trace = TraceHooks(
+            on_frame_in=lambda message, raw: seen.append(("in", raw)),
+            on_frame_out=lambda message, frame: seen.append(("out", message.event)),
+            on_dispatch=on_dispatch,
+        )
+        conn._running = True
+        conn._set_state(ConnectionState.CONNECTED)
+        conn._start_workers()
+        ws = _attach_socket(conn)
+        frame = b'{"event":"status","channel":"c","data":"{}"}'
+        ws.incoming.put_nowait(frame)
+
+        receiving = asyncio.create_task(conn._receive_loop())
+        await asyncio.wait_for(dispatched.wait(), timeout=1.0)
+        await conn.send(Message(event="client-ack", channel="c"))
+        await _drain(conn)
+        receiving.cancel()
+        await conn._stop_workers()
+
+        assert seen == [("in", frame), ("dispatch", "status"), ("out", "client-ack")]
+
+    async def test_failing_hook_is_contained(
+        self, config: ReverbConfig, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test an exception in a hook is logged and the message still dispatched."""
+        handled: list[str] = []
+
+        async def handler(message: Message) -> None:
+            handled.append(message.event)
+
+        def broken(message: Message, elapsed: float) -> None:
+            raise RuntimeError("boom")
+
+        conn = _create_connection(config)
+        conn._on_message = handler
+        conn.trace = TraceHooks(on_dispatch=broken)
+
+        await conn._dispatch_message(Message(event="status"))
+
+        assert handled == ["status"]
+        assert "Tracing hook failed" in caplog.text
+
+    def test_client_passes_hooks_to_connection(self, config: ReverbConfig) -> None:
+        """Test the client's trace property reads and replaces the connection's hooks."""
+        hooks = TraceHooks()
+        client = ReverbClient(config=config, trace=hooks)
+
+        assert client._connection.trace is hooks
+        client.trace = None
+        assert client._connection.trace is None
+
+
+class TestLogging:
+    """Tests for the library's logging behaviour."""
+
+    def test_client_leaves_root_logger_alone(self, config: ReverbConfig) -> None:
+        """Test creating a client configures only the 'reverb' logger."""
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        level = root.level
+
+        ReverbClient(config=config.model_copy(update={"log_level": "WARNING"}))
+
+        assert root.handlers == handlers
+        assert root.level == level
+        assert logging.getLogger("reverb").level == logging.WARNING
+
+    async def test_debug_message_not_formatted_above_debug(self, config: ReverbConfig) -> None:
+        """Test the receive path does not build debug strings when DEBUG is off."""
+
+        class Loud:
+            def __str__(self) -> str:
+                raise AssertionError("formatted")
+
+        logging.getLogger("reverb").setLevel(logging.INFO)
+        conn: Connection = _create_connection(config)
+        conn._start_workers()
+
+        loud = Message(event="status", channel=Loud())  # type: ignore[arg-type]
+        await conn._handle_message(loud)
+        await conn._stop_workers()